@@ -1,13 +1,10 @@
-from PyQt5.QtWidgets import QApplication
+import time
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
-from PyQt5.QtMultimedia import QSound
-from utils import PlayerType, resize_and_show_normal, resource_path
+from utils import PlayerType, resize_and_show_normal
 from models.game_state import GameState
+from controllers.sound_service import WINNING_SOUND, LOSING_SOUND, INVALID_MOVE_SOUND
 from logger import get_logger
 
-WINNING_SOUND_PATH = resource_path('resources/sounds/winning.wav')
-LOSING_SOUND_PATH = resource_path('resources/sounds/losing.wav')
-INVALID_MOVE_SOUND_PATH = resource_path('resources/sounds/invalid_move.wav')
 MILLISECONDS_IN_SECOND = 1000
 
 class GameController(QObject):
@@ -18,22 +15,26 @@ class GameController(QObject):
 
     back_to_settings_singal = pyqtSignal()
 
-    def __init__(self, game_state, view):
+    def __init__(self, game_state, view, sound_service, telemetry):
         """
         Initializes the GameController with the provided game state and view.
 
         Args:
             game_state (GameState): The current state of the game.
             view (QWidget): The view associated with the game.
-            is_edit_mode (bool): Whether the game is in edit mode.
+            sound_service (SoundService): The service that plays the game's sound effects.
+            telemetry (MoveTelemetry): The sink of the per-move records.
         """
         super().__init__()
         self._logger = get_logger(self.__class__.__name__)
         self._game_state = game_state
         self._view = view
+        self._sound_service = sound_service
+        self._telemetry = telemetry
+        self._turn_start_time = None
+        self._think_time = None
         self._signal_connected = False
         self._abort_game = False
-        self._init_sounds()
         self._setup_connections()
         if self._game_state.is_edit_mode:
             self._init_edit_mode()
@@ -107,21 +108,6 @@ class GameController(QObject):
         self._logger.debug("Exit full screen")
         resize_and_show_normal(self._view)
 
-    def _init_sounds(self):
-        """
-        Initializes the sound effects for the game.
-        Logs an error if there is an issue initializing the sounds.
-        """
-        try:
-            self._winning_sound = QSound(WINNING_SOUND_PATH)
-            self._losing_sound = QSound(LOSING_SOUND_PATH)
-            self._invalid_move_sound = QSound(INVALID_MOVE_SOUND_PATH)
-        except Exception as e:
-            self._logger.error(f"Error initializing sounds: {e}")
-            self._winning_sound = None
-            self._losing_sound = None
-            self._invalid_move_sound = None
-
     def piece_was_chosen(self, pressed_cell, cells_to_reset, available_cells):
         """
         Handles the signal when a piece is chosen by the player.
@@ -146,8 +132,9 @@ class GameController(QObject):
             player_type (PlayerType): The type of player making the move.
             is_undo_move (bool): Whether the move is an undo operation.
         """
-        self._logger.debug(f"{self._game_state.current_player_name} makes the move from {move['from']} to {move['to']}")
-        QApplication.processEvents()
+        self._logger.debug("%s makes the move from %s to %s", self._game_state.current_player_name, move['from'], move['to'])
+        if self._turn_start_time is not None and not is_undo_move:
+            self._think_time = time.perf_counter() - self._turn_start_time
         QTimer.singleShot(int(move['waiting_time'] * MILLISECONDS_IN_SECOND), lambda: self._continue_after_delay(move, player_type, is_undo_move))
         
     def _setup_connections(self):
@@ -159,7 +146,7 @@ class GameController(QObject):
         self._view.b_key_was_pressed_signal.connect(self.undo_last_move)
         self._view.p_key_was_pressed_signal.connect(self.pause_game)
         self._view.back_was_pressed_signal.connect(self.back_to_settings)
-        self._game_state.invalid_move_signal.connect(lambda: self._invalid_move_sound.play())
+        self._game_state.invalid_move_signal.connect(lambda: self._sound_service.play(INVALID_MOVE_SOUND))
         self._game_state.piece_was_chosen_signal.connect(self.piece_was_chosen)
         self._game_state.player_finish_move_signal.connect(self.execute_move)
 
@@ -181,6 +168,8 @@ class GameController(QObject):
         either human or AI.
         """
         player_type = self._game_state.current_player_type
+        self._turn_start_time = time.perf_counter()
+        self._think_time = None
         if player_type is PlayerType.HUMAN:
             self._view.player_click_signal.connect(self._handle_move_from_player)
             self._signal_connected = True
@@ -227,7 +216,7 @@ class GameController(QObject):
             col (int): The column of the cell that was clicked.
         """
         state = self._game_state
-        self._logger.debug(f"{state.current_player_name} pressed on cell ({row},{col})")
+        self._logger.debug("%s pressed on cell (%d,%d)", state.current_player_name, row, col)
         state.check_move_validity(row, col)
 
     def _continue_after_delay(self, move, player_type, is_undo_move):
@@ -243,17 +232,39 @@ class GameController(QObject):
         if self._should_abort_move(player_type, is_undo_move):
             return
 
+        player = state.current_player
+        apply_start = time.perf_counter()
         self._apply_and_update_move(move, player_type, is_undo_move)
+        ui_apply_time = time.perf_counter() - apply_start
+        if not is_undo_move:
+            self._record_move_telemetry(player, ui_apply_time)
 
-        # Force pending paints now
-        self._view.repaint()
-        QApplication.processEvents()
-        
         if not state.is_game_in_progress:
             return
 
         self._move_finished(move)
 
+    def _record_move_telemetry(self, player, ui_apply_time):
+        """
+        Records the measurements of a move that was just applied.
+
+        Args:
+            player (Player): The player who made the move.
+            ui_apply_time (float): The time it took to apply the move to the state and the view, in seconds.
+        """
+        is_ai = player.player_type is PlayerType.AI
+        engine_stats = dict(player.last_move_stats) if is_ai else {}
+        think_time = engine_stats.pop("think_time", self._think_time)
+        self._telemetry.record_move(
+            game_number=self._game_state.game_number,
+            move_number=player.move_number,
+            player_type=player.player_type.name,
+            difficulty=player.difficulty if is_ai else None,
+            think_time=think_time,
+            ui_apply_time=ui_apply_time,
+            **engine_stats
+        )
+
     def _move_finished(self, move=None):
         if not self._abort_game:
             if self._game_state.check_for_winner(move):
@@ -283,7 +294,7 @@ class GameController(QObject):
         Handles the actions to be taken when a winner is found.
         Displays the winning message and plays the winning sound.
         """
-        self._logger.debug(f"We Have a Winner!!! {self._game_state.next_player_name} Wins!")
+        self._logger.debug("We Have a Winner!!! %s Wins!", self._game_state.next_player_name)
         self._view.display_winning_text(self._game_state.next_player_name)
         self._play_end_game_sound()
 
@@ -298,9 +309,9 @@ class GameController(QObject):
         """
         state = self._game_state
         if state.is_human_vs_computer() and state.next_player_type is PlayerType.AI:
-            self._losing_sound.play()
+            self._sound_service.play(LOSING_SOUND)
         else:
-            self._winning_sound.play()
+            self._sound_service.play(WINNING_SOUND)
 
     def _apply_and_update_move(self, move, player_type, is_undo_move):
         """
@@ -58,7 +58,7 @@ class SettingsController(QObject):
         Args:
             number (int): The number of real players.
         """
-        self._logger.debug(f"Number of real players changed to {number}")
+        self._logger.debug("Number of real players changed to %s", number)
         self._model.set_setting("num_human_players", int(number))
 
     def set_difficulty(self, difficulty, idx):
@@ -70,9 +70,9 @@ class SettingsController(QObject):
             idx (int): The index of the player (0 for the first player, 1 for the second).
         """
         if idx == 0:
-            self._logger.debug(f"Difficulty changed to {difficulty}")
+            self._logger.debug("Difficulty changed to %s", difficulty)
         else:
-            self._logger.debug(f"Difficulty of the second player changed to {difficulty}")
+            self._logger.debug("Difficulty of the second player changed to %s", difficulty)
 
         difficulty_settings = self._model.get_setting('difficulty')
         difficulty_settings[idx] = difficulty
@@ -86,7 +86,7 @@ class SettingsController(QObject):
             start (str): A string indicating whether the player wants to start ("Yes" or "No").
         """
         is_starting = start == "Yes"
-        self._logger.debug(f"Player changed the 'want to start' option to {is_starting}")
+        self._logger.debug("Player changed the 'want to start' option to %s", is_starting)
         self._model.set_setting("is_starting", is_starting)
 
     def set_name(self, new_name, idx):
@@ -98,11 +98,31 @@ class SettingsController(QObject):
             idx (int): The index of the player (0 for the first player, 1 for the second).
         """
         position = "First" if idx == 0 else "Second"
-        self._logger.debug(f"{position} player name changed to {new_name}")
+        self._logger.debug("%s player name changed to %s", position, new_name)
         names_settings = self._model.get_setting('names')
         names_settings[idx] = new_name
         self._model.set_setting('names', names_settings)
 
+    def set_board_size(self, size):
+        """
+        Updates the size of the board in the settings model.
+
+        Args:
+            size (str): The number of rows (and columns) of the board.
+        """
+        self._logger.debug("Board size changed to %s", size)
+        self._model.set_setting('board_size', int(size))
+
+    def set_win_condition(self, length):
+        """
+        Updates the number of pieces in a row needed to win in the settings model.
+
+        Args:
+            length (str): The number of pieces in a row needed to win.
+        """
+        self._logger.debug("Win condition changed to %s in a row", length)
+        self._model.set_setting('win_condition', int(length))
+
     def set_edit_mode(self):
         edit_mode = self._model.get_setting('is_edit_mode')
         self._model.set_setting('is_edit_mode', not edit_mode)
@@ -117,4 +137,6 @@ class SettingsController(QObject):
         self._view.difficulty_changed.connect(self.set_difficulty)
         self._view.name_changed.connect(self.set_name)
         self._view.starting_player_changed.connect(self.set_is_starting)
+        self._view.board_size_changed.connect(self.set_board_size)
+        self._view.win_condition_changed.connect(self.set_win_condition)
         self._view.play_clicked.connect(self.start_game)
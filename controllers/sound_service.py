@@ -0,0 +1,89 @@
+from PyQt5.QtCore import QUrl
+from PyQt5.QtMultimedia import QSoundEffect
+from utils import resource_path
+from logger import get_logger
+
+WINNING_SOUND = 'winning'
+LOSING_SOUND = 'losing'
+INVALID_MOVE_SOUND = 'invalid_move'
+
+GAME_SOUND_PATHS = {
+    WINNING_SOUND: resource_path('resources/sounds/winning.wav'),
+    LOSING_SOUND: resource_path('resources/sounds/losing.wav'),
+    INVALID_MOVE_SOUND: resource_path('resources/sounds/invalid_move.wav'),
+}
+
+# Number of effects loaded per sound, i.e. how many plays of it can overlap
+VOICES_PER_SOUND = 2
+
+class SoundService:
+    """
+    Plays the game's sound effects. Every sound is decoded once into memory when the
+    service is created, and a few voices are kept per sound so that quick repeats overlap
+    instead of cutting each other off. A disabled service loads nothing and ignores play
+    requests, for headless or benchmark runs.
+    """
+
+    def __init__(self, sound_paths=GAME_SOUND_PATHS, enabled=True):
+        """
+        Initializes the SoundService, preloading the sounds if it is enabled.
+
+        Args:
+            sound_paths (dict): The path of the WAV file of every sound, by name.
+            enabled (bool): Whether sounds are played at all.
+        """
+        self._logger = get_logger(self.__class__.__name__)
+        self._enabled = enabled
+        self._voices = {}
+        self._next_voice = {}
+        if enabled:
+            for name, path in sound_paths.items():
+                self._load(name, path)
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def play(self, name):
+        """
+        Plays a sound on a voice that is not busy, or on the least recently started one.
+
+        Args:
+            name (str): The name of the sound.
+        """
+        if not self._enabled:
+            return
+        voices = self._voices.get(name)
+        if not voices:
+            return
+
+        first_voice = self._next_voice[name]
+        voice_idx = first_voice
+        for offset in range(len(voices)):
+            candidate = (first_voice + offset) % len(voices)
+            if not voices[candidate].isPlaying():
+                voice_idx = candidate
+                break
+        self._next_voice[name] = (voice_idx + 1) % len(voices)
+        voices[voice_idx].play()
+
+    def _load(self, name, path):
+        """
+        Creates the voices of a sound. QSoundEffect decodes the file in the background
+        as soon as its source is set.
+
+        Args:
+            name (str): The name of the sound.
+            path (str): The path to the WAV file.
+        """
+        try:
+            voices = []
+            for _ in range(VOICES_PER_SOUND):
+                effect = QSoundEffect()
+                effect.setSource(QUrl.fromLocalFile(path))
+                voices.append(effect)
+        except Exception as e:
+            self._logger.error("Error initializing sound %s: %s", path, e)
+            return
+        self._voices[name] = voices
+        self._next_voice[name] = 0
@@ -1,38 +1,62 @@
+import time
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent, QTimer
 from controllers.welcome_controller import WelcomeController
 from controllers.settings_controller import SettingsController
 from controllers.game_controller import GameController
+from controllers.sound_service import SoundService
+from telemetry import MoveTelemetry
 from views.welcome_view import WelcomeWindow
 from views.settings_view import SettingsWindow
-from views.game_view import GameWindow
+from views.game_view import GameWindow, GAME_BACKGROUND_IMAGE_PATH
+from views.pixmap_cache import get_pixmap_cache, PIECE_IMAGE_PATHS
 from models.settings_model import SettingsModel
 from models.game_state import GameState
+from utils import get_background_pixmap
 from logger import get_logger
 
-class GameManager:
+class GameManager(QObject):
     """
     Manages the overall flow of the game, including initializing models, views, 
     and controllers, and handling transitions between different game states.
+
+    Only the welcome screen is built before the event loop starts. The settings window
+    and the images used later are prepared once the welcome screen has been painted,
+    and the game window is built when a game starts.
     """
 
-    def __init__(self):
+    def __init__(self, board_renderer='widgets', start_time=None, sound_enabled=True):
         """
         Initializes the GameManager by setting up the application, models, views, and controllers.
+
+        Args:
+            board_renderer (str): The board implementation to use, 'widgets' or 'painter'.
+            start_time (float, optional): The time.perf_counter() value at process start,
+                used to report the time to first paint. Defaults to now.
+            sound_enabled (bool): Whether the game plays sound effects.
         """
+        super().__init__()
+        self._start_time = start_time if start_time is not None else time.perf_counter()
         self._app = QApplication([])
         self._logger = get_logger(self.__class__.__name__)
 
         # Models
         self._settings_model = SettingsModel()
+        self._settings_model.set_setting('board_renderer', board_renderer)
+        self._settings_model.set_setting('sound_enabled', sound_enabled)
 
         # Views
         self._welcome_view = WelcomeWindow()
-        self._settings_view = SettingsWindow()
+        self._settings_view = None
 
         # Controllers
-        self._settings_controller = SettingsController(self._settings_model, self._settings_view)
+        self._settings_controller = None
         self._welcome_controller = WelcomeController(self._welcome_view)
 
+        # Services
+        self._sound_service = None
+        self._telemetry = MoveTelemetry(self._settings_model.get_setting('telemetry_path'))
+
         self._game_controller = None
         self._game_state = None
         self._game_view = None
@@ -46,10 +70,17 @@ class GameManager:
         """
         self._logger.debug("Starting the Game!")
         self._game_state = GameState(self._settings_model)
-        self._game_view = GameWindow(self._game_state.players, self._game_state.game_number, self._game_state.board)
-        self._game_controller = GameController(self._game_state, self._game_view)
+        self._game_view = GameWindow(
+            self._game_state.players,
+            self._game_state.game_number,
+            self._game_state.board,
+            self._settings_model.get_setting('board_renderer')
+        )
+        self._game_controller = GameController(
+            self._game_state, self._game_view, self._get_sound_service(), self._telemetry
+        )
         self._game_controller.back_to_settings_singal.connect(self.show_settings)
-        self._settings_controller.hide_screen()
+        self._get_settings_controller().hide_screen()
         self._game_controller.show_full_screen()
 
     def show_settings(self):
@@ -61,19 +92,75 @@ class GameManager:
             self._game_controller.hide_screen()
             self._game_controller.back_to_settings_singal.disconnect(self.show_settings)
         self._welcome_controller.hide_screen()
-        self._settings_controller.show_full_screen()
+        self._get_settings_controller().show_full_screen()
 
     def load_game(self):
         """
         Loads and starts the game by showing the welcome view and starting the application's event loop.
         """
         self._logger.debug("Game Starts!")
+        self._welcome_view.installEventFilter(self)
         self._welcome_controller.show_full_screen()
         self._app.exec_()
 
+    def eventFilter(self, obj, event):
+        """
+        Watches for the first paint of the welcome screen to report the startup time and
+        start preparing the rest of the application.
+
+        Args:
+            obj (QObject): The object the event is sent to.
+            event (QEvent): The event being sent.
+
+        Returns:
+            bool: Always False, so the event is delivered normally.
+        """
+        if obj is self._welcome_view and event.type() == QEvent.Paint:
+            self._welcome_view.removeEventFilter(self)
+            self._logger.info("Time to first paint: %.3fs", time.perf_counter() - self._start_time)
+            QTimer.singleShot(0, self._prewarm)
+        return super().eventFilter(obj, event)
+
+    def _prewarm(self):
+        """
+        Builds the settings window, decodes the images needed later and preloads the sounds,
+        in idle time after the welcome screen is up.
+        """
+        start = time.perf_counter()
+        self._get_settings_controller()
+        self._get_sound_service()
+        get_background_pixmap(GAME_BACKGROUND_IMAGE_PATH)
+        pixmap_cache = get_pixmap_cache()
+        for piece_path in PIECE_IMAGE_PATHS.values():
+            pixmap_cache.get_source(piece_path)
+        self._logger.debug("Prewarmed settings window, images and sounds in %.3fs", time.perf_counter() - start)
+
+    def _get_sound_service(self):
+        """
+        Returns the sound service, preloading the sounds on first use.
+
+        Returns:
+            SoundService: The sound service.
+        """
+        if self._sound_service is None:
+            self._sound_service = SoundService(enabled=self._settings_model.get_setting('sound_enabled'))
+        return self._sound_service
+
+    def _get_settings_controller(self):
+        """
+        Returns the settings controller, building the settings window on first use.
+
+        Returns:
+            SettingsController: The settings controller.
+        """
+        if self._settings_controller is None:
+            self._settings_view = SettingsWindow()
+            self._settings_controller = SettingsController(self._settings_model, self._settings_view)
+            self._settings_controller.start_game_signal.connect(self.start_game)
+        return self._settings_controller
+
     def _setup_connections(self):
         """
         Sets up the connections between controllers and their respective signals.
         """
         self._welcome_controller.request_settings_view_signal.connect(self.show_settings)
-        self._settings_controller.start_game_signal.connect(self.start_game)
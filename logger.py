@@ -1,28 +1,108 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 
+LOG_FORMAT = '%(asctime)s - %(levelname)-8s - %(name)-20s - %(message)s'
+LOG_DATE_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+LOG_FILE_PATH = '4Queens.log'
+
+# Levels of individual subsystems, applied on top of the global level
+SUBSYSTEM_LOG_LEVELS = {
+    # The Hard AI logs from inside its search, so it stays quiet unless QUEENS_LOG_LEVELS
+    # turns it up; its per-move profiling table is only built at DEBUG
+    'AiPlayerHard': logging.WARNING,
+}
+
+# Environment variable overriding subsystem levels, e.g. "AiPlayerHard=DEBUG,GameState=WARNING"
+LOG_LEVELS_ENV_VAR = 'QUEENS_LOG_LEVELS'
+
+_queue_listener = None
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that enqueues records as they are. The stock handler formats each
+    record before queueing it; this one leaves all formatting to the QueueListener's
+    handlers, off the thread that logged the record.
+    """
+
+    def prepare(self, record):
+        return record
+
 def setup_logger():
     """
-    Configures the logging settings for the application. The logging behavior 
-    is adjusted based on whether the application is running as a PyInstaller 
+    Configures the logging settings for the application. The logging behavior
+    is adjusted based on whether the application is running as a PyInstaller
     bundle or in a standard Python environment.
+
+    Records are put on a queue by the calling thread and formatted and written
+    out by a background QueueListener, so logging never waits for formatting or
+    file I/O.
     """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
     if getattr(sys, 'frozen', False):
         # The application is running as a PyInstaller bundle
-        logging.basicConfig(
-            level=logging.CRITICAL,
-            format='%(asctime)s - %(levelname)-8s - %(name)-20s - %(message)s',
-            datefmt='%m/%d/%Y %I:%M:%S %p'
-        )
+        level = logging.CRITICAL
+        handler = logging.StreamHandler()
     else:
         # The application is running in a normal Python environment
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)-8s - %(name)-20s - %(message)s',
-            datefmt='%m/%d/%Y %I:%M:%S %p',
-            filename='4Queens.log',
-            filemode='w'
-        )
+        level = logging.DEBUG
+        handler = logging.FileHandler(LOG_FILE_PATH, mode='w')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(RecordQueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(stop_logger)
+
+    set_log_levels(SUBSYSTEM_LOG_LEVELS)
+    set_log_levels(_parse_log_levels(os.environ.get(LOG_LEVELS_ENV_VAR, '')))
+
+def stop_logger():
+    """
+    Writes out the queued records and stops the background logging thread.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+def set_log_levels(levels):
+    """
+    Sets the level of individual loggers.
+
+    Args:
+        levels (dict): Logger names mapped to logging levels (ints or level names).
+    """
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+def _parse_log_levels(spec):
+    """
+    Parses a "name=LEVEL,name=LEVEL" specification, ignoring malformed entries.
+
+    Args:
+        spec (str): The specification.
+
+    Returns:
+        dict: Logger names mapped to level names.
+    """
+    levels = {}
+    for entry in spec.split(','):
+        name, _, level = entry.partition('=')
+        name, level = name.strip(), level.strip().upper()
+        if name and isinstance(logging.getLevelName(level), int):
+            levels[name] = level
+    return levels
 
 def get_logger(name):
     """
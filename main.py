@@ -1,10 +1,20 @@
+import time
+START_TIME = time.perf_counter()
+
 import sys
 from logger import setup_logger
 from game_manager import GameManager
 
+# Command line flag that selects the single-widget painted board
+PAINTED_BOARD_ARG = '--painted-board'
+# Command line flag that turns off all sound effects
+NO_SOUND_ARG = '--no-sound'
+
 def main():
     setup_logger()
-    all_queens = GameManager()
+    board_renderer = 'painter' if PAINTED_BOARD_ARG in sys.argv[1:] else 'widgets'
+    sound_enabled = NO_SOUND_ARG not in sys.argv[1:]
+    all_queens = GameManager(board_renderer, START_TIME, sound_enabled)
     all_queens.load_game()    
     sys.exit()
 
@@ -0,0 +1,146 @@
+from utils import PieceType
+
+class BoardRow:
+    """
+    A read-only view of a single board row, so that existing `board[row][col]` call sites
+    keep working on top of the bitboard representation.
+    """
+
+    __slots__ = ('_board', '_row')
+
+    def __init__(self, board, row):
+        self._board = board
+        self._row = row
+
+    def __getitem__(self, col):
+        return self._board.get_piece(self._row, col)
+
+    def __len__(self):
+        return self._board.size
+
+    def __iter__(self):
+        for col in range(self._board.size):
+            yield self._board.get_piece(self._row, col)
+
+class Board:
+    """
+    The Board class holds the pieces of a game as two bitmasks, one per piece type. Square `row * size + col` maps to bit `1 << (row * size + col)`, which is the
+    numbering used by the AI engines, so they can take the bitboards as they are.
+
+    Attributes:
+        size (int): The number of rows (and columns) of the board.
+        white_bits (int): The bitmask of the white pieces.
+        black_bits (int): The bitmask of the black pieces.
+    """
+
+    __slots__ = ('_size', '_white_bits', '_black_bits')
+
+    def __init__(self, size):
+        """
+        Initializes an empty Board.
+
+        Args:
+            size (int): The number of rows (and columns) of the board.
+        """
+        self._size = size
+        self._white_bits = 0
+        self._black_bits = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        """
+        Returns a row view for `board[row]`, or the piece type for `board[row, col]`.
+        """
+        if isinstance(key, tuple):
+            return self.get_piece(*key)
+        return BoardRow(self, key)
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield BoardRow(self, row)
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def white_bits(self):
+        return self._white_bits
+
+    @property
+    def black_bits(self):
+        return self._black_bits
+
+    @property
+    def occupied_bits(self):
+        return self._white_bits | self._black_bits
+
+    def get_bits(self, piece_type):
+        """
+        Returns the bitmask of the given piece type.
+
+        Args:
+            piece_type (PieceType): WHITE or BLACK.
+
+        Returns:
+            int: The bitmask of the pieces of that type.
+        """
+        return self._white_bits if piece_type is PieceType.WHITE else self._black_bits
+
+    def get_piece(self, row, col):
+        """
+        Returns the type of the piece on a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            PieceType: The piece on the cell, or PieceType.EMPTY.
+        """
+        bit = 1 << (row * self._size + col)
+        if self._white_bits & bit:
+            return PieceType.WHITE
+        if self._black_bits & bit:
+            return PieceType.BLACK
+        return PieceType.EMPTY
+
+    def set_piece(self, row, col, piece_type):
+        """
+        Places a piece type on a cell, replacing whatever was there.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            piece_type (PieceType): The new content of the cell.
+        """
+        bit = 1 << (row * self._size + col)
+        self._white_bits &= ~bit
+        self._black_bits &= ~bit
+        if piece_type is PieceType.WHITE:
+            self._white_bits |= bit
+        elif piece_type is PieceType.BLACK:
+            self._black_bits |= bit
+
+    def move_piece(self, from_pos, to_pos):
+        """
+        Moves the piece on `from_pos` to the empty cell `to_pos`.
+
+        Args:
+            from_pos (tuple): The current cell of the piece as (row, col).
+            to_pos (tuple): The target cell as (row, col).
+
+        Returns:
+            PieceType: The type of the moved piece.
+        """
+        from_bit = 1 << (from_pos[0] * self._size + from_pos[1])
+        move_bits = from_bit | (1 << (to_pos[0] * self._size + to_pos[1]))
+        if self._white_bits & from_bit:
+            self._white_bits ^= move_bits
+            return PieceType.WHITE
+        if self._black_bits & from_bit:
+            self._black_bits ^= move_bits
+            return PieceType.BLACK
+        return PieceType.EMPTY
@@ -0,0 +1,126 @@
+from models.geometry import get_geometry
+from utils import WIN_CONDITION
+
+class BoundedCache(dict):
+    """
+    A dictionary that belongs to an Engine and keeps the engine's running entry count:
+    storing a new key counts it, after making room when the engine is full, and clearing
+    the dictionary takes its entries off. Reads are plain dictionary reads.
+    """
+
+    __slots__ = ('_engine',)
+
+    def __init__(self, engine):
+        super().__init__()
+        self._engine = engine
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            engine = self._engine
+            if engine.cache_size >= engine.max_cache_entries:
+                engine.make_room()
+            engine.cache_size += 1
+        dict.__setitem__(self, key, value)
+
+    def clear(self):
+        self._engine.cache_size -= len(self)
+        dict.clear(self)
+
+class Engine:
+    """
+    The search state that AI players can share: the geometry tables of the board and the
+    caches of facts computed about positions (evaluations, move lists and tactical results)
+    together with the transposition table.
+
+    Every cached result is a function of the two bitmasks it is keyed by, with the side to
+    move first, so it holds for whichever player reaches that position. Players that share
+    an engine reuse each other's work, and the caches survive from move to move. The four
+    tables share one budget of `max_cache_entries`, enforced whenever an entry is stored,
+    so even a single long search cannot grow them past it. Making room drops the cheapest
+    tables to rebuild first, so a running search keeps its transposition table.
+
+    Attributes:
+        win_condition (int): The number of pieces in a row needed to win.
+        max_cache_entries (int): The most entries the four tables may hold between them.
+        cache_size (int): The number of entries the four tables hold.
+        geometry (BoardGeometry): The tables of the current board, or None before the first move.
+        eval_cache (BoundedCache): Static evaluations by position.
+        move_cache (BoundedCache): Slide destinations by occupancy and square.
+        tactical_cache (BoundedCache): Winning moves, blocks, threats and legal moves by position.
+        transposition_table (BoundedCache): Search results by position and depth.
+    """
+
+    # The most entries the four tables may hold between them before they are dropped,
+    # about 120 MB at depth 4
+    MAX_CACHE_ENTRIES = 500_000
+
+    def __init__(self, win_condition=WIN_CONDITION, max_cache_entries=MAX_CACHE_ENTRIES):
+        """
+        Initializes an Engine object.
+
+        Args:
+            win_condition (int): The number of pieces in a row needed to win.
+            max_cache_entries (int): The memory budget of the caches, in entries.
+        """
+        self.win_condition = win_condition
+        self.max_cache_entries = max_cache_entries
+        self.geometry = None
+        self.cache_size = 0
+        self.eval_cache = BoundedCache(self)
+        self.move_cache = BoundedCache(self)
+        self.tactical_cache = BoundedCache(self)
+        self.transposition_table = BoundedCache(self)
+
+    def begin_move(self, board_size):
+        """
+        Prepares the engine for a player's move, switching the geometry and dropping the
+        caches when the board size changes.
+
+        Args:
+            board_size (int): The size of the board.
+
+        Returns:
+            BoardGeometry: The tables of the board.
+        """
+        if self.geometry is None or self.geometry.board_size != board_size:
+            self.geometry = get_geometry(board_size, self.win_condition)
+            self.clear()
+        return self.geometry
+
+    def new_transposition_table(self):
+        """
+        Empties the transposition table for a new root search and returns it. Entries are not
+        carried between searches, since win scores count plies from the root and repetition
+        draws depend on the path that reached a position.
+
+        Returns:
+            BoundedCache: The transposition table.
+        """
+        self.transposition_table.clear()
+        return self.transposition_table
+
+    def make_room(self):
+        """
+        Drops whole tables until the engine is under budget: the evaluations and slide
+        destinations first, then the tactical results, and the transposition table only
+        when it fills the budget on its own.
+        """
+        for tables in (
+            (self.eval_cache, self.move_cache),
+            (self.tactical_cache,),
+            (self.transposition_table,),
+        ):
+            for table in tables:
+                table.clear()
+            if self.cache_size < self.max_cache_entries:
+                return
+
+    def clear(self):
+        """
+        Drops every cached result. The tables are emptied in place, since the players and
+        a running search hold references to them.
+        """
+        self.eval_cache.clear()
+        self.move_cache.clear()
+        self.tactical_cache.clear()
+        self.transposition_table.clear()
@@ -1,8 +1,11 @@
 from PyQt5.QtCore import pyqtSignal, QObject
 from models.settings_model import SettingsModel
-from models.player import Player, HumanPlayer, AiPlayerEasy, AiPlayerMedium, AiPlayerHard ,get_available_cells_to_move, check_consecutive_pieces
+from models.board import Board
+from models.geometry import get_geometry
+from models.engine import Engine
+from models.player import Player, HumanPlayer, AiPlayerEasy, AiPlayerMedium, AiPlayerHard ,get_available_cells_to_move
 from logger import get_logger
-from utils import PieceType, PlayerType, WHITE_PIECE_PATH, BLACK_PIECE_PATH, WIN_CONDITION
+from utils import PieceType, PlayerType, WHITE_PIECE_PATH, BLACK_PIECE_PATH
 
 class GameState(QObject):
     """
@@ -34,6 +37,10 @@ class GameState(QObject):
             settings (SettingsModel): The settings for the game.
         """
         self._board_size = settings.get_setting('board_size')
+        self._win_condition = min(settings.get_setting('win_condition'), self._board_size)
+        self._ai_time_limit = settings.get_setting('ai_time_limit')
+        self._ai_max_nodes = settings.get_setting('ai_max_nodes')
+        self._ai_seed = settings.get_setting('ai_seed')
         self._num_human_players = settings.get_setting('num_human_players')
         self._is_edit_mode = settings.get_setting('is_edit_mode')
         self._edit_mode_params = {
@@ -51,6 +58,7 @@ class GameState(QObject):
         self._abort_last_move = 0
         self._players = [None, None]
         self._board = None
+        self._init_line_windows()
         self._init_players_settings(settings)
 
         self.start_new_game(True)
@@ -62,7 +70,7 @@ class GameState(QObject):
         if (row == -1 and col == -1) or pressed_cell is None:
             return False, pressed_cell            
 
-        target_cell_piece_type = self._board[row][col]
+        target_cell_piece_type = self._board.get_piece(row, col)
         is_valid_cell = target_cell_piece_type is PieceType.EMPTY
         if is_valid_cell:
             self._update_board(pressed_cell, (row, col))
@@ -82,7 +90,7 @@ class GameState(QObject):
         if row == -1 and col == -1:
             return False
         
-        target_cell_piece_type = self._board[row][col]
+        target_cell_piece_type = self._board.get_piece(row, col)
         is_valid_cell = target_cell_piece_type is not PieceType.EMPTY
         if is_valid_cell:
             self.pressed_cell_edit_mode = (row, col)
@@ -105,7 +113,7 @@ class GameState(QObject):
             return
 
         player_piece_type = player.piece_type
-        cell_piece_type = self._board[row][col]
+        cell_piece_type = self._board.get_piece(row, col)
         is_first_click = not player.is_from_assigned()
 
         if is_first_click:
@@ -152,10 +160,9 @@ class GameState(QObject):
         """
         is_winner = False
         if last_move is not None:
-            piece_type = self._board[last_move['to'][0]][last_move['to'][1]]
-            is_winner, _ = check_consecutive_pieces(self._board, last_move['to'], piece_type, self._board_size, WIN_CONDITION)
+            is_winner = self._is_winning_cell(last_move['to'])
         else:
-            winner_piece = self._check_winner_full_board()
+            winner_piece = self._get_winner_piece()
             if winner_piece:
                 if winner_piece is PieceType.WHITE:
                     self._switch_players()
@@ -215,7 +222,7 @@ class GameState(QObject):
         self.piece_was_chosen_signal.emit((), self._available_cells, [])
         self._available_cells = []
         if move:
-            self._logger.debug(f"Undoing Move - {move['to']} to {move['from']}")
+            self._logger.debug("Undoing Move - %s to %s", move['to'], move['from'])
             self.player_finish_move_signal.emit(move, PlayerType.AI, True)
 
     def start_new_game(self, first_game=False):
@@ -312,7 +319,7 @@ class GameState(QObject):
         Gets the current state of the game board.
 
         Returns:
-            list: The game board.
+            Board: The game board.
         """
         return self._board
 
@@ -342,6 +349,16 @@ class GameState(QObject):
         """
         self._game_number += 1
 
+    @property
+    def current_player(self):
+        """
+        Gets the player whose turn it is.
+
+        Returns:
+            Player: The current player.
+        """
+        return self._players[self._current_player_index]
+
     @property
     def current_player_type(self):
         """
@@ -430,32 +447,84 @@ class GameState(QObject):
         return self._num_human_players == 1
 
 
-    def _check_winner_full_board(self):
+    def _get_winner_piece(self):
         """
-        Checks the entire board to see if there is a winner.
         Returns the PieceType of the winner if there is one, else returns None.
+
+        When both sides have a completed line, the winner is the one a scan of the board
+        would meet first: the line whose first cell comes first row by row, reading lines
+        rightwards, downwards, down-right and up-right from that cell.
         """
-        size = self._board_size
-        board = self._board
+        geometry = self._geometry
+        anti_diagonal_step = self._board_size - 1
+        first_sq = None
+        for full_windows in self._full_windows.values():
+            for window_idx in full_windows:
+                _, sqs = geometry.line_windows[window_idx]
+                # Anti-diagonal windows are listed from their top-right end, which an up-right read reaches last
+                start_sq = sqs[-1] if sqs[1] - sqs[0] == anti_diagonal_step else sqs[0]
+                if first_sq is None or start_sq < first_sq:
+                    first_sq = start_sq
+        if first_sq is None:
+            return None
+        return self._board.get_piece(*geometry.sq_to_rc[first_sq])
 
-        # Directions: right, down, down-right, up-right
-        directions = [(0, 1), (1, 0), (1, 1), (-1, 1)]
+    def _is_winning_cell(self, cell):
+        """
+        Checks whether the piece on the given cell is part of a completed line.
 
-        for i in range(size):
-            for j in range(size):
-                current_piece = board[i][j]
-                if current_piece != PieceType.EMPTY:
-                    for dx, dy in directions:
-                        count = 1
-                        x, y = i + dx, j + dy
-
-                        while 0 <= x < size and 0 <= y < size and board[x][y] == current_piece:
-                            count += 1
-                            if count >= WIN_CONDITION:
-                                return current_piece
-                            x += dx
-                            y += dy
-        return None
+        Args:
+            cell (tuple): The cell to check as (row, col).
+
+        Returns:
+            bool: True if a line through the cell is fully occupied by its piece, False otherwise.
+        """
+        full_windows = self._full_windows.get(self._board.get_piece(*cell))
+        if not full_windows:
+            return False
+        window_indices = self._geometry.window_indices_by_sq[self._geometry.rc_to_sq[cell[0]][cell[1]]]
+        return any(window_idx in full_windows for window_idx in window_indices)
+
+    def _init_line_windows(self):
+        """
+        Fetches the shared geometry tables, whose line windows (every run of `win_condition`
+        cells in a row, column or diagonal) back the incremental win detection.
+        """
+        self._geometry = get_geometry(self._board_size, self._win_condition)
+        self._reset_window_counts()
+
+    def _reset_window_counts(self):
+        """
+        Clears the per-window piece counts of both piece types.
+        """
+        num_windows = len(self._geometry.line_windows)
+        self._window_counts = {
+            PieceType.WHITE: [0] * num_windows,
+            PieceType.BLACK: [0] * num_windows,
+        }
+        self._full_windows = {
+            PieceType.WHITE: set(),
+            PieceType.BLACK: set(),
+        }
+
+    def _update_window_counts(self, cell, piece_type, delta):
+        """
+        Adds `delta` to the piece counts of every window passing through the cell.
+
+        Args:
+            cell (tuple): The cell whose content changed.
+            piece_type (PieceType): The type of piece added to or removed from the cell.
+            delta (int): 1 when the piece is placed, -1 when it is removed.
+        """
+        counts = self._window_counts[piece_type]
+        full_windows = self._full_windows[piece_type]
+        window_indices = self._geometry.window_indices_by_sq[self._geometry.rc_to_sq[cell[0]][cell[1]]]
+        for window_idx in window_indices:
+            counts[window_idx] += delta
+            if counts[window_idx] == self._geometry.win_condition:
+                full_windows.add(window_idx)
+            else:
+                full_windows.discard(window_idx)
 
     def _init_players_settings(self, settings: SettingsModel):
         """
@@ -478,13 +547,18 @@ class GameState(QObject):
                 names[0], names[1] = names[1], names[0]
                 player_types[0], player_types[1] = player_types[1], player_types[0]
 
+        win_condition = self._win_condition
+        # One engine for the whole game, so that in AI vs AI games both sides reuse each other's caches
+        self._engine = Engine(win_condition)
+        # Each player gets its own seed, so the two sides do not draw the same random sequence
+        seeds = [None if self._ai_seed is None else self._ai_seed + idx for idx in range(len(names))]
         self._players = [
             HumanPlayer(name, player_type, difficulty, piece_type, path) if player_type == PlayerType.HUMAN
-            else AiPlayerEasy(name, player_type, difficulty, piece_type, path) if player_type == PlayerType.AI and difficulty == "Easy"
-            else AiPlayerMedium(name, player_type, difficulty, piece_type, path) if player_type == PlayerType.AI and difficulty == "Medium"
-            else AiPlayerHard(name, player_type, difficulty, piece_type, path, search_depth=4) if player_type == PlayerType.AI and difficulty == "Hard"
+            else AiPlayerEasy(name, player_type, difficulty, piece_type, path, win_condition, seed=seed) if player_type == PlayerType.AI and difficulty == "Easy"
+            else AiPlayerMedium(name, player_type, difficulty, piece_type, path, win_condition, seed=seed) if player_type == PlayerType.AI and difficulty == "Medium"
+            else AiPlayerHard(name, player_type, difficulty, piece_type, path, search_depth=4, win_condition=win_condition, time_limit=self._ai_time_limit, engine=self._engine, seed=seed, max_nodes=self._ai_max_nodes) if player_type == PlayerType.AI and difficulty == "Hard"
             else Player(name, player_type, difficulty, piece_type, path)
-            for idx, (name, player_type, difficulty, piece_type, path) in enumerate(zip(names, player_types, difficulties, piece_types, pic_paths))
+            for name, player_type, difficulty, piece_type, path, seed in zip(names, player_types, difficulties, piece_types, pic_paths, seeds)
         ]
 
     def _init_board(self):
@@ -492,31 +566,50 @@ class GameState(QObject):
         Initializes the game board with initial positions of pieces.
         """
         size = self._board_size
-        self._board = [[None for _ in range(size)] for _ in range(size)]
+        self._board = Board(size)
+        self._reset_window_counts()
         middle_index = size // 2
 
         for i in range(size):
             for j in range(size):
                 if i == 0:
                     piece_type = PieceType.BLACK if j % 2 == 0 else PieceType.WHITE
-                    self._board[i][j] = piece_type
+                    self._set_board_cell((i, j), piece_type)
                     self._players[piece_type.value].init_positions((i, j)) 
                 elif i == middle_index and j == 0:
-                    self._board[i][j] = PieceType.BLACK
+                    self._set_board_cell((i, j), PieceType.BLACK)
                     self._players[PieceType.BLACK.value].init_positions((i, j)) 
                 elif i == middle_index and j == size - 1:
-                    self._board[i][j] = PieceType.WHITE
+                    self._set_board_cell((i, j), PieceType.WHITE)
                     self._players[PieceType.WHITE.value].init_positions((i, j)) 
                 elif i == size - 1:
                     piece_type = PieceType.WHITE if j % 2 == 0 else PieceType.BLACK
-                    self._board[i][j] = piece_type
+                    self._set_board_cell((i, j), piece_type)
                     self._players[piece_type.value].init_positions((i, j))
-                else:
-                    self._board[i][j] = PieceType.EMPTY
 
     def _update_board(self, from_pos, to_pos):
-        self._board[to_pos[0]][to_pos[1]] = self._board[from_pos[0]][from_pos[1]]
-        self._board[from_pos[0]][from_pos[1]] = PieceType.EMPTY
+        piece_type = self._board.move_piece(from_pos, to_pos)
+        if piece_type is not PieceType.EMPTY:
+            self._update_window_counts(from_pos, piece_type, -1)
+            self._update_window_counts(to_pos, piece_type, 1)
+
+    def _set_board_cell(self, cell, piece_type):
+        """
+        Places a piece type on a cell, keeping the line window counts in sync.
+
+        Args:
+            cell (tuple): The cell to update as (row, col).
+            piece_type (PieceType): The new content of the cell.
+        """
+        row, col = cell
+        previous_piece_type = self._board.get_piece(row, col)
+        if previous_piece_type is piece_type:
+            return
+        if previous_piece_type is not PieceType.EMPTY:
+            self._update_window_counts(cell, previous_piece_type, -1)
+        self._board.set_piece(row, col, piece_type)
+        if piece_type is not PieceType.EMPTY:
+            self._update_window_counts(cell, piece_type, 1)
 
     def _handle_player_second_move(self, row, col, player, player_piece_type):
         """
@@ -0,0 +1,184 @@
+from utils import WIN_CONDITION
+
+# Ray directions as (row_step, col_step): right, left, down, up, top-right, bottom-left, top-left, bottom-right
+RAY_DIRECTIONS = (
+    (0, 1), (0, -1), (1, 0), (-1, 0),
+    (-1, 1), (1, -1), (-1, -1), (1, 1),
+)
+# Indices of opposite rays in RAY_DIRECTIONS: horizontal, vertical, diagonal, anti-diagonal
+AXIS_RAY_PAIRS = ((0, 1), (2, 3), (4, 5), (6, 7))
+# Line axes as (row_step, col_step), in the order of line_windows, each with the indices in
+# RAY_DIRECTIONS of its forward and backward rays
+LINE_AXES = ((0, 1), (1, 0), (1, 1), (1, -1))
+LINE_AXIS_RAYS = ((0, 1), (2, 3), (7, 6), (5, 4))
+
+_geometry_cache = {}
+
+def get_geometry(board_size, win_condition=WIN_CONDITION):
+    """
+    Returns the shared geometry tables for a board size and win length, building them on first use.
+
+    Args:
+        board_size (int): The number of rows (and columns) of the board.
+        win_condition (int): The number of pieces in a row needed to win.
+
+    Returns:
+        BoardGeometry: The process-wide tables for that configuration.
+    """
+    key = (board_size, win_condition)
+    geometry = _geometry_cache.get(key)
+    if geometry is None:
+        geometry = BoardGeometry(board_size, win_condition)
+        _geometry_cache[key] = geometry
+    return geometry
+
+class BoardGeometry:
+    """
+    Immutable lookup tables describing a square board, shared by the game state and every AI
+    engine. Squares are numbered `row * board_size + col` and all tables are flat tuples
+    indexed by square, so lookups never hash coordinates or check bounds.
+
+    Attributes:
+        board_size (int): The number of rows (and columns) of the board.
+        win_condition (int): The number of pieces in a row needed to win.
+        num_squares (int): board_size * board_size.
+        full_mask (int): A bitmask with every square set.
+        sq_to_rc (tuple): (row, col) of every square.
+        rc_to_sq (tuple): rc_to_sq[row][col] is the square of a cell.
+        rays (tuple): For every square, its eight rays (ordered as RAY_DIRECTIONS) as tuples of squares, nearest first.
+        line_windows (tuple): Every run of win_condition squares as (mask, squares).
+        windows_by_sq (tuple): For every square, (window_mask, window_mask_without_square) of the windows through it.
+        window_indices_by_sq (tuple): For every square, the indices in line_windows of the windows through it.
+        center_distance (tuple): The Manhattan distance of every square from the board's center.
+        ray_masks (tuple): For every square, the bitmask of each of its eight rays.
+        line_shifts (tuple): For every axis of LINE_AXES, (starts_mask, shifts) where starts_mask has a bit
+            for every square a window can start on and shifts are the bit offsets of the window's squares
+            from its start. Shifting a bitboard right by every offset and ANDing with starts_mask tests all
+            the windows of the axis at once, without wrapping around the board's edges.
+        line_starts_by_sq (tuple): For every square, the starts_mask of each axis restricted to the windows through it.
+        slide_shifts (tuple): For every direction of RAY_DIRECTIONS, (shift, fill_shifts, entry_mask) for sliding
+            a whole bitboard: the signed bit offset of one step (positive shifts left), the offsets of the
+            doubling steps of a Kogge-Stone fill, and the squares a step can land on without wrapping.
+    """
+
+    __slots__ = (
+        'board_size', 'win_condition', 'num_squares', 'full_mask',
+        'sq_to_rc', 'rc_to_sq', 'rays', 'line_windows', 'windows_by_sq',
+        'window_indices_by_sq', 'center_distance', 'ray_masks', 'line_shifts',
+        'line_starts_by_sq', 'slide_shifts',
+    )
+
+    def __init__(self, board_size, win_condition):
+        """
+        Builds the tables for the given board size and win length.
+
+        Args:
+            board_size (int): The number of rows (and columns) of the board.
+            win_condition (int): The number of pieces in a row needed to win.
+        """
+        self.board_size = board_size
+        self.win_condition = win_condition
+        self.num_squares = board_size * board_size
+        self.full_mask = (1 << self.num_squares) - 1
+        self.sq_to_rc = tuple((sq // board_size, sq % board_size) for sq in range(self.num_squares))
+        self.rc_to_sq = tuple(
+            tuple(r * board_size + c for c in range(board_size)) for r in range(board_size)
+        )
+        self.rays = self._build_rays()
+        self.line_windows = self._build_line_windows()
+
+        windows_by_sq = [[] for _ in range(self.num_squares)]
+        window_indices_by_sq = [[] for _ in range(self.num_squares)]
+        for window_idx, (full_mask, sqs) in enumerate(self.line_windows):
+            for sq in sqs:
+                windows_by_sq[sq].append((full_mask, full_mask & ~(1 << sq)))
+                window_indices_by_sq[sq].append(window_idx)
+        self.windows_by_sq = tuple(tuple(windows) for windows in windows_by_sq)
+        self.window_indices_by_sq = tuple(tuple(indices) for indices in window_indices_by_sq)
+
+        center = (board_size - 1) / 2.0
+        self.center_distance = tuple(abs(r - center) + abs(c - center) for r, c in self.sq_to_rc)
+
+        self.ray_masks = tuple(
+            tuple(sum(1 << ray_sq for ray_sq in ray) for ray in sq_rays) for sq_rays in self.rays
+        )
+        self.line_shifts = self._build_line_shifts()
+
+        axis_by_step = {shifts[1]: axis for axis, (_, shifts) in enumerate(self.line_shifts)}
+        line_starts_by_sq = [[0] * len(LINE_AXES) for _ in range(self.num_squares)]
+        for _, sqs in self.line_windows:
+            axis = axis_by_step[sqs[1] - sqs[0]]
+            for sq in sqs:
+                line_starts_by_sq[sq][axis] |= (1 << sqs[0])
+        self.line_starts_by_sq = tuple(tuple(starts) for starts in line_starts_by_sq)
+        self.slide_shifts = self._build_slide_shifts()
+
+    def _build_rays(self):
+        size = self.board_size
+        rays = []
+        for r, c in self.sq_to_rc:
+            piece_rays = []
+            for dr, dc in RAY_DIRECTIONS:
+                ray = []
+                rr, cc = r + dr, c + dc
+                while 0 <= rr < size and 0 <= cc < size:
+                    ray.append(rr * size + cc)
+                    rr += dr
+                    cc += dc
+                piece_rays.append(tuple(ray))
+            rays.append(tuple(piece_rays))
+        return tuple(rays)
+
+    def _build_line_windows(self):
+        size = self.board_size
+        length = self.win_condition
+        windows = []
+
+        # Rows, columns, diagonals and anti-diagonals, as (start cells, step)
+        runs = (
+            ([(r, c) for r in range(size) for c in range(size - length + 1)], (0, 1)),
+            ([(r, c) for c in range(size) for r in range(size - length + 1)], (1, 0)),
+            ([(r, c) for r in range(size - length + 1) for c in range(size - length + 1)], (1, 1)),
+            ([(r, c) for r in range(size - length + 1) for c in range(length - 1, size)], (1, -1)),
+        )
+        for starts, (dr, dc) in runs:
+            for r, c in starts:
+                sqs = tuple((r + dr * i) * size + (c + dc * i) for i in range(length))
+                mask = 0
+                for sq in sqs:
+                    mask |= (1 << sq)
+                windows.append((mask, sqs))
+
+        return tuple(windows)
+
+    def _build_line_shifts(self):
+        size = self.board_size
+        length = self.win_condition
+        line_shifts = []
+        for dr, dc in LINE_AXES:
+            step = dr * size + dc
+            starts_mask = 0
+            for r, c in self.sq_to_rc:
+                end_r, end_c = r + dr * (length - 1), c + dc * (length - 1)
+                if 0 <= end_r < size and 0 <= end_c < size:
+                    starts_mask |= (1 << (r * size + c))
+            line_shifts.append((starts_mask, tuple(step * i for i in range(length))))
+        return tuple(line_shifts)
+
+    def _build_slide_shifts(self):
+        size = self.board_size
+        slide_shifts = []
+        for dr, dc in RAY_DIRECTIONS:
+            shift = dr * size + dc
+            # A slide crosses at most size - 1 squares, so doubling steps below size cover it
+            fill_shifts = []
+            step = 1
+            while step < size:
+                fill_shifts.append(shift * step)
+                step *= 2
+            entry_mask = 0
+            for sq, (r, c) in enumerate(self.sq_to_rc):
+                if 0 <= c - dc < size:
+                    entry_mask |= (1 << sq)
+            slide_shifts.append((shift, tuple(fill_shifts), entry_mask))
+        return tuple(slide_shifts)
@@ -1,6 +1,8 @@
 from PyQt5.QtCore import pyqtSignal
 from typing import List, Tuple, Optional
 from utils import PieceType, WIN_CONDITION
+from models.geometry import get_geometry, AXIS_RAY_PAIRS, LINE_AXIS_RAYS
+from models.engine import Engine
 from logger import get_logger
 import logging
 import copy
@@ -9,216 +11,33 @@ import time
 
 AI_MOVE_WAITING_TIME = 1.5
 
-def get_pieces_that_can_move_to_target(
-    board: List[List],
-    pieces_positions: List[Tuple[int, int]],
-    target_cell: Tuple[int, int],
-    board_size: int
-) -> List[Tuple[int, int]]:
+class SearchTimeout(Exception):
     """
-    Identifies which pieces can move to the specified target cell.
-
-    Parameters:
-        - board (list of lists): The current game board.
-        - pieces_positions (list of tuples): The current positions of the player's pieces.
-        - target_cell (tuple): The target cell to move a piece to.
-        - board_size (int): The size of the game board.
-
-    Returns:
-        - list of tuples: Positions of the pieces that can move to the target cell.
-    """
-    movable_pieces = []
-    for piece_pos in pieces_positions:
-        available_moves = get_available_cells_to_move(board, piece_pos, board_size)
-        if available_moves and target_cell in available_moves:
-            movable_pieces.append(piece_pos)
-    return movable_pieces
-
-def get_all_cells_in_route(from_move, to_move):
-    """
-    Generates a list of all the cells between two coordinates on a grid, 
-    including both the start and end coordinates. The function supports 
-    horizontal, vertical, and diagonal moves.
-
-    Args:
-        from_move (tuple): A tuple (start_row, start_col) representing the starting coordinates.
-        to_move (tuple): A tuple (end_row, end_col) representing the ending coordinates.
-
-    Returns:
-        list: A list of tuples representing all the cells in the route from 
-        `to_move` to `from_move`, in reverse order (i.e., `to_move` is the 
-        first element in the list).
-    """
-    cells = []
-    start_row, start_col = from_move
-    end_row, end_col = to_move
-
-    if start_row == end_row:  # Horizontal move
-        step = 1 if start_col < end_col else -1
-        for col in range(start_col, end_col + step, step):
-            cells.append((start_row, col))
-    elif start_col == end_col:  # Vertical move
-        step = 1 if start_row < end_row else -1
-        for row in range(start_row, end_row + step, step):
-            cells.append((row, start_col))
-    elif abs(start_row - end_row) == abs(start_col - end_col):  # Diagonal move
-        row_step = 1 if start_row < end_row else -1
-        col_step = 1 if start_col < end_col else -1
-        row, col = start_row, start_col
-        while row != end_row + row_step and col != end_col + col_step:
-            cells.append((row, col))
-            row += row_step
-            col += col_step
-
-    return cells[::-1]  # Return the cells list in reverse order
-
-
-def get_available_cells_in_direction(board, piece, row_step, col_step, max_size):
-    """
-    Returns a list of available cells in the specified direction until a non-empty cell is encountered.
-
-    Args:
-        board (list): The game board.
-        piece (tuple): The starting position of the piece as a tuple (row, column).
-        row_step (int): The row step to move in the specified direction.
-        col_step (int): The column step to move in the specified direction.
-        max_size (int): The maximum size of the board.
-
-    Returns:
-        list: A list of available cells in the specified direction as tuples (row, column).
-    """
-    available_cells = []
-    row, col = piece[0], piece[1]
-    i, j = row + row_step, col + col_step
-    while 0 <= i < max_size and 0 <= j < max_size:
-        if board[i][j] is PieceType.EMPTY:
-            available_cells.append((i, j))
-            i += row_step
-            j += col_step
-        else:
-            break
-    return available_cells
-
-def check_consecutive_pieces_in_direction(board, move, piece_type, max_size, row_step, col_step):
-    """
-    Checks for consecutive pieces of a given type in a specific direction on the board, 
-    starting from the given position and moving according to the provided row and column steps.
-
-    Args:
-        board (list): A 2D list representing the game board.
-        move (tuple): The starting position on the board as a tuple (row, column).
-        piece_type (PieceType): The type of the piece to check for (e.g., white or black).
-        max_size (int): The size of the board (number of rows/columns).
-        row_step (int): The step increment for row movement (e.g., 1 for down, -1 for up, 0 for no row change).
-        col_step (int): The step increment for column movement (e.g., 1 for right, -1 for left, 0 for no column change).
-
-    Returns:
-        tuple: 
-            - int: The number of consecutive pieces of the specified type found in the given direction.
-            - list: A list of tuples representing the positions of the consecutive pieces.
-    """
-    consecutive_pieces = []
-    if row_step == 0 and col_step == 0:
-        return 0, consecutive_pieces
-
-    row, col = move[0], move[1]
-    i, j = row + row_step, col + col_step
-    while 0 <= i < max_size and 0 <= j < max_size:
-        if board[i][j] == piece_type:
-            consecutive_pieces.append((i, j))  
-            i += row_step
-            j += col_step
-        else:
-            break
-    return len(consecutive_pieces), consecutive_pieces
-
-def check_consecutive_pieces(board, move, piece_type, max_size, consecutive_needed):
-    """
-    Checks if the current move results in a consecutive sequence of the same piece type
-    in any direction (horizontal, vertical, diagonal, and anti-diagonal).
-
-    Args:
-        board (list): The game board as a 2D list.
-        move (tuple): The position of the current move as a tuple (row, column).
-        piece_type (PieceType): The type of the piece being moved.
-        max_size (int): The size of the board (number of rows/columns).
-        consecutive_needed (int): The number of consecutive pieces needed to win.
-
-    Returns:
-        tuple: (bool, list) 
-               - True and the list of winning positions if the move results in a win.
-               - False and an empty list otherwise.
+    Raised inside a search when its time or node budget runs out.
     """
-    # Helper function to combine results
-    def check_and_collect(direction_func):
-        count, positions = direction_func(board, move, piece_type, max_size)
-        return count, positions
-
-    # Check horizontal
-    consecutive_row_right, right_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, 0, 1))
-    consecutive_row_left, left_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, 0, -1))
-    total_consecutive_row = consecutive_row_right + consecutive_row_left + 1  # Include the current piece
-    if total_consecutive_row >= consecutive_needed:
-        row_positions = right_positions + [move] + left_positions
-        return True, row_positions
-
-    # Check vertical
-    consecutive_col_down, down_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, 1, 0))
-    consecutive_col_up, up_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, -1, 0))
-    total_consecutive_col = consecutive_col_down + consecutive_col_up + 1  # Include the current piece
-    if total_consecutive_col >= consecutive_needed:
-        col_positions = down_positions + [move] + up_positions
-        return True, col_positions
-
-    # Check diagonal (top-left to bottom-right)
-    consecutive_diag_top_right, top_right_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, -1, 1))
-    consecutive_diag_bottom_left, bottom_left_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, 1, -1))
-    total_consecutive_diag = consecutive_diag_top_right + consecutive_diag_bottom_left + 1  # Include the current piece
-    if total_consecutive_diag >= consecutive_needed:
-        diag_positions = top_right_positions + [move] + bottom_left_positions
-        return True, diag_positions
-
-    # Check anti-diagonal (top-right to bottom-left)
-    consecutive_anti_diag_top_left, top_left_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, -1, -1))
-    consecutive_anti_diag_bottom_right, bottom_right_positions = check_and_collect(lambda *args: check_consecutive_pieces_in_direction(*args, 1, 1))
-    total_consecutive_anti_diag = consecutive_anti_diag_top_left + consecutive_anti_diag_bottom_right + 1  # Include the current piece
-    if total_consecutive_anti_diag >= consecutive_needed:
-        anti_diag_positions = top_left_positions + [move] + bottom_right_positions
-        return True, anti_diag_positions
-
-    return False, []
-
 
 def get_available_cells_to_move(board, piece, max_size):
     """
     Gets all available cells that a piece can move to from a specific position.
 
     Args:
-        board (list): The game board as a 2D list.
+        board (Board): The game board.
         piece (tuple): The current position of the piece as a tuple (row, column).
         max_size (int): The size of the board (number of rows/columns).
 
     Returns:
-        list: A list of available cells where the piece can move, represented as tuples (row, column).
+        list: A list of available cells where the piece can move, represented as tuples (row, column),
+        ordered ray by ray (right, left, down, up, top-right, bottom-left, top-left, bottom-right).
     """
+    geometry = get_geometry(max_size)
+    occ_bits = board.occupied_bits
+    sq_to_rc = geometry.sq_to_rc
     available_cells = []
-
-    # Horizontal directions
-    available_cells.extend(get_available_cells_in_direction(board, piece, 0, 1, max_size))  # Right
-    available_cells.extend(get_available_cells_in_direction(board, piece, 0, -1, max_size))  # Left
-
-    # Vertical directions
-    available_cells.extend(get_available_cells_in_direction(board, piece, 1, 0, max_size))  # Down
-    available_cells.extend(get_available_cells_in_direction(board, piece, -1, 0, max_size))  # Up
-
-    # Diagonal directions
-    available_cells.extend(get_available_cells_in_direction(board, piece, -1, 1, max_size))  # Top-right
-    available_cells.extend(get_available_cells_in_direction(board, piece, 1, -1, max_size))  # Bottom-left
-
-    # Anti-diagonal directions
-    available_cells.extend(get_available_cells_in_direction(board, piece, -1, -1, max_size))  # Top-left
-    available_cells.extend(get_available_cells_in_direction(board, piece, 1, 1, max_size))  # Bottom-right
-
+    for ray in geometry.rays[geometry.rc_to_sq[piece[0]][piece[1]]]:
+        for sq in ray:
+            if occ_bits & (1 << sq):
+                break
+            available_cells.append(sq_to_rc[sq])
     return available_cells
 
 class Player:
@@ -236,6 +55,7 @@ class Player:
         move_num (int): The number of moves made by the player.
         positions (list): The list of positions occupied by the player's pieces.
         move (dict): The current move details, including from, to, and waiting_time.
+        last_move_stats (dict): Measurements of the last move computed by the player, for telemetry.
     """
     def __init__(self, name, player_type, difficulty, piece_type, piece_path):
         """
@@ -258,6 +78,7 @@ class Player:
         self._positions = []
         self._move = {"from": None, "to": None, "waiting_time": 0}
         self._first_turn_played = False
+        self._last_move_stats = {}
 
     def make_move(self, *args, **kwargs):
         """
@@ -297,6 +118,10 @@ class Player:
     def positions(self):
         return self._positions
 
+    @property
+    def last_move_stats(self):
+        return self._last_move_stats
+
     def init_positions(self, point):
         """
         Initializes the player's positions on the board.
@@ -402,112 +227,211 @@ class Player:
             self._move["from"] = None
             self._move["to"] = None
 
-    def _change_piece_pos(self, board, from_pos, to_pos, piece_type):
+    def _set_move(self, from_move, to_move):
         """
-        Moves a piece from one position to another on the board.
+        Sets the move's from and to positions.
 
-        Parameters:
-        - board (list of lists): The current game board, represented as a 2D array.
-        - from_pos (tuple): The current position of the piece (row, column).
-        - to_pos (tuple): The target position for the piece (row, column).
-        - piece_type (PieceType): The type of piece being moved.
+        Args:
+            from_move (tuple): The initial position of the piece.
+            to_move (tuple): The target position of the piece.
+        """
+        self.set_from_move(from_move[0], from_move[1])
+        self.set_to_move(to_move[0], to_move[1])
+
+class HumanPlayer(Player):
+    """
+    The HumanPlayer class represents a human player in the game, inheriting from the Player class.
+    """
+    def __init__(self, name, player_type, difficulty, piece_type, piece_path):
+        """
+        Initializes a HumanPlayer object.
+
+        Args:
+            name (str): The name of the player.
+            player_type (PlayerType): The type of the player (Human).
+            difficulty (str): The difficulty level (not used for HumanPlayer).
+            piece_type (PieceType): The type of piece the player controls.
+            piece_path (str): The path to the image of the piece.
+        """
+        super().__init__(name, player_type, difficulty, piece_type, piece_path)
+    
+    def make_move(self):
+        """
+        Returns a deep copy of the current move.
+        
+        Returns:
+            dict: A deep copy of the move.
+        """
+        return copy.deepcopy(self._move)
+
+class AiPlayer(Player):
+    """
+    The AiPlayer class is the common base of the computer players. It owns the bitboard
+    primitives shared by every difficulty level (precomputed rays and line windows, square
+    conversion, move generation and win detection) and the tactical rules of the Easy and
+    Medium engines, which are expressed on top of those primitives.
+
+    Squares are numbered `row * board_size + col`. A position is handled as a list of two
+    bitmasks indexed by `PieceType.value`, so that a move is simulated with a couple of
+    bit operations instead of mutating a copy of the board.
+    """
+
+    def __init__(self, name, player_type, difficulty, piece_type, piece_path, win_condition=WIN_CONDITION, seed=None):
+        """
+        Initializes an AiPlayer object.
+
+        Args:
+            name (str): The name of the player.
+            player_type (PlayerType): The type of the player (AI).
+            difficulty (str): The difficulty level of the player.
+            piece_type (PieceType): The type of piece the player controls.
+            piece_path (str): The path to the image of the piece.
+            win_condition (int): The number of pieces in a row needed to win.
+            seed (int): The seed of the player's random choices, or None for an unseeded game.
+        """
+        super().__init__(name, player_type, difficulty, piece_type, piece_path)
+        self._win_condition = win_condition
+        self._geometry = None
+        # Every random choice of the player is drawn from here, so a seed replays the same game
+        self._random = random.Random(seed)
+
+    def _get_bits_and_positions(self, board, other_player_positions, board_size):
+        """
+        Converts the board and both players' positions to the bitboard representation.
+
+        Args:
+            board (Board): The current state of the game board.
+            other_player_positions (list): Positions of the opponent's pieces.
+            board_size (int): The size of the board.
+
+        Returns:
+            tuple: (bits, positions, other_positions) where `bits` is the [white, black] bitmask
+            list and the positions are lists of squares kept in the players' own order.
+        """
+        self._ensure_precomputed(board_size)
+        white_bits, black_bits = self._board_to_bitboards(board)
+        rc_to_sq = self._geometry.rc_to_sq
+        positions = [rc_to_sq[r][c] for r, c in self._positions]
+        other_positions = [rc_to_sq[r][c] for r, c in other_player_positions]
+        return [white_bits, black_bits], positions, other_positions
+
+    def _set_move_from_squares(self, move):
+        """
+        Sets the move's from and to positions from a (from_sq, to_sq) pair.
+
+        Args:
+            move (tuple): The move as a pair of squares.
+        """
+        from_sq, to_sq = move
+        self._set_move(self._geometry.sq_to_rc[from_sq], self._geometry.sq_to_rc[to_sq])
 
-        This function sets the `from_pos` cell to empty and updates the `to_pos` cell with the provided piece type.
+    def _change_piece_pos(self, bits, from_sq, to_sq, piece_type):
         """
-        board[from_pos[0]][from_pos[1]] = PieceType.EMPTY
-        board[to_pos[0]][to_pos[1]] = piece_type
+        Moves a piece from one square to another on the bitboards.
 
+        Parameters:
+        - bits (list): The [white, black] bitmasks of the current game board.
+        - from_sq (int): The current square of the piece.
+        - to_sq (int): The target square for the piece.
+        - piece_type (PieceType): The type of piece being moved.
 
-    def _attempt_winning_move(self, board, positions, piece_type, board_size):
+        This function empties `from_sq` and places a piece of the provided type on `to_sq`.
+        """
+        from_bit = 1 << from_sq
+        to_bit = 1 << to_sq
+        bits[0] &= ~from_bit
+        bits[1] &= ~from_bit
+        bits[1 - piece_type.value] &= ~to_bit
+        bits[piece_type.value] |= to_bit
+
+    def _attempt_winning_move(self, bits, positions, piece_type, board_size):
         """
         Attempts to make a winning move by checking for possible sequences that meet the winning condition.
 
         Parameters:
-        - board (list of lists): The current game board, represented as a 2D array.
-        - positions (list of tuples): The current positions of all pieces of the given type.
+        - bits (list): The [white, black] bitmasks of the current game board.
+        - positions (list of ints): The current squares of all pieces of the given type.
         - piece_type (PieceType): The type of piece to check for a winning move.
         - board_size (int): The size of the game board (e.g., width and height).
 
         Returns:
-        - tuple: A move as a tuple of (from_position, to_position) if a winning move is found.
+        - tuple: A move as a tuple of (from_square, to_square) if a winning move is found.
         - None: If no winning move is found.
 
         This function finds all possible winning moves and randomly selects one.
         """
-        winning_moves = self._find_consecutive_moves(board, positions, piece_type, board_size, WIN_CONDITION)
+        winning_moves = self._find_consecutive_moves(bits, positions, piece_type, board_size, self._geometry.win_condition)
         if winning_moves:
-            from_move, to_move, _ = random.choice(winning_moves)
+            from_move, to_move, _ = self._random.choice(winning_moves)
             return (from_move, to_move)
         return None
 
-
-    def _block_winning_move(self, board, positions, other_player_positions, other_player_type, board_size):
+    def _block_winning_move(self, bits, positions, other_player_positions, other_player_type, board_size):
         """
         Attempts to block the opponent's winning move by finding sequences that could lead to a win for the opponent.
 
         Parameters:
-        - board (list of lists): The current game board, represented as a 2D array.
-        - positions (list of tuples): The current positions of all pieces of the current player.
-        - other_player_positions (list of tuples): The current positions of the opponent's pieces.
+        - bits (list): The [white, black] bitmasks of the current game board.
+        - positions (list of ints): The current squares of all pieces of the current player.
+        - other_player_positions (list of ints): The current squares of the opponent's pieces.
         - other_player_type (PieceType): The type of piece used by the opponent.
         - board_size (int): The size of the game board (e.g., width and height).
 
         Returns:
-        - tuple: A move as a tuple of (from_position, to_position) if a blocking move is found.
+        - tuple: A move as a tuple of (from_square, to_square) if a blocking move is found.
         - None: If no blocking move is found.
 
         This function tries to block the opponent's winning move by shuffling the list of potential winning moves and evaluating them.
         """
         ret = None
-        winning_moves = self._find_consecutive_moves(board, other_player_positions, other_player_type, board_size, WIN_CONDITION)
+        winning_moves = self._find_consecutive_moves(bits, other_player_positions, other_player_type, board_size, self._geometry.win_condition)
         if winning_moves:
-            random.shuffle(winning_moves)
+            self._random.shuffle(winning_moves)
             for winning_move in winning_moves:
-                blocking_moves = self._try_to_block_move(board, positions, winning_move[0], winning_move[1], board_size)
+                blocking_moves = self._try_to_block_move(bits, positions, winning_move[0], winning_move[1], board_size)
                 for from_move, to_move in blocking_moves:
                     ret = (from_move, to_move)
-                    if self._evaluate_move(board, from_move, to_move, other_player_positions, other_player_type, board_size):
+                    if self._evaluate_move(bits, from_move, to_move, other_player_positions, other_player_type, board_size):
                         break
         return ret
 
-
     def _evaluate_move(
         self,
-        board: List[List],
-        piece_pos: Tuple[int, int],
-        to_move: Tuple[int, int],
-        other_player_positions: List[Tuple[int, int]],
+        bits: List[int],
+        piece_pos: int,
+        to_move: int,
+        other_player_positions: List[int],
         other_player_type,
         board_size: int
-    ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    ) -> Optional[Tuple[int, int]]:
         """
         Evaluates a move to determine if it's safe or if the opponent can win.
 
         Parameters:
-            - board (list of lists): The current game board.
-            - piece_pos (tuple): The current position of the player's piece.
-            - to_move (tuple): The position to move the piece to.
-            - other_player_positions (list of tuples): Opponent's piece positions.
+            - bits (list): The [white, black] bitmasks of the current game board.
+            - piece_pos (int): The current square of the player's piece.
+            - to_move (int): The square to move the piece to.
+            - other_player_positions (list of ints): Opponent's piece squares.
             - other_player_type: The type of the opponent's pieces.
             - board_size (int): The size of the game board.
 
         Returns:
-            - tuple: The move as (from_position, to_position) if it's safe or should be taken.
+            - tuple: The move as (from_square, to_square) if it's safe or should be taken.
             - None: If the move is not safe and should be skipped.
         """
         # Simulate the move
-        self._change_piece_pos(board, piece_pos, to_move, self._piece_type)
-        
+        self._change_piece_pos(bits, piece_pos, to_move, self._piece_type)
+
         # Check if the opponent can win after this move
         is_opponent_will_win, winning_move = self._check_if_opponent_can_win(
-            board, piece_pos, to_move, other_player_positions, other_player_type, board_size
+            bits, other_player_positions, other_player_type, board_size
         )
-        
+
         # Undo the move
-        self._change_piece_pos(board, to_move, piece_pos, self._piece_type)
-        
+        self._change_piece_pos(bits, to_move, piece_pos, self._piece_type)
+
         if is_opponent_will_win:
-            opponent_route = get_all_cells_in_route(winning_move[0], winning_move[1])
+            opponent_route = self._get_route_bits(winning_move[0], winning_move[1], board_size)
 
             # If our piece is in the opponent's winning route, skip this move
             if piece_pos in opponent_route:
@@ -521,22 +445,22 @@ class Player:
 
     def _make_random_move(
         self,
-        board: List[List],
-        positions: List[Tuple[int, int]],
-        other_player_positions: List[Tuple[int, int]],
+        bits: List[int],
+        positions: List[int],
+        other_player_positions: List[int],
         board_size: int
-    ) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    ) -> Tuple[int, int]:
         """
         Makes a random move while trying to prevent the opponent from winning.
 
         Parameters:
-            - board (list of lists): The current game board, represented as a 2D array.
-            - positions (list of tuples): The current positions of the player's pieces.
-            - other_player_positions (list of tuples): The current positions of the opponent's pieces.
+            - bits (list): The [white, black] bitmasks of the current game board.
+            - positions (list of ints): The current squares of the player's pieces.
+            - other_player_positions (list of ints): The current squares of the opponent's pieces.
             - board_size (int): The size of the game board (e.g., width and height).
 
         Returns:
-            - tuple: A random move as a tuple of (from_position, to_position).
+            - tuple: A random move as a tuple of (from_square, to_square).
 
         This function iterates over all available moves for the player's pieces, checks if the opponent will win based on the move, and makes a safe random move. If no safe move is found, it selects any random move.
         """
@@ -544,19 +468,20 @@ class Player:
         available_positions_moves = []
 
         # Gather all available moves for each piece
+        occ_bits = bits[0] | bits[1]
         for piece_pos in positions:
-            available_moves = get_available_cells_to_move(board, piece_pos, board_size)
+            available_moves = self._fast_available_moves_bits(occ_bits, piece_pos, board_size)
             if available_moves:
                 available_positions_moves.append((piece_pos, available_moves))
 
         # Shuffle to ensure randomness
-        random.shuffle(available_positions_moves)
+        self._random.shuffle(available_positions_moves)
 
         # Iterate through each piece and its available moves
         for piece_pos, available_moves in available_positions_moves:
-            random.shuffle(available_moves)  # Randomize the move order
+            self._random.shuffle(available_moves)  # Randomize the move order
             for to_move in available_moves:
-                move_result = self._evaluate_move(board, piece_pos, to_move, other_player_positions, other_player_type, board_size)
+                move_result = self._evaluate_move(bits, piece_pos, to_move, other_player_positions, other_player_type, board_size)
                 if move_result:
                     return move_result  # Return the first safe move found
 
@@ -568,77 +493,62 @@ class Player:
         else:
             raise ValueError("No available moves to make.")
 
-
-    def _check_if_opponent_can_win(self, board, piece_pos, to_move, other_player_positions, other_player_type, board_size):
+    def _check_if_opponent_can_win(self, bits, other_player_positions, other_player_type, board_size):
         """
         Checks if the opponent can win after the current player makes a move.
 
         This function temporarily moves each of the opponent's pieces to check if any move would result in a win
-        for the opponent. It simulates the opponent's possible moves and reverses the board state after each check.
+        for the opponent. It simulates the opponent's possible moves and reverses the bitboards after each check.
 
         Parameters:
-        - board (list of lists): The current game board, represented as a 2D array.
-        - piece_pos (tuple): The current position of the player's piece (row, column).
-        - to_move (tuple): The position to move the player's piece to (row, column).
-        - other_player_positions (list of tuples): The current positions of the opponent's pieces.
+        - bits (list): The [white, black] bitmasks of the current game board.
+        - other_player_positions (list of ints): The current squares of the opponent's pieces.
         - other_player_type (PieceType): The type of piece used by the opponent.
         - board_size (int): The size of the game board (e.g., width and height).
 
         Returns:
         - bool: True if the opponent can win after the current player's move, False otherwise.
-        - tuple or None: The opponent's winning move as a tuple of (from_position, to_position) if a winning move is found.
+        - tuple or None: The opponent's winning move as a tuple of (from_square, to_square) if a winning move is found.
         Returns None if no winning move is found.
-
-        This function simulates potential moves for the opponent and checks if any of them would satisfy the win condition.
         """
         for other_piece_pos in other_player_positions:
-            other_available_moves = get_available_cells_to_move(board, other_piece_pos, board_size)
+            other_available_moves = self._fast_available_moves_bits(bits[0] | bits[1], other_piece_pos, board_size)
             for move in other_available_moves:
-                self._change_piece_pos(board, other_piece_pos, move, other_player_type)
-                is_opponent_will_win, _ = check_consecutive_pieces(board, move, other_player_type, board_size, WIN_CONDITION)
-                self._change_piece_pos(board, move, other_piece_pos, other_player_type)
+                self._change_piece_pos(bits, other_piece_pos, move, other_player_type)
+                is_opponent_will_win = self._is_win_after_move_bits(bits[other_player_type.value], move, board_size)
+                self._change_piece_pos(bits, move, other_piece_pos, other_player_type)
                 if is_opponent_will_win:
                     return True, (other_piece_pos, move)
         return False, None
 
-
-    def _set_move(self, from_move, to_move):
-        """
-        Sets the move's from and to positions.
-
-        Args:
-            from_move (tuple): The initial position of the piece.
-            to_move (tuple): The target position of the piece.
-        """
-        self.set_from_move(from_move[0], from_move[1])
-        self.set_to_move(to_move[0], to_move[1])
-
-
-    def _try_to_block_move(self, board, positions, from_move, to_move, board_size):
+    def _try_to_block_move(self, bits, positions, from_move, to_move, board_size):
         """
-        Attempts to block the opponent's move by placing a piece in the path of the opponent's 
+        Attempts to block the opponent's move by placing a piece in the path of the opponent's
         potential winning move.
 
         Args:
-            board (list): The current state of the game board.
-            from_move (tuple): The initial position of the opponent's piece.
-            to_move (tuple): The target position of the opponent's piece.
+            bits (list): The [white, black] bitmasks of the current game board.
+            positions (list of ints): The squares of the pieces that may block.
+            from_move (int): The initial square of the opponent's piece.
+            to_move (int): The target square of the opponent's piece.
             board_size (int): The size of the board.
 
         Returns:
-            list: The avaiable blocking pieces and its new positions, or empty list if no block is found.
+            list: The available blocking pieces and their new squares, or empty list if no block is found.
         """
-        cells = get_all_cells_in_route(from_move, to_move)
+        cells = self._get_route_bits(from_move, to_move, board_size)
+        occ_bits = bits[0] | bits[1]
+        available_moves = [
+            (piece, self._fast_available_moves_bits(occ_bits, piece, board_size)) for piece in positions
+        ]
         blocking_moves = []
         for cell in cells:
-            for piece in positions:
-                available_moves = get_available_cells_to_move(board, piece, board_size)
-                for move in available_moves:
-                    if cell == move:
-                        blocking_moves.append((piece, move))
+            for piece, moves in available_moves:
+                if cell in moves:
+                    blocking_moves.append((piece, cell))
         return blocking_moves
 
-    def _find_consecutive_moves(self, board, positions, piece_type, board_size, consecutive_needed):
+    def _find_consecutive_moves(self, bits, positions, piece_type, board_size, consecutive_needed):
         """
         Finds possible moves that form consecutive pieces based on the given condition.
 
@@ -646,188 +556,217 @@ class Player:
             consecutive_needed (int): The number of consecutive pieces required.
 
         Returns:
-            list: A list of tuples, each containing (original_position, new_position, consec_list).
+            list: A list of tuples, each containing (original_square, new_square, (line_squares, end_squares)).
         """
         moves_for_consecutive = []
         for position in positions:
-            available_moves = get_available_cells_to_move(board, position, board_size)
+            available_moves = self._fast_available_moves_bits(bits[0] | bits[1], position, board_size)
             for to_move in available_moves:
-                self._change_piece_pos(board, position, to_move, piece_type)
-                is_consecutive, consec_list = check_consecutive_pieces(board, to_move, piece_type, board_size, consecutive_needed)
-                self._change_piece_pos(board, to_move, position, piece_type)
-                if is_consecutive:
-                    moves_for_consecutive.append((position, to_move, consec_list))   
+                self._change_piece_pos(bits, position, to_move, piece_type)
+                consecutive = self._get_consecutive_line_bits(bits[piece_type.value], to_move, board_size, consecutive_needed)
+                self._change_piece_pos(bits, to_move, position, piece_type)
+                if consecutive:
+                    moves_for_consecutive.append((position, to_move, consecutive))
         return moves_for_consecutive
 
-    def _apply_move(self, board, positions, from_move, to_move, piece_type):
-        self._change_piece_pos(board, from_move, to_move, piece_type)
+    def _apply_move(self, bits, positions, from_move, to_move, piece_type):
+        self._change_piece_pos(bits, from_move, to_move, piece_type)
         positions.remove(from_move)
         positions.append(to_move)
 
-    def _undo_move(self, board, positions, from_move, to_move, piece_type):
-        self._change_piece_pos(board, to_move, from_move, piece_type)
+    def _undo_move(self, bits, positions, from_move, to_move, piece_type):
+        self._change_piece_pos(bits, to_move, from_move, piece_type)
         positions.remove(to_move)
         positions.append(from_move)
 
-    def _board_key(self, board, piece_type_to_move):
-        flat = tuple(cell.value for row in board for cell in row)
-        return (piece_type_to_move.value, flat)
+    # ------------------------------------------------------------------
+    # Lines and routes
+    # ------------------------------------------------------------------
 
-class HumanPlayer(Player):
-    """
-    The HumanPlayer class represents a human player in the game, inheriting from the Player class.
-    """
-    def __init__(self, name, player_type, difficulty, piece_type, piece_path):
+    def _get_consecutive_line_bits(self, piece_bits, sq, board_size, consecutive_needed):
         """
-        Initializes a HumanPlayer object.
+        Looks for a run of at least `consecutive_needed` pieces through `sq`, checking the
+        horizontal, vertical, diagonal and anti-diagonal axes in that order.
 
-        Args:
-            name (str): The name of the player.
-            player_type (PlayerType): The type of the player (Human).
-            difficulty (str): The difficulty level (not used for HumanPlayer).
-            piece_type (PieceType): The type of piece the player controls.
-            piece_path (str): The path to the image of the piece.
+        Returns:
+            tuple or None: (line_squares, end_squares) for the first matching axis, where
+            `end_squares` are the on-board squares extending the run at both ends.
         """
-        super().__init__(name, player_type, difficulty, piece_type, piece_path)
-    
-    def make_move(self):
+        rays = self._geometry.rays[sq]
+        for forward_idx, backward_idx in AXIS_RAY_PAIRS:
+            forward_ray = rays[forward_idx]
+            backward_ray = rays[backward_idx]
+            forward_run = self._count_run_bits(piece_bits, forward_ray)
+            backward_run = self._count_run_bits(piece_bits, backward_ray)
+            if forward_run + backward_run + 1 >= consecutive_needed:
+                line = forward_ray[:forward_run] + (sq,) + backward_ray[:backward_run]
+                ends = [
+                    ray[run]
+                    for ray, run in ((backward_ray, backward_run), (forward_ray, forward_run))
+                    if run < len(ray)
+                ]
+                return line, ends
+        return None
+
+    def _count_run_bits(self, piece_bits, ray):
+        run = 0
+        for sq in ray:
+            if not piece_bits & (1 << sq):
+                break
+            run += 1
+        return run
+
+    def _get_route_bits(self, from_sq, to_sq, board_size):
         """
-        Returns a deep copy of the current move.
-        
+        Returns the squares of a straight move from `from_sq` to `to_sq`, both included,
+        ordered from `to_sq` back to `from_sq`.
+        """
+        for ray in self._geometry.rays[from_sq]:
+            if to_sq in ray:
+                return ray[ray.index(to_sq)::-1] + (from_sq,)
+        return ()
+
+    # ------------------------------------------------------------------
+    # Move generation
+    # ------------------------------------------------------------------
+
+    def _fast_available_moves_bits(self, occ_bits, sq, board_size):
+        moves = []
+        rays = self._geometry.rays[sq]
+
+        for ray in rays:
+            for target_sq in ray:
+                if occ_bits & (1 << target_sq):
+                    break
+                moves.append(target_sq)
+
+        return moves
+
+    # ------------------------------------------------------------------
+    # Bit helpers
+    # ------------------------------------------------------------------
+
+    def _iter_bits(self, bits):
+        while bits:
+            lsb = bits & -bits
+            yield lsb.bit_length() - 1
+            bits ^= lsb
+
+    def _first_bit(self, bits):
+        if bits == 0:
+            return None
+        return (bits & -bits).bit_length() - 1
+
+    def _is_win_after_move_bits(self, bits, to_sq, board_size):
+        for (_, shifts), starts in zip(self._geometry.line_shifts, self._geometry.line_starts_by_sq[to_sq]):
+            for shift in shifts:
+                starts &= bits >> shift
+            if starts:
+                return True
+        return False
+
+    def _get_window_fill_bits(self, piece_bits, other_bits, starts_mask, shifts):
+        """
+        Classifies all the windows of one axis at once. Bit `s` of a result stands for the
+        window starting on square `s`, and every step is one shift of the whole bitboard, so
+        the cost does not depend on the number of windows.
+
         Returns:
-            dict: A deep copy of the move.
+            tuple: (full, near) - the windows filled with `piece_bits`, and the windows free
+            of `other_bits` that miss exactly one piece.
         """
-        return copy.deepcopy(self._move)
+        full = starts_mask
+        near = 0
+        blocked = 0
+        for shift in shifts:
+            row = piece_bits >> shift
+            near = (near & row) | (full & ~row)
+            full &= row
+            blocked |= other_bits >> shift
+        return full, near & ~blocked
 
-class AiPlayerEasy(Player):
-    def __init__(self, name, player_type, difficulty, piece_type, piece_path):
-        super().__init__(name, player_type, difficulty, piece_type, piece_path)
+    # ------------------------------------------------------------------
+    # Board conversion
+    # ------------------------------------------------------------------
+
+    def _board_to_bitboards(self, board):
+        return board.white_bits, board.black_bits
+
+    # ------------------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------------------
+
+    def _ensure_precomputed(self, board_size):
+        if self._geometry is None or self._geometry.board_size != board_size:
+            self._geometry = get_geometry(board_size, self._win_condition)
+
+
+class AiPlayerEasy(AiPlayer):
+    def __init__(self, name, player_type, difficulty, piece_type, piece_path, win_condition=WIN_CONDITION, seed=None):
+        super().__init__(name, player_type, difficulty, piece_type, piece_path, win_condition, seed)
 
     def make_move(self, board, other_player_positions, board_size):
         """
-        Determines and executes the next move for the player. 
+        Determines and executes the next move for the player.
         The move can be a winning move, a blocking move, or a random move based on available options.
 
         Args:
-            board (list): The current state of the game board.
+            board (Board): The current state of the game board.
             other_player_positions (list): Positions of the opponent's pieces.
             board_size (int): The size of the board.
 
         Returns:
             dict: A deep copy of the player's move, including the waiting time.
         """
+        start = time.perf_counter()
         new_move = None
-        board_copy = copy.deepcopy(board)
-        positions_copy = copy.deepcopy(self._positions)
+        bits, positions, other_positions = self._get_bits_and_positions(board, other_player_positions, board_size)
 
         # Check if the player can win in a single move
-        new_move = self._attempt_winning_move(board_copy, positions_copy, self._piece_type, board_size)
+        new_move = self._attempt_winning_move(bits, positions, self._piece_type, board_size)
 
         # Check if the opponent can win and block if necessary
         if not new_move:
             other_player_type = PieceType.WHITE if self._piece_type == PieceType.BLACK else PieceType.BLACK
-            new_move = self._block_winning_move(board_copy, positions_copy, other_player_positions, other_player_type, board_size)
+            new_move = self._block_winning_move(bits, positions, other_positions, other_player_type, board_size)
 
         # If no critical moves found, make a random move
         if not new_move:
-            new_move = self._make_random_move(board_copy, positions_copy, other_player_positions, board_size)
+            new_move = self._make_random_move(bits, positions, other_positions, board_size)
 
-        self._set_move(*new_move)
+        self._set_move_from_squares(new_move)
         self.set_move_waiting_time(AI_MOVE_WAITING_TIME)
+        self._last_move_stats = {"think_time": time.perf_counter() - start}
         return copy.deepcopy(self._move)
 
-class AiPlayerMedium(Player):
+class AiPlayerMedium(AiPlayer):
     """
-    The AiPlayerEasy class represents an AI player with an "Easy" difficulty level,
-    inheriting from the Player class.
+    The AiPlayerMedium class represents an AI player with a "Medium" difficulty level,
+    inheriting from the AiPlayer class.
     """
-    def __init__(self, name, player_type, difficulty, piece_type, piece_path):
+    def __init__(self, name, player_type, difficulty, piece_type, piece_path, win_condition=WIN_CONDITION, seed=None):
         """
-        Initializes an AiPlayerEasy object.
+        Initializes an AiPlayerMedium object.
 
         Args:
             name (str): The name of the player.
             player_type (PlayerType): The type of the player (AI).
-            difficulty (str): The difficulty level (Easy).
+            difficulty (str): The difficulty level (Medium).
             piece_type (PieceType): The type of piece the player controls.
             piece_path (str): The path to the image of the piece.
+            win_condition (int): The number of pieces in a row needed to win.
+            seed (int): The seed of the player's random choices, or None for an unseeded game.
         """
-        super().__init__(name, player_type, difficulty, piece_type, piece_path)
-
-    def _get_consecutive_extensions(self, points, size):
-        """
-        Calculate the possible consecutive points that extend a line formed by the input points.
-
-        This function takes a list of consecutive points and calculates potential extensions of
-        the line in both forward and backward directions, based on the consistent direction of the 
-        input points. The function ensures that all points are aligned in the same direction and
-        checks if the extended points lie within the bounds of the board.
-
-        Args:
-            points (list of tuples): A list of tuples where each tuple represents a point as (row, col).
-                                    The points must be consecutive and aligned in the same direction.
-            size (int): The size of the board (assumed to be square) which sets the boundary for valid points.
-
-        Returns:
-            list of tuples: A list containing up to two points that extend the line in both directions.
-                            Each point is represented as a tuple (row, col). The points will only be returned
-                            if they lie within the boundaries of the board. If no valid extension is possible,
-                            an empty list is returned.
-        """
-        if len(points) < 2:
-            return []
-
-        # Calculate the direction vector based on the first two points
-        dx = points[1][0] - points[0][0]
-        dy = points[1][1] - points[0][1]
+        super().__init__(name, player_type, difficulty, piece_type, piece_path, win_condition, seed)
 
-        if dx == 0 and dy == 0:
-            # All points are the same
-            return []
-
-        # Sort the points based on their position along the direction vector
-        # Calculate a projection value for each point
-        x0, y0 = points[0]
-        def projection(point):
-            x, y = point
-            return (x - x0) * dx + (y - y0) * dy
-
-        sorted_points = sorted(points, key=projection)
-
-        # Recalculate the direction vector based on the sorted points
-        dx = sorted_points[1][0] - sorted_points[0][0]
-        dy = sorted_points[1][1] - sorted_points[0][1]
-
-        if dx == 0 and dy == 0:
-            # All points are the same after sorting
-            return []
-
-        # Ensure all points are in the same direction
-        for i in range(1, len(sorted_points)):
-            curr_dx = sorted_points[i][0] - sorted_points[i - 1][0]
-            curr_dy = sorted_points[i][1] - sorted_points[i - 1][1]
-            if (curr_dx, curr_dy) != (dx, dy):
-                return []
-
-        # Calculate the next points in both directions
-        next_point_forward = (sorted_points[-1][0] + dx, sorted_points[-1][1] + dy)
-        next_point_backward = (sorted_points[0][0] - dx, sorted_points[0][1] - dy)
-
-        # Check if the points are within the board boundaries
-        valid_points = []
-        for x, y in [next_point_backward, next_point_forward]:
-            if 0 <= x < size and 0 <= y < size:
-                valid_points.append((x, y))
-        return valid_points
-
-
-    def _available_extentions(self, board, positions, board_size, winning_points, points_to_skip):
+    def _available_extentions(self, bits, positions, board_size, winning_points, points_to_skip):
         point_a, point_b = winning_points
         found_a, found_b = False, False
+        occ_bits = bits[0] | bits[1]
         for position in positions:
             if position in points_to_skip:
                 continue
-            available_moves = get_available_cells_to_move(board, position, board_size)
+            available_moves = self._fast_available_moves_bits(occ_bits, position, board_size)
             for move in available_moves:
                 if move == point_a:
                     found_a = True
@@ -840,15 +779,14 @@ class AiPlayerMedium(Player):
         return 0
 
 
-    @staticmethod
-    def _get_the_best_optional_move(optional_moves):
+    def _get_the_best_optional_move(self, optional_moves):
         """
         Selects the best optional move based on priority.
 
         Parameters:
         - optional_moves (list of tuples): A list of potential moves, where each move is a tuple that contains:
-            - The move's 'from' position.
-            - The move's 'to' position.
+            - The move's 'from' square.
+            - The move's 'to' square.
             - A priority indicator (1 or 2), where 2 indicates a higher priority move.
 
         Returns:
@@ -866,61 +804,64 @@ class AiPlayerMedium(Player):
                 list_1.append(optional_move)
             elif optional_move[2] == 2:
                 list_2.append(optional_move)
-        
+
         if len(list_2) != 0:
-            chosen_move = random.choice(list_2)
+            chosen_move = self._random.choice(list_2)
         else:
-            chosen_move = random.choice(list_1)
+            chosen_move = self._random.choice(list_1)
 
         return chosen_move
 
-    def _block_a_force_win(self, board, positions, other_player_positions, other_player_type, board_size):
+    def _block_a_force_win(self, bits, positions, other_player_positions, other_player_type, board_size):
         move = None
-        winning_move, winning_options = self._find_attack(board, other_player_positions, positions, other_player_type, self._piece_type, board_size)
+        winning_move, winning_options = self._find_attack(bits, other_player_positions, positions, other_player_type, self._piece_type, board_size)
         if winning_move and winning_options == 2:
-            blocking_options = get_pieces_that_can_move_to_target(board, positions, winning_move[1], board_size)
+            occ_bits = bits[0] | bits[1]
+            blocking_options = [
+                piece_pos for piece_pos in positions
+                if winning_move[1] in self._fast_available_moves_bits(occ_bits, piece_pos, board_size)
+            ]
             for piece_pos in blocking_options:
-                new_move = self._evaluate_move(board, piece_pos, winning_move[1], other_player_positions, other_player_type, board_size)
+                new_move = self._evaluate_move(bits, piece_pos, winning_move[1], other_player_positions, other_player_type, board_size)
                 if new_move:
                     move = new_move
                     break
         return move
 
-    def _find_attack(self, board, positions, other_player_positions, piece_type, other_piece_type, board_size):
+    def _find_attack(self, bits, positions, other_player_positions, piece_type, other_piece_type, board_size):
         optional_moves = []
-        positions_cp = copy.deepcopy(positions)
-        other_player_positions_cp = copy.deepcopy(other_player_positions)
-        moves_for_3 = self._find_consecutive_moves(board, positions, piece_type, board_size, 3)
-        for from_move, to_move, consec_pieces in moves_for_3:
-            points_that_win = self._get_consecutive_extensions(consec_pieces, board_size)
-            self._apply_move(board, positions_cp, from_move, to_move, piece_type)
+        positions_cp = list(positions)
+        # Moves that leave a line one piece short of a win
+        moves_to_threat = self._find_consecutive_moves(bits, positions, piece_type, board_size, self._geometry.win_condition - 1)
+        for from_move, to_move, (consec_pieces, points_that_win) in moves_to_threat:
+            self._apply_move(bits, positions_cp, from_move, to_move, piece_type)
             if len(points_that_win) == 2:
-                options_to_win = self._available_extentions(board, positions_cp, board_size, points_that_win, consec_pieces)
+                options_to_win = self._available_extentions(bits, positions_cp, board_size, points_that_win, consec_pieces)
                 if options_to_win == 2:
                     optional_moves.append((from_move, to_move, 2))
                 elif options_to_win == 1:
-                    blocking_move = self._block_winning_move(board, other_player_positions, positions_cp, piece_type, board_size)
+                    blocking_move = self._block_winning_move(bits, other_player_positions, positions_cp, piece_type, board_size)
                     if blocking_move:
                         optional_moves.append((from_move, to_move, 1))
                     else:
                         optional_moves.append((from_move, to_move, 2))
             elif len(points_that_win) == 1:
-                winning_move = self._attempt_winning_move(board, positions_cp, piece_type, board_size)
+                winning_move = self._attempt_winning_move(bits, positions_cp, piece_type, board_size)
                 if winning_move:
-                    blocking_move = self._block_winning_move(board, other_player_positions, positions_cp, piece_type, board_size)
+                    blocking_move = self._block_winning_move(bits, other_player_positions, positions_cp, piece_type, board_size)
                     if blocking_move:
                         optional_moves.append((from_move, to_move, 1))
                     else:
                         optional_moves.append((from_move, to_move, 2))
-            self._undo_move(board, positions_cp, from_move, to_move, piece_type)
+            self._undo_move(bits, positions_cp, from_move, to_move, piece_type)
 
         new_move = None
         winning_options = None
         while not new_move and len(optional_moves) != 0:
             from_move, to_move, winning_options = self._get_the_best_optional_move(optional_moves)
-            self._change_piece_pos(board, from_move, to_move, piece_type)
-            is_opponent_will_win, _ = self._check_if_opponent_can_win(board, positions, to_move, other_player_positions, other_piece_type, board_size)
-            self._change_piece_pos(board, to_move, from_move, piece_type)
+            self._change_piece_pos(bits, from_move, to_move, piece_type)
+            is_opponent_will_win, _ = self._check_if_opponent_can_win(bits, other_player_positions, other_piece_type, board_size)
+            self._change_piece_pos(bits, to_move, from_move, piece_type)
             if not is_opponent_will_win:
                 new_move = (from_move, to_move)
             else:
@@ -931,48 +872,49 @@ class AiPlayerMedium(Player):
 
     def make_move(self, board, other_player_positions, board_size):
         """
-        Determines and executes the next move for the player. 
+        Determines and executes the next move for the player.
         The move can be a winning move, a blocking move, or a random move based on available options.
 
         Args:
-            board (list): The current state of the game board.
+            board (Board): The current state of the game board.
             other_player_positions (list): Positions of the opponent's pieces.
             board_size (int): The size of the board.
 
         Returns:
             dict: A deep copy of the player's move, including the waiting time.
         """
+        start = time.perf_counter()
         new_move = None
-        board_copy = copy.deepcopy(board)
-        positions_copy = copy.deepcopy(self._positions)
+        bits, positions, other_positions = self._get_bits_and_positions(board, other_player_positions, board_size)
+        other_player_type = PieceType.WHITE if self._piece_type == PieceType.BLACK else PieceType.BLACK
 
         # Check if the player can win in a single move
-        new_move = self._attempt_winning_move(board_copy, positions_copy, self._piece_type, board_size)
+        new_move = self._attempt_winning_move(bits, positions, self._piece_type, board_size)
 
         # Check if the opponent can win and block it
         if not new_move:
-            other_player_type = PieceType.WHITE if self._piece_type == PieceType.BLACK else PieceType.BLACK
-            new_move = self._block_winning_move(board_copy, positions_copy, other_player_positions, other_player_type, board_size)
-        
+            new_move = self._block_winning_move(bits, positions, other_positions, other_player_type, board_size)
+
         # check if the opponent can force a win and block it
         if not new_move:
-            new_move = self._block_a_force_win(board_copy, positions_copy, other_player_positions, other_player_type, board_size)
+            new_move = self._block_a_force_win(bits, positions, other_positions, other_player_type, board_size)
 
         # Try to find the best optional move
         if not new_move and self._first_turn_played:
-            new_move, winning_options = self._find_attack(board_copy, positions_copy, other_player_positions, self._piece_type, other_player_type, board_size)
+            new_move, winning_options = self._find_attack(bits, positions, other_positions, self._piece_type, other_player_type, board_size)
 
         # If no critical moves found, make a random move
         if not new_move:
-            new_move = self._make_random_move(board_copy, positions_copy, other_player_positions, board_size)
+            new_move = self._make_random_move(bits, positions, other_positions, board_size)
 
-        self._set_move(*new_move)
+        self._set_move_from_squares(new_move)
         self.set_move_waiting_time(AI_MOVE_WAITING_TIME)
+        self._last_move_stats = {"think_time": time.perf_counter() - start}
         self._first_turn_played = True
         return copy.deepcopy(self._move)
 
 
-class AiPlayerHard(Player):
+class AiPlayerHard(AiPlayer):
     """
     Hard AI using bitboards internally.
 
@@ -983,7 +925,7 @@ class AiPlayerHard(Player):
     - safe block detection
     - double-threat creation detection
     - alpha-beta negamax
-    - tactical extension in sharp positions
+    - threat-based quiescence search
     - stronger TT (exact / lower / upper bounds)
     - better move ordering
     - profiling summary per move
@@ -995,47 +937,74 @@ class AiPlayerHard(Player):
     CENTER_WEIGHT = 6
     IMMEDIATE_WIN_BONUS = 120_000
     DOUBLE_THREAT_BONUS = 80_000
-    FORCED_THREAT_BONUS = 25_000
     REACHABLE_EMPTY_BONUS = 12
     UNREACHABLE_EMPTY_PENALTY = 8
 
-    LINE_SCORES = {
-        0: 0,
-        1: 8,
+    # Score of a window free of enemy pieces, by the number of pieces still missing to complete it
+    LINE_SCORES_BY_MISSING = {
+        1: 400,
         2: 40,
-        3: 400,
+        3: 8,
     }
 
     PROFILE_ENABLED = True
     PROFILE_PRINT_EVERY_MOVE = True
 
-    TACTICAL_EXTENSION_LIMIT = 1
+    # Forcing plies searched past the horizon, and the most a forcing move can add to a
+    # static score short of a forced win, for delta pruning
+    QUIESCENCE_DEPTH = 4
+    QUIESCENCE_DELTA = IMMEDIATE_WIN_BONUS + DOUBLE_THREAT_BONUS
+
+    # Killer moves kept per ply, and the deepest ply they are kept for
+    KILLERS_PER_PLY = 2
+    MAX_SEARCH_PLY = 64
+    # History scores are shifted right by this much between moves, so they fade instead of resetting
+    HISTORY_AGING_SHIFT = 1
 
     TT_FLAG_EXACT = 0
     TT_FLAG_LOWER = 1
     TT_FLAG_UPPER = 2
 
-    def __init__(self, name, player_type, difficulty, piece_type, piece_path, search_depth=4):
-        super().__init__(name, player_type, difficulty, piece_type, piece_path)
+    def __init__(
+        self,
+        name,
+        player_type,
+        difficulty,
+        piece_type,
+        piece_path,
+        search_depth=4,
+        win_condition=WIN_CONDITION,
+        time_limit=None,
+        engine=None,
+        seed=None,
+        max_nodes=None
+    ):
+        super().__init__(name, player_type, difficulty, piece_type, piece_path, win_condition, seed)
         self._logger = get_logger(self.__class__.__name__)
+        # Players given the same engine share its caches; killers and history stay per player
+        self._engine = engine if engine is not None else Engine(win_condition)
         self._search_depth = search_depth
-
-        self._line_cache = {}
-        self._rays_cache = {}
-        self._windows_by_sq_cache = {}
-        self._rc_to_sq_cache = {}
-        self._sq_to_rc_cache = {}
-
-        self._eval_cache = {}
-        self._move_cache = {}
-        self._tactical_cache = {}
+        self._time_limit = time_limit
+        self._deadline = None
+        # Search nodes allowed per move, or None for no limit. Unlike the time limit it stops
+        # the search at the same node on every run and machine, so with a seed and no time
+        # limit a game is replayed exactly.
+        self._max_nodes = max_nodes
+        self._nodes = 0
+        self._depth_reached = 0
+        self._line_scores = ()
+
+        self._eval_cache = self._engine.eval_cache
+        self._move_cache = self._engine.move_cache
+        self._tactical_cache = self._engine.tactical_cache
 
         self._prof = {}
         self._prof_counts = {}
         self._prof_counters = {}
 
-        self._killer_moves = {}
-        self._history_heuristic = {}
+        # Both tables are indexed by move, as from_sq * num_squares + to_sq; killers by ply first
+        self._killer_moves = [-1] * (self.MAX_SEARCH_PLY * self.KILLERS_PER_PLY)
+        self._history_heuristic = []
 
     # ------------------------------------------------------------------
     # Profiling helpers
@@ -1057,6 +1026,24 @@ class AiPlayerHard(Player):
             return
         self._prof_counters[name] = self._prof_counters.get(name, 0) + amount
 
+    def _prof_hit_rate(self, name):
+        hits = self._prof_counters.get(f"{name}_hits", 0)
+        total = hits + self._prof_counters.get(f"{name}_misses", 0)
+        return round(hits / total, 4) if total else None
+
+    def _set_last_move_stats(self, total_elapsed):
+        self._last_move_stats = {
+            "think_time": total_elapsed,
+            "depth_reached": self._depth_reached,
+            "nodes": self._nodes,
+            "cutoffs": self._prof_counters.get("alpha_beta_cutoffs", 0),
+            "search_timeouts": self._prof_counters.get("search_timeouts", 0),
+            "tt_hit_rate": self._prof_hit_rate("tt"),
+            "eval_cache_hit_rate": self._prof_hit_rate("eval_cache"),
+            "move_cache_hit_rate": self._prof_hit_rate("move_cache"),
+            "win_targets_cache_hit_rate": self._prof_hit_rate("win_targets_cache"),
+        }
+
     def _prof_print_summary(self, total_elapsed, chosen_move):
         if not self.PROFILE_ENABLED or not self.PROFILE_PRINT_EVERY_MOVE:
             return
@@ -1067,7 +1054,7 @@ class AiPlayerHard(Player):
         lines = []
         lines.append("=" * 72)
         lines.append(
-            f"[AiPlayerHard] move summary | depth={self._search_depth} | "
+            f"[AiPlayerHard] move summary | depth={self._depth_reached}/{self._search_depth} | "
             f"move={chosen_move} | total={total_elapsed:.6f}s"
         )
         lines.append("-" * 72)
@@ -1102,102 +1089,97 @@ class AiPlayerHard(Player):
         total_start = time.perf_counter()
         self._prof_reset()
 
-        self._move_cache = {}
-        self._eval_cache = {}
-        self._tactical_cache = {}
-        self._killer_moves = {}
-        self._history_heuristic = {}
+        self._depth_reached = 0
+        self._nodes = 0
 
+        self._engine.begin_move(board_size)
         self._ensure_precomputed(board_size)
-
-        white_bits, black_bits, white_positions, black_positions = self._board_to_bitboards(board, board_size)
+        self._age_move_ordering_tables()
 
         if self._piece_type == PieceType.WHITE:
-            my_bits = white_bits
-            my_positions = white_positions
-            opp_bits = black_bits
-            opp_positions = black_positions
+            my_bits = board.white_bits
+            opp_bits = board.black_bits
         else:
-            my_bits = black_bits
-            my_positions = black_positions
-            opp_bits = white_bits
-            opp_positions = white_positions
+            my_bits = board.black_bits
+            opp_bits = board.white_bits
 
         # 1) immediate win
         t0 = time.perf_counter()
-        winning_moves = self._get_winning_moves_bits(my_bits, my_positions, opp_bits, board_size)
+        winning_moves = self._get_winning_moves_bits(my_bits, opp_bits, board_size)
         self._prof_add("_get_winning_moves_bits", time.perf_counter() - t0)
         if winning_moves:
             best_move_sq = self._order_candidate_moves_bits(
                 winning_moves,
                 my_bits,
-                my_positions,
                 opp_bits,
-                opp_positions,
                 board_size,
                 tt_move=None,
                 ply=0,
             )[0]
-            from_rc = self._sq_to_rc(best_move_sq[0], board_size)
-            to_rc = self._sq_to_rc(best_move_sq[1], board_size)
+            from_rc = self._geometry.sq_to_rc[best_move_sq[0]]
+            to_rc = self._geometry.sq_to_rc[best_move_sq[1]]
             self._set_move(from_rc, to_rc)
 
             elapsed = time.perf_counter() - total_start
             self.set_move_waiting_time(max(0.0, AI_MOVE_WAITING_TIME - elapsed))
             self._first_turn_played = True
+            self._set_last_move_stats(elapsed)
             self._prof_print_summary(elapsed, (from_rc, to_rc))
             return copy.deepcopy(self._move)
 
         # 2) immediate safe block
         t0 = time.perf_counter()
         safe_blockers = self._get_safe_blocking_moves_bits(
-            my_bits, my_positions, opp_bits, opp_positions, board_size
+            my_bits, opp_bits, board_size
         )
         self._prof_add("_get_safe_blocking_moves_bits", time.perf_counter() - t0)
         if safe_blockers:
             best_move_sq = self._order_candidate_moves_bits(
                 safe_blockers,
                 my_bits,
-                my_positions,
                 opp_bits,
-                opp_positions,
                 board_size,
                 tt_move=None,
                 ply=0,
             )[0]
-            from_rc = self._sq_to_rc(best_move_sq[0], board_size)
-            to_rc = self._sq_to_rc(best_move_sq[1], board_size)
+            from_rc = self._geometry.sq_to_rc[best_move_sq[0]]
+            to_rc = self._geometry.sq_to_rc[best_move_sq[1]]
             self._set_move(from_rc, to_rc)
 
             elapsed = time.perf_counter() - total_start
             self.set_move_waiting_time(max(0.0, AI_MOVE_WAITING_TIME - elapsed))
             self._first_turn_played = True
+            self._set_last_move_stats(elapsed)
             self._prof_print_summary(elapsed, (from_rc, to_rc))
             return copy.deepcopy(self._move)
 
         # 3) full search
-        tt = {}
         t0 = time.perf_counter()
-        _, best_move_sq = self._search_root_bits(
-            current_bits=my_bits,
-            current_positions=my_positions,
-            other_bits=opp_bits,
-            other_positions=opp_positions,
-            board_size=board_size,
-            depth=self._search_depth,
-            extensions_left=self.TACTICAL_EXTENSION_LIMIT,
-            tt=tt
-        )
+        if self._time_limit is None and self._max_nodes is None:
+            self._depth_reached = self._search_depth
+            _, best_move_sq = self._search_root_bits(
+                current_bits=my_bits,
+                other_bits=opp_bits,
+                board_size=board_size,
+                depth=self._search_depth,
+                tt=self._engine.new_transposition_table()
+            )
+        else:
+            deadline = None if self._time_limit is None else total_start + self._time_limit
+            best_move_sq = self._search_with_deadline_bits(
+                my_bits, opp_bits, board_size, deadline
+            )
         self._prof_add("_search_root_bits", time.perf_counter() - t0)
 
-        from_rc = self._sq_to_rc(best_move_sq[0], board_size)
-        to_rc = self._sq_to_rc(best_move_sq[1], board_size)
+        from_rc = self._geometry.sq_to_rc[best_move_sq[0]]
+        to_rc = self._geometry.sq_to_rc[best_move_sq[1]]
         self._set_move(from_rc, to_rc)
 
         elapsed = time.perf_counter() - total_start
         self.set_move_waiting_time(max(0.0, AI_MOVE_WAITING_TIME - elapsed))
         self._first_turn_played = True
 
+        self._set_last_move_stats(elapsed)
         self._prof_print_summary(elapsed, (from_rc, to_rc))
         return copy.deepcopy(self._move)
 
@@ -1205,15 +1187,52 @@ class AiPlayerHard(Player):
     # Search
     # ------------------------------------------------------------------
 
+    def _search_with_deadline_bits(
+        self,
+        current_bits,
+        other_bits,
+        board_size,
+        deadline
+    ):
+        # Iterative deepening: each completed depth gives a move to fall back on when the
+        # next one runs out of time or nodes, and leaves killers and history that order the next one.
+        self._deadline = deadline
+        self._depth_reached = 0
+        best_move_sq = None
+
+        try:
+            for depth in range(1, self._search_depth + 1):
+                _, move = self._search_root_bits(
+                    current_bits=current_bits,
+                    other_bits=other_bits,
+                    board_size=board_size,
+                    depth=depth,
+                    tt=self._engine.new_transposition_table()
+                )
+                best_move_sq = move
+                self._depth_reached = depth
+        except SearchTimeout:
+            self._prof_inc("search_timeouts")
+        finally:
+            self._deadline = None
+
+        if best_move_sq is None:
+            best_move_sq = self._get_search_moves_bits(
+                current_bits,
+                other_bits,
+                board_size,
+                tt_move=None,
+                ply=0,
+            )[0]
+
+        return best_move_sq
+
     def _search_root_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size,
         depth,
-        extensions_left,
         tt
     ):
         alpha = -float("inf")
@@ -1222,15 +1241,13 @@ class AiPlayerHard(Player):
         best_score = -float("inf")
         best_moves = []
 
-        tt_entry = tt.get((current_bits, other_bits, depth, extensions_left))
+        tt_entry = tt.get((current_bits, other_bits, depth))
         tt_move = tt_entry["best_move"] if tt_entry and tt_entry.get("best_move") else None
 
         t0 = time.perf_counter()
         moves = self._get_search_moves_bits(
             current_bits,
-            current_positions,
             other_bits,
-            other_positions,
             board_size,
             tt_move=tt_move,
             ply=0,
@@ -1241,14 +1258,11 @@ class AiPlayerHard(Player):
             t0 = time.perf_counter()
             score = self._score_move_bits(
                 current_bits=current_bits,
-                current_positions=current_positions,
                 other_bits=other_bits,
-                other_positions=other_positions,
                 from_sq=from_sq,
                 to_sq=to_sq,
                 board_size=board_size,
                 depth=depth,
-                extensions_left=extensions_left,
                 alpha=alpha,
                 beta=beta,
                 ply=1,
@@ -1266,27 +1280,24 @@ class AiPlayerHard(Player):
             if score > alpha:
                 alpha = score
 
-        chosen_move = random.choice(best_moves) if best_moves else None
+        chosen_move = self._random.choice(best_moves) if best_moves else None
         return best_score, chosen_move
 
     def _score_move_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         from_sq,
         to_sq,
         board_size,
         depth,
-        extensions_left,
         alpha,
         beta,
         ply,
         tt,
         path_keys
     ):
-        new_current_bits, new_current_positions = self._apply_move_bits(current_bits, current_positions, from_sq, to_sq)
+        new_current_bits = self._apply_move_bits(current_bits, from_sq, to_sq)
 
         if self._is_win_after_move_bits(new_current_bits, to_sq, board_size):
             return self.WIN_SCORE - ply
@@ -1294,12 +1305,9 @@ class AiPlayerHard(Player):
         t0 = time.perf_counter()
         score = -self._negamax_bits(
             current_bits=other_bits,
-            current_positions=other_positions,
             other_bits=new_current_bits,
-            other_positions=new_current_positions,
             board_size=board_size,
             depth=depth - 1,
-            extensions_left=extensions_left,
             alpha=-beta,
             beta=-alpha,
             ply=ply + 1,
@@ -1313,19 +1321,24 @@ class AiPlayerHard(Player):
     def _negamax_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size,
         depth,
-        extensions_left,
         alpha,
         beta,
         ply,
         tt,
         path_keys
     ):
-        state_key = (current_bits, other_bits, depth, extensions_left)
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if self._max_nodes is not None and self._nodes >= self._max_nodes:
+            raise SearchTimeout()
+        self._nodes += 1
+        self._prof_inc("nodes")
+
+        state_key = (current_bits, other_bits, depth)
 
         if state_key in path_keys:
             self._prof_inc("repetition_draws")
@@ -1350,39 +1363,33 @@ class AiPlayerHard(Player):
             self._prof_inc("tt_misses")
 
         if depth == 0:
-            if extensions_left > 0 and self._is_sharp_position_bits(
-                current_bits, current_positions, other_bits, other_positions, board_size
-            ):
-                depth = 1
-                extensions_left -= 1
-            else:
-                t0 = time.perf_counter()
-                score = self._evaluate_position_bits(
-                    current_bits, current_positions, other_bits, other_positions, board_size
-                )
-                self._prof_add("_evaluate_position_bits", time.perf_counter() - t0)
+            score = self._quiescence_bits(
+                current_bits, other_bits, board_size, alpha, beta, ply, self.QUIESCENCE_DEPTH
+            )
 
-                tt[state_key] = {
-                    "depth": depth,
-                    "score": score,
-                    "flag": self.TT_FLAG_EXACT,
-                    "best_move": None,
-                }
-                return score
+            flag = self.TT_FLAG_EXACT
+            if score <= orig_alpha:
+                flag = self.TT_FLAG_UPPER
+            elif score >= beta:
+                flag = self.TT_FLAG_LOWER
+
+            tt[state_key] = {
+                "depth": depth,
+                "score": score,
+                "flag": flag,
+                "best_move": None,
+            }
+            return score
 
         tt_move = tt_entry["best_move"] if tt_entry and tt_entry.get("best_move") else None
 
-        t0 = time.perf_counter()
-        moves = self._get_search_moves_bits(
+        moves = self._iter_search_moves_bits(
             current_bits,
-            current_positions,
             other_bits,
-            other_positions,
             board_size,
             tt_move=tt_move,
             ply=ply,
         )
-        self._prof_add("_get_search_moves_bits", time.perf_counter() - t0)
 
         best_score = -float("inf")
         best_move = None
@@ -1392,14 +1399,11 @@ class AiPlayerHard(Player):
             t0 = time.perf_counter()
             score = self._score_move_bits(
                 current_bits=current_bits,
-                current_positions=current_positions,
                 other_bits=other_bits,
-                other_positions=other_positions,
                 from_sq=from_sq,
                 to_sq=to_sq,
                 board_size=board_size,
                 depth=depth,
-                extensions_left=extensions_left,
                 alpha=alpha,
                 beta=beta,
                 ply=ply,
@@ -1417,8 +1421,9 @@ class AiPlayerHard(Player):
 
             if alpha >= beta:
                 self._prof_inc("alpha_beta_cutoffs")
-                self._register_killer_move(ply, (from_sq, to_sq))
-                self._register_history_move((from_sq, to_sq), depth)
+                move_idx = from_sq * self._geometry.num_squares + to_sq
+                self._register_killer_move(ply, move_idx)
+                self._register_history_move(move_idx, depth)
                 break
 
         path_keys.remove(state_key)
@@ -1438,6 +1443,79 @@ class AiPlayerHard(Player):
 
         return best_score
 
+    def _quiescence_bits(
+        self,
+        current_bits,
+        other_bits,
+        board_size,
+        alpha,
+        beta,
+        ply,
+        depth
+    ):
+        """
+        Searches forcing moves only past the horizon, so threats are resolved before a position
+        is scored. A side facing an immediate win must block it; otherwise it may stand pat on
+        the static score or try the moves that create a double threat. Every forcing ply uses
+        up one unit of depth, after which the position is scored as it stands.
+        """
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if self._max_nodes is not None and self._nodes >= self._max_nodes:
+            raise SearchTimeout()
+        self._nodes += 1
+        self._prof_inc("nodes")
+        self._prof_inc("quiescence_nodes")
+
+        if self._get_immediate_win_targets_bits(current_bits, other_bits, board_size):
+            return self.WIN_SCORE - ply
+
+        if self._get_immediate_win_targets_bits(other_bits, current_bits, board_size):
+            moves = self._get_safe_blocking_moves_bits(
+                current_bits, other_bits, board_size
+            )
+            if not moves:
+                # The opponent wins with its next move
+                return -(self.WIN_SCORE - (ply + 1))
+            if depth == 0:
+                return self._evaluate_position_bits(current_bits, other_bits, board_size)
+            best_score = -float("inf")
+        else:
+            t0 = time.perf_counter()
+            stand_pat = self._evaluate_position_bits(
+                current_bits, other_bits, board_size
+            )
+            self._prof_add("_evaluate_position_bits", time.perf_counter() - t0)
+
+            if stand_pat >= beta or depth == 0:
+                return stand_pat
+            if stand_pat + self.QUIESCENCE_DELTA <= alpha:
+                self._prof_inc("delta_prunes")
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            best_score = stand_pat
+
+            moves = self._get_double_threat_moves_bits(
+                current_bits, other_bits, board_size
+            )
+
+        for from_sq, to_sq in moves:
+            new_current_bits = self._apply_move_bits(current_bits, from_sq, to_sq)
+            score = -self._quiescence_bits(
+                other_bits, new_current_bits, board_size, -beta, -alpha, ply + 1, depth - 1
+            )
+
+            if score > best_score:
+                best_score = score
+            if best_score > alpha:
+                alpha = best_score
+            if alpha >= beta:
+                self._prof_inc("alpha_beta_cutoffs")
+                break
+
+        return best_score
+
     # ------------------------------------------------------------------
     # Search move selection
     # ------------------------------------------------------------------
@@ -1445,99 +1523,108 @@ class AiPlayerHard(Player):
     def _get_search_moves_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size,
         tt_move=None,
         ply=0,
     ):
-        winning_moves = self._get_winning_moves_bits(
-            current_bits, current_positions, other_bits, board_size
-        )
-        if winning_moves:
-            return self._order_candidate_moves_bits(
-                winning_moves,
-                current_bits,
-                current_positions,
-                other_bits,
-                other_positions,
-                board_size,
-                tt_move=tt_move,
-                ply=ply,
-            )
-
-        safe_blockers = self._get_safe_blocking_moves_bits(
-            current_bits, current_positions, other_bits, other_positions, board_size
-        )
-        if safe_blockers:
-            return self._order_candidate_moves_bits(
-                safe_blockers,
-                current_bits,
-                current_positions,
-                other_bits,
-                other_positions,
-                board_size,
-                tt_move=tt_move,
-                ply=ply,
-            )
-
-        double_threat_moves = self._get_double_threat_moves_bits(
-            current_bits, current_positions, other_bits, board_size
-        )
-        if double_threat_moves:
-            return self._order_candidate_moves_bits(
-                double_threat_moves,
-                current_bits,
-                current_positions,
-                other_bits,
-                other_positions,
-                board_size,
-                tt_move=tt_move,
-                ply=ply,
-            )
-
-        return self._generate_ordered_moves_bits(
+        return list(self._iter_search_moves_bits(
             current_bits,
-            current_positions,
             other_bits,
-            other_positions,
             board_size,
             tt_move=tt_move,
             ply=ply,
-        )
+        ))
 
-    def _generate_ordered_moves_bits(
+    def _iter_search_moves_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size,
         tt_move=None,
         ply=0,
     ):
-        all_legal = self._get_all_legal_moves_bits(
-            current_bits, current_positions, other_bits, board_size
+        """
+        Yields the moves to search, best first, in stages: the TT move, then the killers,
+        then the rest, scored only once those are exhausted and picked one at a time.
+        A node that cuts off on an early move never generates, scores or orders the others.
+
+        Only the winning moves are searched when there are some; otherwise the safe blocks
+        of an enemy threat, then the moves creating a double threat, then every legal move.
+        The TT move was stored by a search of this same position, so it belongs to that
+        set and is tried before the set is built.
+        """
+        yielded = set()
+        if tt_move is not None:
+            from_sq, to_sq = tt_move
+            occ_bits = current_bits | other_bits
+            if current_bits & (1 << from_sq) and to_sq in self._get_cached_available_moves_bits(
+                occ_bits, from_sq, board_size
+            ):
+                yielded.add(tt_move)
+                yield tt_move
+
+        winning_moves = self._get_winning_moves_bits(
+            current_bits, other_bits, board_size
         )
-        return self._order_candidate_moves_bits(
-            all_legal,
-            current_bits,
-            current_positions,
-            other_bits,
-            other_positions,
-            board_size,
-            tt_move=tt_move,
-            ply=ply,
+        if winning_moves:
+            # Every winning move scores the same, so they need no ordering
+            for move in winning_moves:
+                if move not in yielded:
+                    yield move
+            return
+
+        candidate_moves = self._get_safe_blocking_moves_bits(
+            current_bits, other_bits, board_size
         )
+        if not candidate_moves:
+            candidate_moves = self._get_double_threat_moves_bits(
+                current_bits, other_bits, board_size
+            )
+        if not candidate_moves:
+            candidate_moves = self._get_all_legal_moves_bits(
+                current_bits, other_bits, board_size
+            )
+        if not candidate_moves:
+            return
+
+        if ply < self.MAX_SEARCH_PLY:
+            num_squares = self._geometry.num_squares
+            killer_slot = ply * self.KILLERS_PER_PLY
+            for move_idx in self._killer_moves[killer_slot:killer_slot + self.KILLERS_PER_PLY]:
+                killer = divmod(move_idx, num_squares)
+                if move_idx >= 0 and killer not in yielded and killer in candidate_moves:
+                    yielded.add(killer)
+                    yield killer
+
+        opp_targets_mask = self._get_immediate_win_targets_bits(
+            other_bits, current_bits, board_size
+        )
+        scored = [
+            (self._score_candidate_move_bits(
+                current_bits, other_bits, from_sq, to_sq, board_size, opp_targets_mask
+            ), from_sq, to_sq)
+            for from_sq, to_sq in candidate_moves
+            if (from_sq, to_sq) not in yielded
+        ]
+
+        # Selection rather than a full sort: a cutoff stops the picking early. Taking the
+        # first of equal scores keeps the order a stable sort would give.
+        while scored:
+            best_idx = 0
+            best_score = scored[0][0]
+            for idx in range(1, len(scored)):
+                if scored[idx][0] > best_score:
+                    best_idx = idx
+                    best_score = scored[idx][0]
+            _, from_sq, to_sq = scored.pop(best_idx)
+            yield (from_sq, to_sq)
 
     def _order_candidate_moves_bits(
         self,
         candidate_moves,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size,
         tt_move=None,
         ply=0,
@@ -1546,64 +1633,95 @@ class AiPlayerHard(Player):
             return []
 
         opp_targets_mask = self._get_immediate_win_targets_bits(
-            other_bits, other_positions, current_bits, board_size
+            other_bits, current_bits, board_size
         )
-        center = (board_size - 1) / 2.0
-        killers = self._killer_moves.get(ply, [])
+        num_squares = self._geometry.num_squares
+        if ply < self.MAX_SEARCH_PLY:
+            killer_slot = ply * self.KILLERS_PER_PLY
+            killers = self._killer_moves[killer_slot:killer_slot + self.KILLERS_PER_PLY]
+        else:
+            killers = ()
 
         scored = []
 
         for from_sq, to_sq in candidate_moves:
-            score = 0
-            move = (from_sq, to_sq)
+            score = self._score_candidate_move_bits(
+                current_bits, other_bits, from_sq, to_sq, board_size, opp_targets_mask
+            )
 
-            if tt_move is not None and move == tt_move:
+            if tt_move is not None and (from_sq, to_sq) == tt_move:
                 score += 5_000_000
 
-            if move in killers:
+            if from_sq * num_squares + to_sq in killers:
                 score += 700_000
 
-            score += self._history_heuristic.get(move, 0)
+            scored.append((score, from_sq, to_sq))
 
-            new_current_bits, new_current_positions = self._apply_move_bits(
-                current_bits, current_positions, from_sq, to_sq
-            )
+        scored.sort(reverse=True, key=lambda x: x[0])
+        return [(from_sq, to_sq) for score, from_sq, to_sq in scored]
 
-            if self._is_win_after_move_bits(new_current_bits, to_sq, board_size):
-                score += 2_000_000
+    def _score_candidate_move_bits(
+        self,
+        current_bits,
+        other_bits,
+        from_sq,
+        to_sq,
+        board_size,
+        opp_targets_mask
+    ):
+        score = self._history_heuristic[from_sq * self._geometry.num_squares + to_sq]
 
-            opp_targets_after = self._get_immediate_win_targets_bits(
-                other_bits, other_positions, new_current_bits, board_size
-            )
-            if opp_targets_after == 0:
-                score += 300_000
+        new_current_bits = self._apply_move_bits(
+            current_bits, from_sq, to_sq
+        )
 
-            my_targets_after = self._get_immediate_win_targets_bits(
-                new_current_bits, new_current_positions, other_bits, board_size
-            )
-            score += my_targets_after.bit_count() * 50_000
+        if self._is_win_after_move_bits(new_current_bits, to_sq, board_size):
+            score += 2_000_000
 
-            if opp_targets_mask & (1 << to_sq):
-                score += 20_000
+        opp_targets_after = self._get_immediate_win_targets_bits(
+            other_bits, new_current_bits, board_size
+        )
+        if opp_targets_after == 0:
+            score += 300_000
 
-            r, c = self._sq_to_rc(sq=to_sq, board_size=board_size)
-            score -= int(abs(r - center) + abs(c - center)) * 3
+        my_targets_after = self._get_immediate_win_targets_bits(
+            new_current_bits, other_bits, board_size
+        )
+        score += my_targets_after.bit_count() * 50_000
 
-            scored.append((score, from_sq, to_sq))
+        if opp_targets_mask & (1 << to_sq):
+            score += 20_000
 
-        scored.sort(reverse=True, key=lambda x: x[0])
-        return [(from_sq, to_sq) for score, from_sq, to_sq in scored]
+        score -= int(self._geometry.center_distance[to_sq]) * 3
+
+        return score
+
+    def _register_killer_move(self, ply, move_idx):
+        if ply >= self.MAX_SEARCH_PLY:
+            return
+        # Most recent first: shift the older killers down unless the move is already among them
+        killers = self._killer_moves
+        slot = ply * self.KILLERS_PER_PLY
+        last = slot + self.KILLERS_PER_PLY - 1
+        for idx in range(slot, last):
+            if killers[idx] == move_idx:
+                last = idx
+                break
+        killers[slot + 1:last + 1] = killers[slot:last]
+        killers[slot] = move_idx
 
-    def _register_killer_move(self, ply, move):
-        killers = self._killer_moves.setdefault(ply, [])
-        if move in killers:
-            killers.remove(move)
-        killers.insert(0, move)
-        if len(killers) > 2:
-            killers.pop()
+    def _register_history_move(self, move_idx, depth):
+        self._history_heuristic[move_idx] += depth * depth
 
-    def _register_history_move(self, move, depth):
-        self._history_heuristic[move] = self._history_heuristic.get(move, 0) + depth * depth
+    def _age_move_ordering_tables(self):
+        """
+        Prepares the move-ordering tables for a new search. Killers are tied to plies of the
+        previous search and are dropped, while history scores are decayed so that what was
+        learned carries over to the next move.
+        """
+        self._killer_moves[:] = [-1] * len(self._killer_moves)
+        shift = self.HISTORY_AGING_SHIFT
+        self._history_heuristic[:] = [score >> shift for score in self._history_heuristic]
 
     # ------------------------------------------------------------------
     # Evaluation
@@ -1612,9 +1730,7 @@ class AiPlayerHard(Player):
     def _evaluate_position_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
-        other_positions,
         board_size
     ):
         key = ("eval_bits", current_bits, other_bits)
@@ -1627,10 +1743,10 @@ class AiPlayerHard(Player):
         score = 0
 
         my_win_targets_mask = self._get_immediate_win_targets_bits(
-            current_bits, current_positions, other_bits, board_size
+            current_bits, other_bits, board_size
         )
         opp_win_targets_mask = self._get_immediate_win_targets_bits(
-            other_bits, other_positions, current_bits, board_size
+            other_bits, current_bits, board_size
         )
 
         my_distinct = my_win_targets_mask.bit_count()
@@ -1646,108 +1762,82 @@ class AiPlayerHard(Player):
         if opp_distinct >= 2:
             score -= self.DOUBLE_THREAT_BONUS
 
-        # Boolean versions are cheaper than building full lists here
-        if self._has_double_threat_move_bits(
-            current_bits, current_positions, other_bits, board_size
-        ):
-            score += self.DOUBLE_THREAT_BONUS // 2
-
-        if self._has_double_threat_move_bits(
-            other_bits, other_positions, current_bits, board_size
-        ):
-            score -= self.DOUBLE_THREAT_BONUS // 2
-
-        if self._opponent_has_forced_threat_next_turn_bits(
-            current_bits, current_positions, other_bits, other_positions, board_size
-        ):
-            score -= self.FORCED_THREAT_BONUS
-
-        if self._opponent_has_forced_threat_next_turn_bits(
-            other_bits, other_positions, current_bits, current_positions, board_size
-        ):
-            score += self.FORCED_THREAT_BONUS
-
-        line_windows = self._get_line_windows(board_size)
-
         my_reachable_mask = self._get_reachable_targets_mask_bits(
-            current_bits, current_positions, other_bits, board_size
+            current_bits, other_bits, board_size
         )
         opp_reachable_mask = self._get_reachable_targets_mask_bits(
-            other_bits, other_positions, current_bits, board_size
+            other_bits, current_bits, board_size
         )
 
-        full_mask = (1 << (board_size * board_size)) - 1
-        occ_bits = current_bits | other_bits
-        empty_bits = full_mask ^ occ_bits
-
-        for mask, _ in line_windows:
-            my_count = (current_bits & mask).bit_count()
-            opp_count = (other_bits & mask).bit_count()
-
-            if my_count > 0 and opp_count > 0:
-                continue
-
-            empty_in_window = mask & empty_bits
-            empty_count = empty_in_window.bit_count()
-
-            if opp_count == 0:
-                score += self.LINE_SCORES[my_count]
-                reachable = (empty_in_window & my_reachable_mask).bit_count()
-                score += reachable * self.REACHABLE_EMPTY_BONUS
-                score -= (empty_count - reachable) * self.UNREACHABLE_EMPTY_PENALTY
-
-            elif my_count == 0:
-                score -= self.LINE_SCORES[opp_count]
-                reachable = (empty_in_window & opp_reachable_mask).bit_count()
-                score -= reachable * self.REACHABLE_EMPTY_BONUS
-                score += (empty_count - reachable) * self.UNREACHABLE_EMPTY_PENALTY
+        score += self._score_line_windows_bits(
+            current_bits, other_bits, my_reachable_mask, opp_reachable_mask
+        )
 
-        center = (board_size - 1) / 2.0
+        center_distance = self._geometry.center_distance
         my_center = 0
         opp_center = 0
 
-        for sq in current_positions:
-            r, c = self._sq_to_rc(sq, board_size)
-            my_center -= abs(r - center) + abs(c - center)
-        for sq in other_positions:
-            r, c = self._sq_to_rc(sq, board_size)
-            opp_center -= abs(r - center) + abs(c - center)
+        for sq in self._iter_bits(current_bits):
+            my_center -= center_distance[sq]
+        for sq in self._iter_bits(other_bits):
+            opp_center -= center_distance[sq]
 
         score += int((my_center - opp_center) * self.CENTER_WEIGHT)
 
         self._eval_cache[key] = score
         return score
 
-    # ------------------------------------------------------------------
-    # Sharp state detection
-    # ------------------------------------------------------------------
-
-    def _is_sharp_position_bits(
-        self,
-        current_bits,
-        current_positions,
-        other_bits,
-        other_positions,
-        board_size
-    ):
-        key = ("sharp_bits", current_bits, other_bits)
-        cached = self._tactical_cache.get(key)
-        if cached is not None:
-            return cached
+    def _score_line_windows_bits(self, current_bits, other_bits, my_reachable_mask, opp_reachable_mask):
+        """
+        Scores the windows held by one side only: by the number of its pieces in them, plus a bonus
+        for every empty square the side can reach and a penalty for every other empty square. The
+        windows of each axis are counted together with bit-sliced counters over shifted bitboards.
 
-        result = False
+        Returns:
+            int: The score from the current side's point of view.
+        """
+        line_scores = self._line_scores
+        win_condition = len(line_scores) - 1
+        occ_bits = current_bits | other_bits
+        empty_bits = self._geometry.full_mask ^ occ_bits
+        my_reachable_empty = empty_bits & my_reachable_mask
+        opp_reachable_empty = empty_bits & opp_reachable_mask
+        empty_weight = self.UNREACHABLE_EMPTY_PENALTY
+        reachable_weight = self.REACHABLE_EMPTY_BONUS + self.UNREACHABLE_EMPTY_PENALTY
+        score = 0
 
-        if self._get_immediate_win_targets_bits(current_bits, current_positions, other_bits, board_size):
-            result = True
-        elif self._get_immediate_win_targets_bits(other_bits, other_positions, current_bits, board_size):
-            result = True
-        elif self._has_open_three_window_bits(current_bits, other_bits, board_size):
-            result = True
-        elif self._has_open_three_window_bits(other_bits, current_bits, board_size):
-            result = True
+        for starts_mask, shifts in self._geometry.line_shifts:
+            # counts[k]: the windows with exactly k occupied squares. In a window held by one
+            # side these are all its pieces, so one counter serves both sides.
+            counts = [starts_mask] + [0] * win_condition
+            my_blocked = 0
+            opp_blocked = 0
+            for filled, shift in enumerate(shifts, 1):
+                occ_row = occ_bits >> shift
+                for count in range(filled, 0, -1):
+                    counts[count] = (counts[count] & ~occ_row) | (counts[count - 1] & occ_row)
+                counts[0] &= ~occ_row
+                my_blocked |= other_bits >> shift
+                opp_blocked |= current_bits >> shift
+
+            # Windows without enemy pieces count for the current side, even when empty
+            my_windows = starts_mask & ~my_blocked
+            opp_windows = starts_mask & ~opp_blocked & my_blocked
+
+            for count in range(win_condition):
+                windows = counts[count]
+                balance = (windows & my_windows).bit_count() - (windows & opp_windows).bit_count()
+                if balance:
+                    score += balance * (line_scores[count] - (win_condition - count) * empty_weight)
+
+            for shift in shifts:
+                balance = (
+                    (my_windows & (my_reachable_empty >> shift)).bit_count()
+                    - (opp_windows & (opp_reachable_empty >> shift)).bit_count()
+                )
+                score += balance * reachable_weight
 
-        self._tactical_cache[key] = result
-        return result
+        return score
 
     # ------------------------------------------------------------------
     # Tactical helpers
@@ -1756,7 +1846,6 @@ class AiPlayerHard(Player):
     def _get_winning_moves_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         board_size
     ):
@@ -1769,14 +1858,14 @@ class AiPlayerHard(Player):
         self._prof_inc("winning_moves_cache_misses")
 
         targets_mask = self._get_immediate_win_targets_bits(
-            current_bits, current_positions, other_bits, board_size
+            current_bits, other_bits, board_size
         )
 
         moves = []
         for target_sq in self._iter_bits(targets_mask):
             moves.extend(
                 self._get_moves_to_target_bits(
-                    current_bits, current_positions, other_bits, target_sq, board_size
+                    current_bits, other_bits, target_sq, board_size
                 )
             )
 
@@ -1786,9 +1875,7 @@ class AiPlayerHard(Player):
     def _get_safe_blocking_moves_bits(
         self,
         my_bits,
-        my_positions,
         opp_bits,
-        opp_positions,
         board_size
     ):
         key = ("safe_blockers_bits", my_bits, opp_bits)
@@ -1800,7 +1887,7 @@ class AiPlayerHard(Player):
         self._prof_inc("safe_blockers_cache_misses")
 
         opp_targets_mask = self._get_immediate_win_targets_bits(
-            opp_bits, opp_positions, my_bits, board_size
+            opp_bits, my_bits, board_size
         )
 
         if opp_targets_mask == 0:
@@ -1813,14 +1900,14 @@ class AiPlayerHard(Player):
         seen = set()
 
         for target_sq in self._iter_bits(opp_targets_mask):
-            for from_sq, to_sq in self._get_moves_to_target_bits(my_bits, my_positions, opp_bits, target_sq, board_size):
+            for from_sq, to_sq in self._get_moves_to_target_bits(my_bits, opp_bits, target_sq, board_size):
                 move = (from_sq, to_sq)
                 if move not in seen:
                     seen.add(move)
                     candidate_moves.append(move)
 
         # Fallback to all legal if needed to preserve logic breadth
-        all_legal = self._get_all_legal_moves_bits(my_bits, my_positions, opp_bits, board_size)
+        all_legal = self._get_all_legal_moves_bits(my_bits, opp_bits, board_size)
         for move in all_legal:
             if move not in seen:
                 seen.add(move)
@@ -1828,10 +1915,10 @@ class AiPlayerHard(Player):
 
         safe_moves = []
         for from_sq, to_sq in candidate_moves:
-            new_my_bits, _ = self._apply_move_bits(my_bits, my_positions, from_sq, to_sq)
+            new_my_bits = self._apply_move_bits(my_bits, from_sq, to_sq)
 
             opp_targets_after = self._get_immediate_win_targets_bits(
-                opp_bits, opp_positions, new_my_bits, board_size
+                opp_bits, new_my_bits, board_size
             )
 
             if opp_targets_after == 0:
@@ -1843,7 +1930,6 @@ class AiPlayerHard(Player):
     def _get_double_threat_moves_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         board_size
     ):
@@ -1856,21 +1942,24 @@ class AiPlayerHard(Player):
         self._prof_inc("double_threat_moves_cache_misses")
 
         all_legal = self._get_all_legal_moves_bits(
-            current_bits, current_positions, other_bits, board_size
+            current_bits, other_bits, board_size
         )
+        threat_index = self._get_threat_index_bits(current_bits, other_bits)
 
         moves = []
         for from_sq, to_sq in all_legal:
-            new_current_bits, new_current_positions = self._apply_move_bits(
-                current_bits, current_positions, from_sq, to_sq
-            )
+            new_current_bits = self._apply_move_bits(current_bits, from_sq, to_sq)
 
             if self._is_win_after_move_bits(new_current_bits, to_sq, board_size):
                 moves.append((from_sq, to_sq))
                 continue
 
+            # A move that cannot leave two lines one piece short cannot leave two threats
+            if self._get_threat_squares_after_move_bits(threat_index, from_sq, to_sq).bit_count() < 2:
+                continue
+
             targets_after = self._get_immediate_win_targets_bits(
-                new_current_bits, new_current_positions, other_bits, board_size
+                new_current_bits, other_bits, board_size
             )
 
             if targets_after.bit_count() >= 2:
@@ -1879,107 +1968,101 @@ class AiPlayerHard(Player):
         self._tactical_cache[key] = moves
         return moves
 
-    def _has_double_threat_move_bits(
-        self,
-        current_bits,
-        current_positions,
-        other_bits,
-        board_size
-    ):
-        key = ("has_double_threat_bits", current_bits, other_bits)
-        cached = self._tactical_cache.get(key)
-        if cached is not None:
-            self._prof_inc("has_double_threat_cache_hits")
-            return cached
-
-        self._prof_inc("has_double_threat_cache_misses")
-
-        all_legal = self._get_all_legal_moves_bits(
-            current_bits, current_positions, other_bits, board_size
-        )
-
-        for from_sq, to_sq in all_legal:
-            new_current_bits, new_current_positions = self._apply_move_bits(
-                current_bits, current_positions, from_sq, to_sq
-            )
-
-            if self._is_win_after_move_bits(new_current_bits, to_sq, board_size):
-                self._tactical_cache[key] = True
-                return True
-
-            targets_after = self._get_immediate_win_targets_bits(
-                new_current_bits, new_current_positions, other_bits, board_size
-            )
-
-            if targets_after.bit_count() >= 2:
-                self._tactical_cache[key] = True
-                return True
-
-        self._tactical_cache[key] = False
-        return False
+    def _get_threat_index_bits(self, current_bits, other_bits):
+        """
+        Indexes by square the windows free of enemy pieces that a single move can turn into
+        threats: those one piece short, those two pieces short and those already full. A move
+        only changes the windows through its from and to squares, so these maps are all it
+        needs to look at; the near windows it leaves alone are summarized by one mask.
 
-    def _opponent_has_forced_threat_next_turn_bits(
-        self,
-        current_bits,
-        current_positions,
-        other_bits,
-        other_positions,
-        board_size
-    ):
-        key = ("forced_bits", current_bits, other_bits)
+        Returns:
+            tuple: (near_by_sq, near_targets_mask, near_target_counts, two_short_by_sq,
+            full_by_sq) where near_by_sq maps a square to the (window_mask, empty_sq) pairs
+            of the windows one piece short through it, near_targets_mask has the empty
+            squares of all those windows and near_target_counts how many windows each of
+            them completes, two_short_by_sq maps a square to the (window_mask,
+            other_empty_bit) pairs of the windows two pieces short it is empty in, and
+            full_by_sq maps a square to the masks of the full windows through it.
+        """
+        key = ("threat_index_bits", current_bits, other_bits)
         cached = self._tactical_cache.get(key)
         if cached is not None:
-            self._prof_inc("forced_cache_hits")
+            self._prof_inc("threat_index_cache_hits")
             return cached
 
-        self._prof_inc("forced_cache_misses")
-
-        result = self._has_forcing_move_bits(
-            other_bits, other_positions, current_bits, current_positions, board_size
-        )
-
-        self._tactical_cache[key] = result
-        return result
+        self._prof_inc("threat_index_cache_misses")
 
-    def _has_forcing_move_bits(
-        self,
-        current_bits,
-        current_positions,
-        other_bits,
-        other_positions,
-        board_size
-    ):
-        if self._has_winning_move_bits(current_bits, current_positions, other_bits, board_size):
-            return True
+        win_condition = self._geometry.win_condition
+        near_by_sq = {}
+        near_targets_mask = 0
+        near_target_counts = {}
+        two_short_by_sq = {}
+        full_by_sq = {}
 
-        return self._has_double_threat_move_bits(
-            current_bits, current_positions, other_bits, board_size
-        )
+        for mask, sqs in self._geometry.line_windows:
+            if mask & other_bits:
+                continue
+            count = (mask & current_bits).bit_count()
+            if count == win_condition - 1:
+                empty_sq = self._first_bit(mask & ~current_bits)
+                near_targets_mask |= (1 << empty_sq)
+                near_target_counts[empty_sq] = near_target_counts.get(empty_sq, 0) + 1
+                for sq in sqs:
+                    near_by_sq.setdefault(sq, []).append((mask, empty_sq))
+            elif count == win_condition - 2:
+                empty_mask = mask & ~current_bits
+                first_bit = empty_mask & -empty_mask
+                second_bit = empty_mask ^ first_bit
+                two_short_by_sq.setdefault(first_bit.bit_length() - 1, []).append((mask, second_bit))
+                two_short_by_sq.setdefault(second_bit.bit_length() - 1, []).append((mask, first_bit))
+            elif count == win_condition:
+                for sq in sqs:
+                    full_by_sq.setdefault(sq, []).append(mask)
 
-    def _has_winning_move_bits(
-        self,
-        current_bits,
-        current_positions,
-        other_bits,
-        board_size
-    ):
-        return self._get_immediate_win_targets_bits(
-            current_bits, current_positions, other_bits, board_size
-        ) != 0
+        index = (near_by_sq, near_targets_mask, near_target_counts, two_short_by_sq, full_by_sq)
+        self._tactical_cache[key] = index
+        return index
 
-    def _has_open_three_window_bits(self, current_bits, other_bits, board_size):
-        line_windows = self._get_line_windows(board_size)
+    def _get_threat_squares_after_move_bits(self, threat_index, from_sq, to_sq):
+        """
+        Returns the empty squares of the windows left one piece short by a move. Only the
+        windows through its from and to squares are visited; the others keep their targets,
+        which come from the index's mask. These are the only squares that can be
+        immediate win targets after the move; whether a piece can reach them is not checked.
+        """
+        near_by_sq, near_targets_mask, near_target_counts, two_short_by_sq, full_by_sq = threat_index
+        from_bit = 1 << from_sq
+        squares = near_targets_mask
+
+        # Every near window through either square stops being one piece short as it was, so
+        # its empty square stays a target only if an untouched window still needs it
+        touched_counts = {}
+        for mask, empty_sq in near_by_sq.get(from_sq, ()):
+            touched_counts[empty_sq] = touched_counts.get(empty_sq, 0) + 1
+        for mask, empty_sq in near_by_sq.get(to_sq, ()):
+            if not mask & from_bit:
+                touched_counts[empty_sq] = touched_counts.get(empty_sq, 0) + 1
+        for empty_sq, touched in touched_counts.items():
+            if touched == near_target_counts[empty_sq]:
+                squares &= ~(1 << empty_sq)
+
+        # The piece moves inside a near window, leaving its from square empty instead
+        for mask, empty_sq in near_by_sq.get(from_sq, ()):
+            if empty_sq == to_sq:
+                squares |= from_bit
+                break
 
-        for mask, _ in line_windows:
-            my_count = (current_bits & mask).bit_count()
-            opp_count = (other_bits & mask).bit_count()
+        for mask, other_empty_bit in two_short_by_sq.get(to_sq, ()):
+            if not mask & from_bit:
+                squares |= other_empty_bit
 
-            if opp_count == 0 and my_count >= 3:
-                return True
-            if my_count == 0 and opp_count >= 3:
-                return True
+        to_bit = 1 << to_sq
+        for mask in full_by_sq.get(from_sq, ()):
+            if not mask & to_bit:
+                squares |= from_bit
+                break
 
-        return False
+        return squares
 
     # ------------------------------------------------------------------
     # Immediate win targets / reachability
@@ -1988,7 +2071,6 @@ class AiPlayerHard(Player):
     def _get_immediate_win_targets_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         board_size
     ):
@@ -2000,34 +2082,39 @@ class AiPlayerHard(Player):
 
         self._prof_inc("win_targets_cache_misses")
 
-        occ_bits = current_bits | other_bits
+        geometry = self._geometry
         result_mask = 0
 
-        for full_mask, sqs in self._get_line_windows(board_size):
-            # Blocked by opponent
-            if full_mask & other_bits:
+        for (starts_mask, shifts), (forward_ray, backward_ray) in zip(geometry.line_shifts, LINE_AXIS_RAYS):
+            _, near = self._get_window_fill_bits(current_bits, other_bits, starts_mask, shifts)
+            if not near:
                 continue
 
-            my_count = (full_mask & current_bits).bit_count()
-            if my_count != WIN_CONDITION - 1:
-                continue
-
-            empty_mask = full_mask & ~occ_bits
-            if empty_mask == 0:
-                continue
-
-            target_sq = self._first_bit(empty_mask)
-            if target_sq is None:
-                continue
-
-            other_mask = full_mask & ~(1 << target_sq)
-            movers_mask = self._get_movers_to_target_bits(
-                current_bits, other_bits, target_sq, board_size
-            )
-
-            # Need a mover that is not already one of the 3 occupied squares in the line.
-            if movers_mask & ~other_mask:
-                result_mask |= (1 << target_sq)
+            # The missing square of every window, and those missing at either end
+            targets = 0
+            for shift in shifts:
+                targets |= (near & ~(current_bits >> shift)) << shift
+            first_targets = near & ~current_bits
+            last_shift = shifts[-1]
+            last_targets = (near & ~(current_bits >> last_shift)) << last_shift
+
+            for target_sq in self._iter_bits(targets & ~result_mask):
+                movers_mask = self._get_movers_to_target_bits(
+                    current_bits, other_bits, target_sq, board_size
+                )
+                ray_masks = geometry.ray_masks[target_sq]
+                forward_mask = ray_masks[forward_ray]
+                backward_mask = ray_masks[backward_ray]
+                target_bit = 1 << target_sq
+
+                # Need a mover that is not one of the pieces in the line. Off the axis it never is;
+                # on the axis, only the piece beyond an end of the window is outside it.
+                if (
+                    movers_mask & ~(forward_mask | backward_mask)
+                    or (last_targets & target_bit and movers_mask & forward_mask)
+                    or (first_targets & target_bit and movers_mask & backward_mask)
+                ):
+                    result_mask |= target_bit
 
         self._tactical_cache[key] = result_mask
         return result_mask
@@ -2053,7 +2140,7 @@ class AiPlayerHard(Player):
             return 0
 
         movers = 0
-        rays = self._rays_cache[board_size][target_sq]
+        rays = self._geometry.rays[target_sq]
 
         for ray in rays:
             for sq in ray:
@@ -2069,7 +2156,6 @@ class AiPlayerHard(Player):
     def _get_reachable_targets_mask_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         board_size
     ):
@@ -2081,22 +2167,38 @@ class AiPlayerHard(Player):
 
         self._prof_inc("reachmask_cache_misses")
 
-        occ_bits = current_bits | other_bits
-        mask = 0
-
-        # This keeps the same meaning as before: all currently reachable empty targets.
-        for from_sq in current_positions:
-            moves = self._get_cached_available_moves_bits(occ_bits, from_sq, board_size)
-            for target_sq in moves:
-                mask |= (1 << target_sq)
+        empty_bits = self._geometry.full_mask ^ (current_bits | other_bits)
+        mask = self._get_slide_targets_bits(current_bits, empty_bits)
 
         self._tactical_cache[key] = mask
         return mask
 
+    def _get_slide_targets_bits(self, piece_bits, empty_bits):
+        """
+        Returns every empty square that some piece can slide to, for all the pieces at once.
+        Each direction is an occluded (Kogge-Stone) fill: the pieces are smeared over the empty
+        squares in doubling steps, so a direction costs log2(board_size) shifts regardless of
+        how many pieces there are.
+        """
+        targets = 0
+        for shift, fill_shifts, entry_mask in self._geometry.slide_shifts:
+            gen = piece_bits
+            pro = empty_bits & entry_mask
+            if shift > 0:
+                for fill_shift in fill_shifts:
+                    gen |= pro & (gen << fill_shift)
+                    pro &= pro << fill_shift
+                targets |= (gen << shift) & entry_mask & empty_bits
+            else:
+                for fill_shift in fill_shifts:
+                    gen |= pro & (gen >> -fill_shift)
+                    pro &= pro >> -fill_shift
+                targets |= (gen >> -shift) & entry_mask & empty_bits
+        return targets
+
     def _get_moves_to_target_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         target_sq,
         board_size
@@ -2113,7 +2215,6 @@ class AiPlayerHard(Player):
     def _get_all_legal_moves_bits(
         self,
         current_bits,
-        current_positions,
         other_bits,
         board_size
     ):
@@ -2128,7 +2229,7 @@ class AiPlayerHard(Player):
         occ_bits = current_bits | other_bits
         moves = []
 
-        for from_sq in current_positions:
+        for from_sq in self._iter_bits(current_bits):
             available = self._get_cached_available_moves_bits(occ_bits, from_sq, board_size)
             for to_sq in available:
                 moves.append((from_sq, to_sq))
@@ -2152,182 +2253,26 @@ class AiPlayerHard(Player):
         self._move_cache[key] = moves
         return moves
 
-    def _fast_available_moves_bits(self, occ_bits, sq, board_size):
-        moves = []
-        rays = self._rays_cache[board_size][sq]
-
-        for ray in rays:
-            for target_sq in ray:
-                if occ_bits & (1 << target_sq):
-                    break
-                moves.append(target_sq)
-
-        return moves
-
-    # ------------------------------------------------------------------
-    # Bit helpers
-    # ------------------------------------------------------------------
-
-    def _iter_bits(self, bits):
-        while bits:
-            lsb = bits & -bits
-            yield lsb.bit_length() - 1
-            bits ^= lsb
-
-    def _first_bit(self, bits):
-        if bits == 0:
-            return None
-        return (bits & -bits).bit_length() - 1
-
     # ------------------------------------------------------------------
-    # Apply / replace / win
+    # Apply
     # ------------------------------------------------------------------
 
-    def _apply_move_bits(self, bits, positions, from_sq, to_sq):
-        new_bits = bits ^ (1 << from_sq) ^ (1 << to_sq)
-        new_positions = self._replace_sq_in_positions(positions, from_sq, to_sq)
-        return new_bits, new_positions
-
-    def _replace_sq_in_positions(self, positions, from_sq, to_sq):
-        # Keep normalized tuple order for caching consistency.
-        return tuple(sorted(to_sq if sq == from_sq else sq for sq in positions))
-
-    def _is_win_after_move_bits(self, bits, to_sq, board_size):
-        for full_mask, _ in self._get_windows_by_sq(board_size)[to_sq]:
-            if (bits & full_mask) == full_mask:
-                return True
-        return False
-
-    # ------------------------------------------------------------------
-    # Board conversion
-    # ------------------------------------------------------------------
-
-    def _board_to_bitboards(self, board, board_size):
-        white_bits = 0
-        black_bits = 0
-        white_positions = []
-        black_positions = []
-
-        for r in range(board_size):
-            for c in range(board_size):
-                sq = self._rc_to_sq(r, c, board_size)
-                cell = board[r][c]
-                if cell == PieceType.WHITE:
-                    white_bits |= (1 << sq)
-                    white_positions.append(sq)
-                elif cell == PieceType.BLACK:
-                    black_bits |= (1 << sq)
-                    black_positions.append(sq)
-
-        return white_bits, black_bits, tuple(sorted(white_positions)), tuple(sorted(black_positions))
-
-    def _rc_to_sq(self, r, c, board_size):
-        if board_size not in self._rc_to_sq_cache:
-            self._rc_to_sq_cache[board_size] = {
-                (rr, cc): rr * board_size + cc
-                for rr in range(board_size)
-                for cc in range(board_size)
-            }
-        return self._rc_to_sq_cache[board_size][(r, c)]
-
-    def _sq_to_rc(self, sq, board_size):
-        if board_size not in self._sq_to_rc_cache:
-            self._sq_to_rc_cache[board_size] = {
-                rr * board_size + cc: (rr, cc)
-                for rr in range(board_size)
-                for cc in range(board_size)
-            }
-        return self._sq_to_rc_cache[board_size][sq]
+    def _apply_move_bits(self, bits, from_sq, to_sq):
+        return bits ^ (1 << from_sq) ^ (1 << to_sq)
 
     # ------------------------------------------------------------------
-    # Geometry / precompute
+    # Geometry
     # ------------------------------------------------------------------
 
     def _ensure_precomputed(self, board_size):
-        if board_size not in self._rays_cache:
-            self._rays_cache[board_size] = self._build_rays_bits(board_size)
-
-        cache_key = (board_size, WIN_CONDITION)
-        if cache_key not in self._line_cache:
-            self._get_line_windows(board_size)
-
-        if cache_key not in self._windows_by_sq_cache:
-            self._get_windows_by_sq(board_size)
-
-    def _build_rays_bits(self, board_size):
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),
-            (-1, 1), (1, -1), (-1, -1), (1, 1),
-        ]
-        rays = {}
-        for r in range(board_size):
-            for c in range(board_size):
-                sq = self._rc_to_sq(r, c, board_size)
-                piece_rays = []
-                for dr, dc in directions:
-                    ray = []
-                    rr, cc = r + dr, c + dc
-                    while 0 <= rr < board_size and 0 <= cc < board_size:
-                        ray.append(self._rc_to_sq(rr, cc, board_size))
-                        rr += dr
-                        cc += dc
-                    piece_rays.append(ray)
-                rays[sq] = piece_rays
-        return rays
-
-    def _get_line_windows(self, board_size):
-        cache_key = (board_size, WIN_CONDITION)
-        if cache_key in self._line_cache:
-            return self._line_cache[cache_key]
-
-        windows = []
-
-        for r in range(board_size):
-            for c in range(board_size - WIN_CONDITION + 1):
-                sqs = tuple(self._rc_to_sq(r, c + i, board_size) for i in range(WIN_CONDITION))
-                mask = 0
-                for sq in sqs:
-                    mask |= (1 << sq)
-                windows.append((mask, sqs))
-
-        for c in range(board_size):
-            for r in range(board_size - WIN_CONDITION + 1):
-                sqs = tuple(self._rc_to_sq(r + i, c, board_size) for i in range(WIN_CONDITION))
-                mask = 0
-                for sq in sqs:
-                    mask |= (1 << sq)
-                windows.append((mask, sqs))
-
-        for r in range(board_size - WIN_CONDITION + 1):
-            for c in range(board_size - WIN_CONDITION + 1):
-                sqs = tuple(self._rc_to_sq(r + i, c + i, board_size) for i in range(WIN_CONDITION))
-                mask = 0
-                for sq in sqs:
-                    mask |= (1 << sq)
-                windows.append((mask, sqs))
-
-        for r in range(board_size - WIN_CONDITION + 1):
-            for c in range(WIN_CONDITION - 1, board_size):
-                sqs = tuple(self._rc_to_sq(r + i, c - i, board_size) for i in range(WIN_CONDITION))
-                mask = 0
-                for sq in sqs:
-                    mask |= (1 << sq)
-                windows.append((mask, sqs))
-
-        self._line_cache[cache_key] = windows
-        return windows
-
-    def _get_windows_by_sq(self, board_size):
-        cache_key = (board_size, WIN_CONDITION)
-        cached = self._windows_by_sq_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        mapping = {sq: [] for sq in range(board_size * board_size)}
-        for full_mask, sqs in self._get_line_windows(board_size):
-            for target_sq in sqs:
-                other_mask = full_mask & ~(1 << target_sq)
-                mapping[target_sq].append((full_mask, other_mask))
-
-        self._windows_by_sq_cache[cache_key] = mapping
-        return mapping
\ No newline at end of file
+        super()._ensure_precomputed(board_size)
+        num_moves = self._geometry.num_squares * self._geometry.num_squares
+        if len(self._history_heuristic) != num_moves:
+            self._history_heuristic = [0] * num_moves
+        win_condition = self._geometry.win_condition
+        if len(self._line_scores) != win_condition + 1:
+            # Indexed by the number of own pieces in an uncontested window
+            self._line_scores = tuple(
+                self.LINE_SCORES_BY_MISSING.get(win_condition - count, 0) if count else 0
+                for count in range(win_condition + 1)
+            )
@@ -1,3 +1,6 @@
+from utils import WIN_CONDITION, AI_TIME_LIMIT
+from telemetry import TELEMETRY_FILE_PATH
+
 class SettingsModel:
     """
     A class to manage game settings.
@@ -9,6 +12,13 @@ class SettingsModel:
         """
         self.settings = {
             'board_size': 5,
+            'win_condition': WIN_CONDITION,
+            'ai_time_limit': AI_TIME_LIMIT,
+            'ai_max_nodes': None,
+            'ai_seed': None,
+            'board_renderer': 'widgets',
+            'sound_enabled': True,
+            'telemetry_path': TELEMETRY_FILE_PATH,
             'difficulty': ['Easy', 'Easy'],
             'num_human_players': 1,
             'is_starting': True,
@@ -0,0 +1,93 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from collections import deque
+from logger import RecordQueueHandler
+
+TELEMETRY_FILE_PATH = '4Queens_telemetry.jsonl'
+TELEMETRY_MAX_BYTES = 5 * 1024 * 1024
+TELEMETRY_BACKUP_COUNT = 3
+# Number of recent records kept in memory
+TELEMETRY_RING_SIZE = 1000
+
+class _JsonLinesFormatter(logging.Formatter):
+    """
+    Formats a record whose message is a dict as a single line of JSON.
+    """
+
+    def format(self, record):
+        return json.dumps(record.msg, separators=(',', ':'))
+
+class MoveTelemetry:
+    """
+    Collects one structured record per move. Records are kept in an in-memory ring buffer
+    and, when a path is given, appended as JSON Lines to a rotating file by a background
+    thread, so recording a move costs the game loop only a dict and a queue put.
+    """
+
+    def __init__(self, path=TELEMETRY_FILE_PATH, ring_size=TELEMETRY_RING_SIZE):
+        """
+        Initializes the MoveTelemetry.
+
+        Args:
+            path (str, optional): The JSON Lines file to write, or None to keep records in memory only.
+            ring_size (int): The number of recent records kept in memory.
+        """
+        self._records = deque(maxlen=ring_size)
+        self._listener = None
+        self._logger = logging.getLogger('telemetry.moves')
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        if path:
+            self._start_writer(path)
+
+    def record_move(self, **fields):
+        """
+        Records a move.
+
+        Args:
+            **fields: The values of the record. They must be JSON serializable.
+        """
+        record = {"timestamp": time.time()}
+        record.update(fields)
+        self._records.append(record)
+        if self._listener is not None:
+            self._logger.info(record)
+
+    def recent_records(self):
+        """
+        Returns the records kept in memory, oldest first.
+
+        Returns:
+            list: The recent records.
+        """
+        return list(self._records)
+
+    def close(self):
+        """
+        Writes out the pending records and stops the background writer.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _start_writer(self, path):
+        """
+        Starts the background thread that appends records to a rotating file.
+
+        Args:
+            path (str): The JSON Lines file to write.
+        """
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=TELEMETRY_MAX_BYTES, backupCount=TELEMETRY_BACKUP_COUNT, delay=True
+        )
+        file_handler.setFormatter(_JsonLinesFormatter())
+
+        record_queue = queue.SimpleQueue()
+        self._logger.addHandler(RecordQueueHandler(record_queue))
+        self._listener = logging.handlers.QueueListener(record_queue, file_handler)
+        self._listener.start()
+        atexit.register(self.close)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The game runs from the repository root, so the tests import its modules the same way
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
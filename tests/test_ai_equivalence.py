@@ -0,0 +1,50 @@
+"""
+Regression test for the bitboard Easy and Medium engines: for a given seed they must pick
+the same move as the original engines that mutated a list-of-lists board. The expected
+moves were recorded from those engines, with `random.seed(seed)` before each move.
+"""
+import pytest
+
+from models.board import Board
+from models.player import AiPlayerEasy, AiPlayerMedium
+from utils import PieceType, PlayerType
+
+BOARD_SIZE = 5
+
+# (engine, piece to move, white squares, black squares, seed, expected from, expected to),
+# with squares numbered row * BOARD_SIZE + col. For each engine and side there is a position
+# where the enemy threatens to win, a quiet one and one with a winning move.
+CASES = [
+    (AiPlayerEasy, PieceType.BLACK, [0, 8, 11, 16, 19, 20], [1, 5, 7, 14, 15, 21], 399253, (1, 2), (2, 2)),
+    (AiPlayerEasy, PieceType.BLACK, [2, 5, 6, 13, 19, 24], [1, 3, 11, 12, 17, 18], 598845, (3, 3), (4, 2)),
+    (AiPlayerEasy, PieceType.BLACK, [2, 4, 5, 9, 10, 20], [1, 15, 17, 18, 22, 23], 248865, (4, 2), (3, 1)),
+    (AiPlayerEasy, PieceType.WHITE, [0, 4, 14, 19, 20, 22], [5, 6, 15, 16, 18, 21], 190493, (4, 2), (3, 2)),
+    (AiPlayerEasy, PieceType.WHITE, [0, 3, 6, 7, 17, 18], [2, 5, 8, 12, 13, 15], 647942, (1, 1), (3, 1)),
+    (AiPlayerEasy, PieceType.WHITE, [0, 11, 12, 17, 23, 24], [7, 13, 15, 20, 21, 22], 124802, (0, 0), (1, 0)),
+    (AiPlayerMedium, PieceType.BLACK, [7, 11, 14, 16, 21, 24], [3, 8, 9, 19, 20, 22], 38410, (1, 3), (2, 2)),
+    (AiPlayerMedium, PieceType.BLACK, [0, 9, 10, 16, 19, 22], [4, 11, 14, 17, 18, 24], 719043, (2, 4), (0, 2)),
+    (AiPlayerMedium, PieceType.BLACK, [1, 9, 11, 18, 22, 24], [4, 8, 12, 15, 17, 23], 681251, (3, 0), (3, 1)),
+    (AiPlayerMedium, PieceType.WHITE, [5, 10, 14, 15, 16, 19], [2, 6, 8, 9, 18, 20], 861987, (3, 0), (1, 2)),
+    (AiPlayerMedium, PieceType.WHITE, [2, 6, 10, 13, 16, 19], [4, 8, 11, 14, 18, 21], 719287, (1, 1), (2, 2)),
+    (AiPlayerMedium, PieceType.WHITE, [5, 11, 13, 14, 20, 23], [2, 4, 8, 10, 16, 21], 982915, (2, 3), (3, 2)),
+]
+
+def to_cell(sq):
+    return divmod(sq, BOARD_SIZE)
+
+@pytest.mark.parametrize("player_class, piece_type, white_squares, black_squares, seed, expected_from, expected_to", CASES)
+def test_engine_picks_the_original_move(player_class, piece_type, white_squares, black_squares, seed, expected_from, expected_to):
+    board = Board(BOARD_SIZE)
+    for sq in white_squares:
+        board.set_piece(*to_cell(sq), PieceType.WHITE)
+    for sq in black_squares:
+        board.set_piece(*to_cell(sq), PieceType.BLACK)
+
+    own_squares, other_squares = (white_squares, black_squares) if piece_type is PieceType.WHITE else (black_squares, white_squares)
+    player = player_class("ai", PlayerType.AI, "test", piece_type, "", seed=seed)
+    for sq in own_squares:
+        player.init_positions(to_cell(sq))
+
+    move = player.make_move(board, [to_cell(sq) for sq in other_squares], BOARD_SIZE)
+
+    assert (move["from"], move["to"]) == (expected_from, expected_to)
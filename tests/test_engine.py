@@ -0,0 +1,62 @@
+from models.engine import Engine
+
+def fill_caches(engine):
+    engine.eval_cache[("eval_bits", 1, 2)] = 0
+    engine.move_cache[("moves_bits", 3, 0)] = (1, 2)
+    engine.tactical_cache[("win_targets_bits", 1, 2)] = 0
+    engine.transposition_table[(1, 2, 3)] = {"depth": 3, "score": 0, "flag": 0, "best_move": None}
+
+def test_caches_are_cleared_when_the_board_size_changes():
+    engine = Engine(win_condition=4)
+    engine.begin_move(5)
+    fill_caches(engine)
+
+    engine.begin_move(5)
+    assert engine.cache_size == 4
+
+    geometry = engine.begin_move(6)
+    assert geometry.board_size == 6
+    assert engine.cache_size == 0
+
+def test_caches_stay_within_the_budget_while_storing():
+    engine = Engine(win_condition=4, max_cache_entries=10)
+    engine.begin_move(5)
+
+    for key in range(25):
+        engine.tactical_cache[("win_targets_bits", key, 0)] = key
+        engine.transposition_table[(key, 0, 1)] = {"depth": 1, "score": key, "flag": 0, "best_move": None}
+        assert engine.cache_size <= 10
+
+def test_overwriting_an_entry_does_not_clear_a_full_engine():
+    engine = Engine(win_condition=4, max_cache_entries=4)
+    engine.begin_move(5)
+    fill_caches(engine)
+
+    engine.transposition_table[(1, 2, 3)] = {"depth": 3, "score": 5, "flag": 0, "best_move": None}
+
+    assert engine.cache_size == 4
+
+def test_transposition_table_survives_an_eval_cache_overflow():
+    engine = Engine(win_condition=4, max_cache_entries=10)
+    engine.begin_move(5)
+    tt = engine.new_transposition_table()
+    for key in range(4):
+        tt[(key, 0, 1)] = {"depth": 1, "score": key, "flag": 0, "best_move": None}
+
+    for key in range(20):
+        engine.eval_cache[("eval_bits", key, 0)] = key
+
+    assert len(tt) == 4
+    assert engine.cache_size <= 10
+
+def test_cache_size_counts_the_entries_of_every_table():
+    engine = Engine(win_condition=4)
+    engine.begin_move(5)
+    fill_caches(engine)
+    assert engine.cache_size == 4
+
+    engine.new_transposition_table()
+    assert engine.cache_size == 3
+
+    engine.clear()
+    assert engine.cache_size == 0
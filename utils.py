@@ -3,7 +3,7 @@ import os
 from ctypes import windll, c_void_p
 from PyQt5.QtWidgets import QWidget, QMainWindow, QLabel, QApplication
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from enum import Enum
 
 # Install command for PyInstaller:
@@ -12,6 +12,12 @@ from enum import Enum
 # Constants
 DEFAULT_FONT = 'Arial'
 WIN_CONDITION = 4
+# Delay after the last resize before the background is rescaled in high quality
+BACKGROUND_RESCALE_DELAY_MS = 150
+BOARD_SIZE_OPTIONS = [5, 6, 7, 8, 9, 10]
+WIN_CONDITION_OPTIONS = [3, 4, 5, 6]
+# Thinking time budget of the Hard AI per move, in seconds
+AI_TIME_LIMIT = 3.0
 
 def resource_path(relative_path):
     """
@@ -58,9 +64,29 @@ class PieceType(Enum):
     BLACK = 1
     EMPTY = 2
 
+_background_pixmaps = {}
+
+def get_background_pixmap(path):
+    """
+    Returns the decoded background image of a path, loading it from disk only once.
+
+    Args:
+        path (str): The path to the image.
+
+    Returns:
+        QPixmap: The full-resolution image.
+    """
+    pixmap = _background_pixmaps.get(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        _background_pixmaps[path] = pixmap
+    return pixmap
+
 class BackgroundWindow(QMainWindow):
     """
     A QMainWindow subclass that displays a background image, which resizes with the window.
+    While the window is being resized the image is scaled with a fast transformation, and
+    it is rescaled smoothly once the resizing settles.
     """
 
     def __init__(self, background_path, parent=None):
@@ -74,6 +100,10 @@ class BackgroundWindow(QMainWindow):
         super().__init__(parent)
         self._background_path = background_path
         self._background_label = QLabel(self)
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(BACKGROUND_RESCALE_DELAY_MS)
+        self._rescale_timer.timeout.connect(self._set_background_image)
         self._set_background_image()
 
     def resizeEvent(self, event):
@@ -84,14 +114,18 @@ class BackgroundWindow(QMainWindow):
             event (QResizeEvent): The resize event.
         """
         super().resizeEvent(event)
-        self._set_background_image()
+        self._set_background_image(Qt.FastTransformation)
+        self._rescale_timer.start()
 
-    def _set_background_image(self):
+    def _set_background_image(self, transformation=Qt.SmoothTransformation):
         """
         Sets the background image for the window, scaling it to fit the window size.
+
+        Args:
+            transformation (Qt.TransformationMode): The quality of the scaling.
         """
-        pixmap = QPixmap(self._background_path)
-        self._background_label.setPixmap(pixmap.scaled(self.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+        pixmap = get_background_pixmap(self._background_path)
+        self._background_label.setPixmap(pixmap.scaled(self.size(), Qt.IgnoreAspectRatio, transformation))
         self._background_label.setFixedSize(self.size())
         self._background_label.lower()
 
@@ -24,6 +24,7 @@ class Board(QWidget):
         super().__init__(parent)
         self._board_size = len(board)
         self._cells = {}
+        self._grid_metrics = None
         self._init_ui(board)
 
     def set_cell_content(self, cell, piece_type):
@@ -87,16 +88,31 @@ class Board(QWidget):
     def handle_cell_press(self, row, col):
         self.cell_press_signal.emit(row, col)
 
+    def update_cells(self, cell_contents):
+        """
+        Applies new contents to a group of cells. Only the cells whose content changed are
+        touched, and each of them schedules its own repaint, which Qt merges into one paint.
+
+        Args:
+            cell_contents (iterable): Pairs of (cell, piece_type), where cell is a (row, col) tuple.
+        """
+        for cell, piece_type in cell_contents:
+            if self._cells[cell].cell_content is not piece_type:
+                self._cells[cell].cell_content = piece_type
+
     def reset_board(self, board):
         """
-        Resets the entire board to a new setup.
+        Resets the entire board to a new setup, updating only the cells that differ from
+        what is currently displayed.
 
         Args:
             board (list): A 2D list representing the new setup of the board.
         """
-        for row in range(self._board_size):
-            for col in range(self._board_size):
-                self._cells[(row, col)].cell_content = board[row][col]
+        self.update_cells(
+            ((row, col), board[row][col])
+            for row in range(self._board_size)
+            for col in range(self._board_size)
+        )
 
     def _init_ui(self, board):
         """
@@ -114,8 +130,8 @@ class Board(QWidget):
             """
             Initializes the board background, creating cells with alternating colors and labels.
             """
-            letters = ['A', 'B', 'C', 'D', 'E']
-            numbers = ['5', '4', '3', '2', '1']
+            letters = [chr(ord('A') + col) for col in range(self._board_size)]
+            numbers = [str(self._board_size - row) for row in range(self._board_size)]
 
             for row in range(self._board_size):
                 for col in range(self._board_size):
@@ -146,11 +162,52 @@ class Board(QWidget):
         Returns:
             Cell or None: The cell at the position or None if out of bounds.
         """
-        for (row, col), cell in self._cells.items():
-            if cell.geometry().contains(pos):
-                return cell
+        left, top, cell_pitch_x, cell_pitch_y = self._get_grid_metrics()
+        row = int((pos.y() - top) // cell_pitch_y)
+        col = int((pos.x() - left) // cell_pitch_x)
+        cell = self._cells.get((row, col))
+        if cell is None:
+            return None
+
+        # Cell sizes can differ by a pixel, so a point near an edge may belong to the neighbor
+        geometry = cell.geometry()
+        if geometry.contains(pos):
+            return cell
+        row += -1 if pos.y() < geometry.top() else 1 if pos.y() > geometry.bottom() else 0
+        col += -1 if pos.x() < geometry.left() else 1 if pos.x() > geometry.right() else 0
+        cell = self._cells.get((row, col))
+        if cell is not None and cell.geometry().contains(pos):
+            return cell
         return None
 
+    def resizeEvent(self, event):
+        """
+        Handles the resize event, invalidating the cached grid layout.
+
+        Args:
+            event (QResizeEvent): The resize event.
+        """
+        super().resizeEvent(event)
+        self._grid_metrics = None
+
+    def _get_grid_metrics(self):
+        """
+        Returns the layout of the grid, measuring it from the corner cells on first use
+        after a resize.
+
+        Returns:
+            tuple: (left, top, cell_pitch_x, cell_pitch_y), the position of the top-left cell
+            and the average distance between neighboring cells, spacing included.
+        """
+        if self._grid_metrics is None:
+            first = self._cells[(0, 0)].geometry()
+            last = self._cells[(self._board_size - 1, self._board_size - 1)].geometry()
+            steps = max(1, self._board_size - 1)
+            cell_pitch_x = (last.left() - first.left()) / steps or max(1, first.width())
+            cell_pitch_y = (last.top() - first.top()) / steps or max(1, first.height())
+            self._grid_metrics = (first.left(), first.top(), cell_pitch_x, cell_pitch_y)
+        return self._grid_metrics
+
     def get_cell_by_coordinates(self, row, col):
         """
         Retrieves a cell by its row and column.
@@ -1,7 +1,84 @@
 from PyQt5.QtWidgets import QLabel, QSizePolicy, QApplication
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap
-from utils import PieceType, BLACK_PIECE_PATH, WHITE_PIECE_PATH
+from PyQt5.QtCore import pyqtSignal, Qt, QObject
+from utils import PieceType
+from views.pixmap_cache import get_pixmap_cache
+
+_cell_metrics = None
+
+def get_cell_metrics():
+    """
+    Returns the DPI-derived metrics shared by all cells, creating them on first use.
+
+    Returns:
+        CellMetrics: The shared metrics.
+    """
+    global _cell_metrics
+    if _cell_metrics is None:
+        _cell_metrics = CellMetrics()
+    return _cell_metrics
+
+class CellMetrics(QObject):
+    """
+    Holds the sizes that cells derive from the screen's DPI. They are computed once and
+    recomputed only when the primary screen or its logical DPI changes.
+
+    Attributes:
+        label_size (int): The font size of the coordinate labels.
+        border_width (int): The border width of highlighted cells.
+    """
+
+    metrics_changed = pyqtSignal()
+
+    def __init__(self):
+        """
+        Initializes the CellMetrics from the current primary screen.
+        """
+        super().__init__()
+        self.label_size = 0
+        self.border_width = 0
+        self._screen = None
+        app = QApplication.instance() or QApplication([])
+        app.primaryScreenChanged.connect(self._set_screen)
+        self._set_screen(app.primaryScreen())
+
+    def _set_screen(self, screen):
+        """
+        Starts following the DPI of a new primary screen.
+
+        Args:
+            screen (QScreen): The new primary screen.
+        """
+        if self._screen is not None:
+            self._screen.logicalDotsPerInchChanged.disconnect(self._update_metrics)
+        self._screen = screen
+        self._screen.logicalDotsPerInchChanged.connect(self._update_metrics)
+        self._update_metrics()
+
+    def _update_metrics(self):
+        """
+        Recomputes the metrics from the screen's logical DPI and notifies the cells.
+        """
+        logical_dpi = self._screen.logicalDotsPerInch()
+        self.label_size = self._calculate_scaled_value(logical_dpi, divisor=80, exponent=0.15, multiplier=9.5)
+        self.border_width = self._calculate_scaled_value(logical_dpi, divisor=100, exponent=0.75, multiplier=6)
+        self.metrics_changed.emit()
+
+    @staticmethod
+    def _calculate_scaled_value(logical_dpi: float, divisor: float, exponent: float, multiplier: float) -> int:
+        """
+        Helper method to calculate a scaled value based on the screen's DPI.
+
+        Args:
+            logical_dpi (float): The logical DPI of the screen.
+            divisor (float): The value by which the DPI is divided.
+            exponent (float): The exponent to which the scaled DPI is raised.
+            multiplier (float): The multiplier applied after scaling.
+
+        Returns:
+            int: The calculated scaled value.
+        """
+        scaling_factor = ((logical_dpi / divisor) ** exponent) * multiplier
+        return int(scaling_factor)
 
 class Cell(QLabel):
     """
@@ -30,6 +107,8 @@ class Cell(QLabel):
         self._piece = PieceType.EMPTY  # No piece initially
         self._label_texts = label_texts or []  # Store label texts and alignments
         self._init_ui()
+        if self._labels:
+            get_cell_metrics().metrics_changed.connect(self._update_label_positions)
 
     def get_position(self):
         """
@@ -128,6 +207,8 @@ class Cell(QLabel):
         Args:
             piece_type (PieceType): The type of piece to place in the cell.
         """
+        if piece_type is self._piece:
+            return
         self._piece = piece_type
         self._update_cell_content()
 
@@ -197,18 +278,7 @@ class Cell(QLabel):
         """
         Returns the pixmap of the piece in the cell, scaled to the cell's current size.
         """
-        if self._piece == PieceType.WHITE:
-            pixmap = QPixmap(WHITE_PIECE_PATH)
-        elif self._piece == PieceType.BLACK:
-            pixmap = QPixmap(BLACK_PIECE_PATH)
-        else:
-            pixmap = None
-
-        if pixmap:
-            scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            return scaled_pixmap
-        else:
-            return None
+        return get_pixmap_cache().get_piece_pixmap(self._piece, self.size(), self.devicePixelRatioF())
 
     def _adjust_color(self, hex_color):
         """
@@ -238,38 +308,20 @@ class Cell(QLabel):
         else:
             raise ValueError("Provided color is not a valid hex string")
 
-    def _calculate_scaled_value(self, divisor: float, exponent: float, multiplier: float) -> int:
-        """
-        Helper method to calculate a scaled value based on the screen's DPI.
-
-        Args:
-            divisor (float): The value by which the DPI is divided.
-            exponent (float): The exponent to which the scaled DPI is raised.
-            multiplier (float): The multiplier applied after scaling.
-
-        Returns:
-            int: The calculated scaled value.
-        """
-        app = QApplication.instance() or QApplication([])
-        screen = app.primaryScreen()
-        logical_dpi = screen.logicalDotsPerInch()
-        scaling_factor = ((logical_dpi / divisor) ** exponent) * multiplier
-        return int(scaling_factor)
-
     def _get_label_size(self) -> int:
         """
-        Calculates a scaled font size based on the cell's height.
+        Returns the font size of the labels, scaled by the screen's DPI.
 
         Returns:
             int: The scaled font size.
         """
-        return self._calculate_scaled_value(divisor=80, exponent=0.15, multiplier=9.5)
+        return get_cell_metrics().label_size
 
     def _get_border_width(self) -> int:
         """
-        Calculates a scaled border width based on the screen's DPI.
+        Returns the border width of highlighted cells, scaled by the screen's DPI.
 
         Returns:
             int: The scaled border width in pixels.
         """
-        return self._calculate_scaled_value(divisor=100, exponent=0.75, multiplier=6)
+        return get_cell_metrics().border_width
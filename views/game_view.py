@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import QVBoxLayout, QWidget, QSizePolicy, QLabel, QApplicat
 from PyQt5.QtCore import pyqtSignal, QTimer, Qt, QEvent, QPoint, QSize
 from PyQt5.QtGui import QFont, QCursor, QPixmap, QIcon
 from views.board import Board
+from views.painted_board import PaintedBoard
 from views.score import Score
 from utils import BackgroundWindow, PieceType, resource_path, DEFAULT_FONT, get_window_dpi
 from logger import get_logger
@@ -9,6 +10,12 @@ from logger import get_logger
 GAME_BACKGROUND_IMAGE_PATH = resource_path('resources/images/game_background.png')
 BACK_ICON_IMAGE_PATH = resource_path('resources/images/back.png')
 
+# Board implementations, selected by the 'board_renderer' setting
+BOARD_RENDERERS = {
+    'widgets': Board,
+    'painter': PaintedBoard,
+}
+
 B_KEY_HEBREW_VALUE = 1504
 P_KEY_HEBREW_VALUE = 1508
 
@@ -27,7 +34,7 @@ class GameWindow(BackgroundWindow):
     player_release_signal = pyqtSignal(int, int)
     player_hold_cell_signal = pyqtSignal(int, int)
 
-    def __init__(self, players, game_number, board, parent=None):
+    def __init__(self, players, game_number, board, board_renderer='widgets', parent=None):
         """
         Initializes the GameWindow with the given players, game number, and board.
 
@@ -35,10 +42,12 @@ class GameWindow(BackgroundWindow):
             players (list): List of players participating in the game.
             game_number (int): The current game number.
             board (list): The initial board setup as a 2D list.
+            board_renderer (str): The board implementation to use, a key of BOARD_RENDERERS.
             parent (QWidget, optional): The parent widget, if any.
         """
         super().__init__(GAME_BACKGROUND_IMAGE_PATH, parent)
         self._logger = get_logger(self.__class__.__name__)
+        self._board_class = BOARD_RENDERERS[board_renderer]
         self._press_timer = QTimer(self)
         self._press_timer.setSingleShot(True)
         self._press_duration = 80  # Duration in milliseconds to consider as a hold
@@ -85,8 +94,7 @@ class GameWindow(BackgroundWindow):
             move (dict): A dictionary containing the move details with 'from' and 'to' coordinates.
         """
         piece_type = self.get_cell_piece_type(move["from"])
-        self._set_cell(move["from"], PieceType.EMPTY)
-        self._set_cell(move["to"], piece_type)
+        self._board.update_cells(((move["from"], PieceType.EMPTY), (move["to"], piece_type)))
 
     def keyPressEvent(self, event):
         """
@@ -95,7 +103,7 @@ class GameWindow(BackgroundWindow):
         Args:
             event (QKeyEvent): The key press event.
         """
-        self._logger.debug(f"Key pressed - {event.key()}")
+        self._logger.debug("Key pressed - %s", event.key())
 
         # Dictionary to map key codes to corresponding signals
         key_code_actions = {
@@ -345,7 +353,7 @@ class GameWindow(BackgroundWindow):
         Args:
             board (list): The initial board setup as a 2D list.
         """
-        self._board = Board(board)
+        self._board = self._board_class(board)
         self._board.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self._main_layout.addWidget(self._board, alignment=Qt.AlignCenter)
 
@@ -0,0 +1,331 @@
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import pyqtSignal, Qt, QPoint, QRect, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QPen
+from views.board import Board
+from views.cell import get_cell_metrics
+from views.pixmap_cache import get_pixmap_cache
+from utils import PieceType
+
+PRESSED_CELL_COLOR = "#d9f4fc"
+PRESSED_BORDER_COLOR = "blue"
+AVAILABLE_BORDER_COLOR = "#f79b07"
+DEFAULT_BORDER_COLOR = "black"
+
+# Colors of the cells in the route of the last move, by their default color
+ROUTE_CELL_COLORS = {
+    Board.color1: "#fcf16d",
+    Board.color2: "#34c732",
+}
+
+class BoardSquare:
+    """
+    A lightweight handle to a square of a PaintedBoard, standing in for the Cell widget
+    returned by the widget-based Board.
+    """
+
+    __slots__ = ('_row', '_col')
+
+    def __init__(self, row, col):
+        self._row = row
+        self._col = col
+
+    def get_position(self):
+        """
+        Returns the position of the square.
+
+        Returns:
+            tuple: (row, col)
+        """
+        return (self._row, self._col)
+
+class PaintedBoard(QWidget):
+    """
+    A board that draws its whole grid, highlights, pieces and labels in a single paintEvent,
+    instead of using a widget per cell. It exposes the same interface as Board, so the
+    game window can use either of them.
+    """
+
+    cell_press_signal = pyqtSignal(int, int)
+    color1 = Board.color1
+    color2 = Board.color2
+
+    def __init__(self, board, parent=None):
+        """
+        Initializes the PaintedBoard widget with the given board setup.
+
+        Args:
+            board (list): The initial setup of the board, a 2D list representing the pieces.
+            parent (QWidget, optional): The parent widget, if any.
+        """
+        super().__init__(parent)
+        self._board_size = len(board)
+        self._squares = {}
+        self._contents = {}
+        self._default_colors = {}
+        self._cell_colors = {}
+        self._cell_borders = {}
+        self._init_squares()
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        get_cell_metrics().metrics_changed.connect(self.update)
+        self.reset_board(board)
+
+    def set_cell_content(self, cell, piece_type):
+        """
+        Sets the content of a specific cell on the board.
+
+        Args:
+            cell (tuple): The coordinates of the cell (row, col).
+            piece_type (PieceType): The type of piece to place in the cell.
+        """
+        if self._contents[cell] is not piece_type:
+            self._contents[cell] = piece_type
+            self.update(self._get_cell_rect(*cell))
+
+    def get_cell_content(self, cell):
+        """
+        Retrieves the type of piece currently in a specific cell.
+
+        Args:
+            cell (tuple): The coordinates of the cell (row, col).
+
+        Returns:
+            PieceType: The type of piece in the cell.
+        """
+        return self._contents[cell]
+
+    def get_piece_pixmap(self, cell):
+        return get_pixmap_cache().get_piece_pixmap(
+            self._contents[cell], self._get_cell_rect(*cell).size(), self.devicePixelRatioF()
+        )
+
+    def reset_cells_view(self, cells_to_reset):
+        """
+        Resets the view of the specified cells to their default state.
+
+        Args:
+            cells_to_reset (list): A list of cells (as tuples) to reset.
+        """
+        for cell in cells_to_reset:
+            self._set_cell_style(cell, self._default_colors[cell], 1, DEFAULT_BORDER_COLOR)
+
+    def tag_cells_in_route(self, cells_in_route):
+        """
+        Marks the cells in a specified route.
+
+        Args:
+            cells_in_route (list): A list of cells (as tuples) that are part of the route.
+        """
+        for cell in cells_in_route:
+            self._set_cell_style(cell, ROUTE_CELL_COLORS[self._default_colors[cell]], 1, DEFAULT_BORDER_COLOR)
+
+    def tag_available_cells(self, pressed_cell, available_cells):
+        """
+        Marks the available cells for a move, and highlights the pressed cell.
+
+        Args:
+            pressed_cell (tuple): The coordinates of the pressed cell.
+            available_cells (list): A list of available cells (as tuples) for the move.
+        """
+        self._set_cell_style(pressed_cell, PRESSED_CELL_COLOR, 2, PRESSED_BORDER_COLOR)
+        border_width = get_cell_metrics().border_width
+        for cell in available_cells:
+            self._set_cell_style(cell, self._cell_colors[cell], border_width, AVAILABLE_BORDER_COLOR)
+
+    def update_cells(self, cell_contents):
+        """
+        Applies new contents to a group of cells, repainting only the cells that changed.
+
+        Args:
+            cell_contents (iterable): Pairs of (cell, piece_type), where cell is a (row, col) tuple.
+        """
+        for cell, piece_type in cell_contents:
+            self.set_cell_content(cell, piece_type)
+
+    def reset_board(self, board):
+        """
+        Resets the entire board to a new setup, repainting only the cells that differ from
+        what is currently displayed.
+
+        Args:
+            board (list): A 2D list representing the new setup of the board.
+        """
+        self.update_cells(
+            ((row, col), board[row][col])
+            for row in range(self._board_size)
+            for col in range(self._board_size)
+        )
+
+    def get_cell_at_position(self, pos: QPoint):
+        """
+        Returns the cell at the given position.
+
+        Args:
+            pos (QPoint): The position relative to the board.
+
+        Returns:
+            BoardSquare or None: The square at the position or None if out of bounds.
+        """
+        if self.width() <= 0 or self.height() <= 0:
+            return None
+        row = pos.y() * self._board_size // self.height()
+        col = pos.x() * self._board_size // self.width()
+        return self._squares.get((row, col))
+
+    def get_cell_by_coordinates(self, row, col):
+        """
+        Retrieves a cell by its row and column.
+
+        Args:
+            row (int): The row index.
+            col (int): The column index.
+
+        Returns:
+            BoardSquare or None: The square at the specified position or None if invalid.
+        """
+        return self._squares.get((row, col), None)
+
+    def handle_cell_press(self, row, col):
+        self.cell_press_signal.emit(row, col)
+
+    def mousePressEvent(self, event):
+        """
+        Emits cell_press_signal for a left click on a cell.
+
+        Args:
+            event (QMouseEvent): The mouse event.
+        """
+        square = self.get_cell_at_position(event.pos()) if event.button() == Qt.LeftButton else None
+        if square is None:
+            event.ignore()
+            return
+        self.handle_cell_press(*square.get_position())
+
+    def paintEvent(self, event):
+        """
+        Draws the cells intersecting the exposed region: background, border, piece and labels.
+
+        Args:
+            event (QPaintEvent): The paint event.
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        exposed = event.rect()
+        pixmap_cache = get_pixmap_cache()
+        device_pixel_ratio = self.devicePixelRatioF()
+        label_font = self.font()
+        label_font.setPointSize(get_cell_metrics().label_size)
+        painter.setFont(label_font)
+
+        for row in range(self._board_size):
+            for col in range(self._board_size):
+                rect = self._get_cell_rect(row, col)
+                if not rect.intersects(exposed):
+                    continue
+                cell = (row, col)
+
+                painter.fillRect(rect, QColor(self._cell_colors[cell]))
+                border_width, border_color = self._cell_borders[cell]
+                pen = QPen(QColor(border_color))
+                pen.setWidth(border_width)
+                pen.setJoinStyle(Qt.MiterJoin)
+                painter.setPen(pen)
+                half_width = border_width / 2.0
+                painter.drawRect(QRectF(rect).adjusted(half_width, half_width, -half_width, -half_width))
+
+                pixmap = pixmap_cache.get_piece_pixmap(self._contents[cell], rect.size(), device_pixel_ratio)
+                if pixmap:
+                    width = pixmap.width() / pixmap.devicePixelRatio()
+                    height = pixmap.height() / pixmap.devicePixelRatio()
+                    painter.drawPixmap(
+                        QRectF(rect.x() + (rect.width() - width) / 2, rect.y() + (rect.height() - height) / 2, width, height),
+                        pixmap,
+                        QRectF(pixmap.rect()),
+                    )
+
+                self._draw_labels(painter, rect, row, col)
+
+        painter.end()
+
+    def resizeEvent(self, event):
+        """
+        Handles the resize event, repainting the board at its new size.
+
+        Args:
+            event (QResizeEvent): The resize event.
+        """
+        super().resizeEvent(event)
+        self.update()
+
+    def sizeHint(self):
+        return QSize(400, 400)
+
+    def _init_squares(self):
+        """
+        Initializes the per-cell state with alternating colors.
+        """
+        for row in range(self._board_size):
+            for col in range(self._board_size):
+                cell = (row, col)
+                color = self.color1 if (row + col) % 2 == 0 else self.color2
+                self._squares[cell] = BoardSquare(row, col)
+                self._contents[cell] = PieceType.EMPTY
+                self._default_colors[cell] = color
+                self._cell_colors[cell] = color
+                self._cell_borders[cell] = (1, DEFAULT_BORDER_COLOR)
+
+    def _set_cell_style(self, cell, color, border_width, border_color):
+        """
+        Changes the background and border of a cell and schedules its repaint.
+
+        Args:
+            cell (tuple): The coordinates of the cell (row, col).
+            color (str): The background color.
+            border_width (int): The border width in pixels.
+            border_color (str): The border color.
+        """
+        self._cell_colors[cell] = color
+        self._cell_borders[cell] = (border_width, border_color)
+        self.update(self._get_cell_rect(*cell))
+
+    def _get_cell_rect(self, row, col):
+        """
+        Returns the rectangle of a cell, splitting the widget evenly between the cells. Edges
+        are rounded up so that they agree with the arithmetic in get_cell_at_position.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            QRect: The cell's rectangle in widget coordinates.
+        """
+        size = self._board_size
+        left = -(-col * self.width() // size)
+        top = -(-row * self.height() // size)
+        right = -(-(col + 1) * self.width() // size)
+        bottom = -(-(row + 1) * self.height() // size)
+        return QRect(left, top, right - left, bottom - top)
+
+    def _draw_labels(self, painter, rect, row, col):
+        """
+        Draws the coordinate labels of a cell: letters along the bottom row and numbers
+        along the leftmost column.
+
+        Args:
+            painter (QPainter): The active painter.
+            rect (QRect): The cell's rectangle.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        is_bottom_row = row == self._board_size - 1
+        if not is_bottom_row and col != 0:
+            return
+
+        margin = max(2, int(rect.width() * 0.05))
+        text_rect = rect.adjusted(margin, margin, -margin, -margin)
+        painter.setPen(QColor("black"))
+        if is_bottom_row:
+            painter.drawText(text_rect, Qt.AlignBottom | Qt.AlignRight, chr(ord('A') + col))
+        if col == 0:
+            painter.drawText(text_rect, Qt.AlignTop | Qt.AlignLeft, str(self._board_size - row))
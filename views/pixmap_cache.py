@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QPixmap
+from utils import PieceType, WHITE_PIECE_PATH, BLACK_PIECE_PATH
+
+# Maximum number of scaled pixmaps kept in memory
+MAX_SCALED_PIXMAPS = 64
+
+PIECE_IMAGE_PATHS = {
+    PieceType.WHITE: WHITE_PIECE_PATH,
+    PieceType.BLACK: BLACK_PIECE_PATH,
+}
+
+_pixmap_cache = None
+
+def get_pixmap_cache():
+    """
+    Returns the process-wide pixmap cache, creating it on first use.
+
+    Returns:
+        PixmapCache: The shared cache.
+    """
+    global _pixmap_cache
+    if _pixmap_cache is None:
+        _pixmap_cache = PixmapCache()
+    return _pixmap_cache
+
+class PixmapCache:
+    """
+    Decodes every source image once and keeps its scaled variants, keyed by
+    (path, width, height, device pixel ratio), with least-recently-used eviction.
+    """
+
+    def __init__(self, max_entries=MAX_SCALED_PIXMAPS):
+        """
+        Initializes an empty PixmapCache.
+
+        Args:
+            max_entries (int): The maximum number of scaled pixmaps to keep.
+        """
+        self._max_entries = max_entries
+        self._sources = {}
+        self._scaled = OrderedDict()
+
+    def get_source(self, path):
+        """
+        Returns the full-resolution pixmap of an image, decoding it on first use.
+
+        Args:
+            path (str): The path to the image.
+
+        Returns:
+            QPixmap: The decoded image.
+        """
+        pixmap = self._sources.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            self._sources[path] = pixmap
+        return pixmap
+
+    def get_scaled(self, path, size, device_pixel_ratio=1.0):
+        """
+        Returns an image scaled to fit a size, keeping its aspect ratio. The pixmap is
+        rendered at the device resolution so it stays sharp on high-DPI screens.
+
+        Args:
+            path (str): The path to the image.
+            size (QSize): The logical size to fit the image into.
+            device_pixel_ratio (float): The device pixel ratio of the target widget.
+
+        Returns:
+            QPixmap or None: The scaled image, or None if the image or the size is empty.
+        """
+        width, height = size.width(), size.height()
+        if width <= 0 or height <= 0:
+            return None
+
+        key = (path, width, height, device_pixel_ratio)
+        pixmap = self._scaled.get(key)
+        if pixmap is not None:
+            self._scaled.move_to_end(key)
+            return pixmap
+
+        source = self.get_source(path)
+        if source.isNull():
+            return None
+
+        device_size = QSize(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+        pixmap = source.scaled(device_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        self._scaled[key] = pixmap
+        if len(self._scaled) > self._max_entries:
+            self._scaled.popitem(last=False)
+        return pixmap
+
+    def get_piece_pixmap(self, piece_type, size, device_pixel_ratio=1.0):
+        """
+        Returns the image of a piece scaled to fit a size.
+
+        Args:
+            piece_type (PieceType): The type of the piece.
+            size (QSize): The logical size to fit the image into.
+            device_pixel_ratio (float): The device pixel ratio of the target widget.
+
+        Returns:
+            QPixmap or None: The scaled image, or None for an empty cell.
+        """
+        path = PIECE_IMAGE_PATHS.get(piece_type)
+        if path is None:
+            return None
+        return self.get_scaled(path, size, device_pixel_ratio)
+
+    def clear(self):
+        """
+        Drops every cached pixmap.
+        """
+        self._sources.clear()
+        self._scaled.clear()
@@ -1,7 +1,8 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy
-from PyQt5.QtGui import QPixmap, QPalette, QFont
+from PyQt5.QtGui import QPalette, QFont
 from PyQt5.QtCore import Qt
 from utils import create_spacer_widget, PlayerType, DEFAULT_FONT
+from views.pixmap_cache import get_pixmap_cache
 
 class ScoreModule(QWidget):
     """
@@ -23,7 +24,6 @@ class ScoreModule(QWidget):
         self._score = player.score
         self._move_num = player.move_number
         self._pic_path = player.piece_path
-        self._pixmap = QPixmap(self._pic_path)
         self._init_ui()
 
     def update_score(self, player):
@@ -124,11 +124,10 @@ class ScoreModule(QWidget):
         """
         Updates the piece icon's pixmap to fit within the label.
         """
-        if not self._pixmap.isNull():
-            new_size = self.piece_label.size() * 0.4
-            if new_size.width() > 0 and new_size.height() > 0:
-                scaled_pixmap = self._pixmap.scaled(new_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.piece_label.setPixmap(scaled_pixmap)
+        new_size = self.piece_label.size() * 0.4
+        scaled_pixmap = get_pixmap_cache().get_scaled(self._pic_path, new_size, self.devicePixelRatioF())
+        if scaled_pixmap:
+            self.piece_label.setPixmap(scaled_pixmap)
 
 
 class GameNumberModule(QWidget):
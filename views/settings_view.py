@@ -3,7 +3,7 @@ import os
 from PyQt5.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget, QSizePolicy, QHBoxLayout, QApplication, QSpacerItem, QLineEdit
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont
-from utils import BackgroundWindow, resource_path, DEFAULT_FONT, get_window_dpi
+from utils import BackgroundWindow, resource_path, DEFAULT_FONT, get_window_dpi, BOARD_SIZE_OPTIONS, WIN_CONDITION_OPTIONS, WIN_CONDITION
 from logger import get_logger
 
 # Constants
@@ -16,19 +16,23 @@ PLAYER_NAMES_INDEX = 5
 DIFFICULTY1_INDEX = 7
 DIFFICULTY2_INDEX = 9
 STARTING_PLAYER_INDEX = 10
-PLAY_BUTTON_INDEX = 11
+BOARD_SIZE_INDEX = 11
+WIN_CONDITION_INDEX = 12
+PLAY_BUTTON_INDEX = 13
 
 # Text Labels
 starting_layer_text = "Do you want to start? "
 default_difficulty_text = "Difficulty:"
 difficulty_text_first_player = "Difficulty of The First Player:"
 difficulty_text_second_player = "Difficulty of The Second Player:"
+board_size_text = "Board Size:"
+win_condition_text = "Pieces in a Row to Win:"
 
 # Ratio Constants for layout
 TOP_SPACER_HEIGHT_RATIO = 0.3
 TITLE_SPACER_HEIGHT_RATIO = 0.05
 LINE_SPACER_HEIGHT_RATIO = 0.01
-END_SPACER_HEIGHT_RATIO = 0.28
+END_SPACER_HEIGHT_RATIO = 0.2
 BUTTON_WIDTH_RATIO = 0.0405
 BUTTON_HEIGHT_RATIO = 0.027
 TEXTBOX_WIDTH_RATIO = 0.085
@@ -113,6 +117,8 @@ class SettingsWindow(BackgroundWindow):
     difficulty_changed = pyqtSignal(str, int)
     name_changed = pyqtSignal(str, int)
     starting_player_changed = pyqtSignal(str)
+    board_size_changed = pyqtSignal(str)
+    win_condition_changed = pyqtSignal(str)
     play_clicked = pyqtSignal()
 
     def __init__(self):
@@ -141,6 +147,9 @@ class SettingsWindow(BackgroundWindow):
         self._line_spacer3 = self._add_spacer()
         self._create_buttom_list(difficulty_text_second_player, ["Easy", "Medium", "Hard"], self._change_difficulty2)
         self._create_buttom_list(starting_layer_text, ["Yes", "No"], self._change_starting_player)
+        self._create_buttom_list(board_size_text, [str(size) for size in BOARD_SIZE_OPTIONS], self._change_board_size)
+        self._create_buttom_list(win_condition_text, [str(length) for length in WIN_CONDITION_OPTIONS], self._change_win_condition,
+                                 WIN_CONDITION_OPTIONS.index(WIN_CONDITION))
         self._create_play_button()
         self._end_spacer = self._add_spacer()
         self._adjust_section_visibility("1")
@@ -294,6 +303,8 @@ class SettingsWindow(BackgroundWindow):
         self._adjust_label_and_buttons(DIFFICULTY1_INDEX)
         self._adjust_label_and_buttons(DIFFICULTY2_INDEX)
         self._adjust_label_and_buttons(STARTING_PLAYER_INDEX)
+        self._adjust_label_and_buttons(BOARD_SIZE_INDEX)
+        self._adjust_label_and_buttons(WIN_CONDITION_INDEX)
         self._adjust_play_button()
 
     def _adjust_play_button(self):
@@ -448,6 +459,22 @@ class SettingsWindow(BackgroundWindow):
         update_buttons(sender)
         self.starting_player_changed.emit(sender.text())
 
+    def _change_board_size(self):
+        """
+        Changes the size of the board based on the button clicked.
+        """
+        sender = self.sender()
+        update_buttons(sender)
+        self.board_size_changed.emit(sender.text())
+
+    def _change_win_condition(self):
+        """
+        Changes the number of pieces in a row needed to win based on the button clicked.
+        """
+        sender = self.sender()
+        update_buttons(sender)
+        self.win_condition_changed.emit(sender.text())
+
     def _update_label_size(self, label_item, is_title=False):
         """
         Updates the size and font of a label based on the window size.
@@ -470,7 +497,7 @@ class SettingsWindow(BackgroundWindow):
         Args:
             event (QKeyEvent): The key press event.
         """
-        self._logger.debug(f"Key pressed - {event.key()}")
+        self._logger.debug("Key pressed - %s", event.key())
         if event.key() == Qt.Key_Escape:
             self.exit_full_screen_signal.emit()
         if event.key() == Qt.Key_E or event.key() == E_KEY_HEBREW_VALUE:
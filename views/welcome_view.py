@@ -28,7 +28,7 @@ class WelcomeWindow(BackgroundWindow):
         Args:
             event (QKeyEvent): The key press event.
         """
-        self._logger.debug(f"Key pressed - {event.key()}")
+        self._logger.debug("Key pressed - %s", event.key())
         if event.key() == Qt.Key_Escape:
             self.exit_full_screen_signal.emit()
         else: